@@ -1,7 +1,11 @@
 #!/usr/bin/env python3
-import os
-import re
-from pathlib import Path
+import argparse
+
+from edit_plan import EditPlan
+from lp_executor import add_jobs_argument, print_task_output, run_tasks
+from lp_io import add_dry_run_argument, dry_run_verb, set_dry_run, write_text
+from lp_journal import journaled
+from lp_scanner import LP_DIR, has_existing_credit, is_react_file, iter_html_files
 
 # Credit footer template
 CREDIT_FOOTER_HTML = '''    <!-- Credit Footer -->
@@ -66,97 +70,89 @@ CREDIT_FOOTER_REACT = '''                    {/* Credit Footer */}
                         </div>
                     </div>'''
 
-def is_react_file(content):
-    """Check if file uses React"""
-    return 'ReactDOM.createRoot' in content or 'ReactDOM.render' in content or 'type="text/babel"' in content
+# Closes the component and renders it when a React page has no footer
+REACT_APP_CLOSE = '''
+                </div>
+            );
+        };
+
+        const root = ReactDOM.createRoot(document.getElementById('root'));
+        root.render(<App />);
+    </script>
+'''
 
-def has_existing_credit(content):
-    """Check if credit already exists"""
-    return 'Irvando Demas Arifiandani' in content or 'irvandoda.my.id' in content
+def plan_credit(content):
+    """Plan insertion of the credit footer, empty plan if it already exists"""
+    plan = EditPlan()
+    if has_existing_credit(content):
+        return plan
+
+    footer = content.find('</footer>')
+    if is_react_file(content):
+        # For React files, add credit before closing footer tag
+        if footer != -1:
+            plan.insert(footer, CREDIT_FOOTER_REACT + '\n                    ')
+        else:
+            # If no footer, add before closing body
+            body = content.find('</body>')
+            if body != -1:
+                plan.insert(body, CREDIT_FOOTER_REACT + REACT_APP_CLOSE)
+    else:
+        # For regular HTML files, add credit before existing footer or </body>
+        if footer == -1:
+            footer = content.find('</body>')
+        if footer != -1:
+            plan.insert(footer, CREDIT_FOOTER_HTML + '\n    ')
+    return plan
 
-def add_credit_to_html_file(file_path):
+def add_credit_to_html_file(file_path, content=None):
     """Add credit footer to HTML file"""
     try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            content = f.read()
+        if content is None:
+            with open(file_path, 'r', encoding='utf-8') as f:
+                content = f.read()
         
         # Skip if credit already exists
         if has_existing_credit(content):
             print(f"⏭️  Skipping {file_path.name} - Credit already exists")
             return False
         
-        is_react = is_react_file(content)
-        
-        if is_react:
-            # For React files, add credit before closing footer tag
-            # Look for footer closing tag
-            footer_pattern = r'(</footer>)'
-            if re.search(footer_pattern, content):
-                # Add credit before closing footer
-                content = re.sub(
-                    r'(</footer>)',
-                    CREDIT_FOOTER_REACT + r'\n                    \1',
-                    content,
-                    count=1
-                )
-            else:
-                # If no footer, add before closing body
-                content = re.sub(
-                    r'(</body>)',
-                    CREDIT_FOOTER_REACT + r'\n                </div>\n            );\n        };\n\n        const root = ReactDOM.createRoot(document.getElementById(\'root\'));\n        root.render(<App />);\n    </script>\n\1',
-                    content,
-                    count=1
-                )
-        else:
-            # For regular HTML files, add credit before </body> or before existing footer
-            # Try to find footer closing tag first
-            footer_pattern = r'(</footer>)'
-            if re.search(footer_pattern, content):
-                # Add credit before closing footer
-                content = re.sub(
-                    r'(</footer>)',
-                    CREDIT_FOOTER_HTML + r'\n    \1',
-                    content,
-                    count=1
-                )
-            else:
-                # Add before </body>
-                content = re.sub(
-                    r'(</body>)',
-                    CREDIT_FOOTER_HTML + r'\n    \1',
-                    content,
-                    count=1
-                )
-        
-        with open(file_path, 'w', encoding='utf-8') as f:
-            f.write(content)
+        content = plan_credit(content).apply(content)
+
+        write_text(file_path, content)
         
-        print(f"✅ Added credit to {file_path.name}")
+        print(f"✅ {dry_run_verb('Added', 'Would add')} credit to {file_path.name}")
         return True
     except Exception as e:
         print(f"❌ Error processing {file_path.name}: {str(e)}")
         return False
 
-def main():
+@journaled('add_credits')
+def main(argv=None):
     """Main function"""
-    lp_dir = Path('/www/wwwroot/portfolio.irvandoda.my.id/LP')
+    parser = add_dry_run_argument(add_jobs_argument(argparse.ArgumentParser(description='Add credit footer to landing pages')))
+    args = parser.parse_args(argv)
+    set_dry_run(args.dry_run)
+    
+    lp_dir = LP_DIR
     
     if not lp_dir.exists():
         print(f"❌ Directory not found: {lp_dir}")
         return
     
-    html_files = list(lp_dir.glob('*.html'))
+    html_files = iter_html_files(lp_dir)
     total = len(html_files)
     success = 0
     
     print(f"📁 Found {total} HTML files")
     print("🚀 Starting to add credit footers...\n")
     
-    for html_file in html_files:
-        if add_credit_to_html_file(html_file):
+    for task in run_tasks(add_credit_to_html_file, html_files, args.jobs):
+        print_task_output(task)
+        if task.value:
             success += 1
     
-    print(f"\n✨ Done! Successfully added credits to {success}/{total} files")
+    print(f"\n✨ Done! {dry_run_verb('Successfully added', 'Would add')} credits to {success}/{total} files")
 
 if __name__ == '__main__':
     main()
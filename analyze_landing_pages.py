@@ -1,100 +1,77 @@
 #!/usr/bin/env python3
-import re
-from pathlib import Path
+import argparse
 from collections import defaultdict
+from functools import partial
+from pathlib import Path
+
+from lp_cache import ScanCache
+from lp_profile import DETECTOR_BUDGET_MS, FILE_BUDGET_MS, DetectorProfile
+from lp_scanner import LP_DIR, iter_html_files, scan_file
+
+PROFILE_DIR = LP_DIR.parent / '.lp_profile'
+
+SECTION_NAMES = {
+    'header': 'Header/Navigation',
+    'hero': 'Hero Section',
+    'hero_headline': 'Hero Headline',
+    'hero_cta': 'Hero CTA',
+    'benefit': 'Benefit Section',
+    'preview': 'Preview Section',
+    'testimonials': 'Testimonials',
+    'pricing': 'Pricing Section',
+    'footer': 'Footer',
+    'credit': 'Credit Footer'
+}
 
 def analyze_html_file(file_path):
     """Analyze HTML file for required sections"""
-    try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            content = f.read()
-        
-        # Check for required sections
-        sections = {
-            'header': bool(re.search(r'<nav|<header', content, re.IGNORECASE)),
-            'hero': bool(re.search(r'hero|id=["\']home|id=["\']beranda', content, re.IGNORECASE)),
-            'hero_headline': bool(re.search(r'<h1|<h2.*hero|hero.*<h1|hero.*<h2', content, re.IGNORECASE)),
-            'hero_cta': bool(re.search(r'button.*cta|cta.*button|href=["\']#pricing|Beli|Pesan|Daftar|Order', content, re.IGNORECASE)),
-            'benefit': bool(re.search(r'benefit|keuntungan|fitur|feature|kelebihan', content, re.IGNORECASE)),
-            'preview': bool(re.search(r'preview|gallery|galeri|tampilan|lihat', content, re.IGNORECASE)),
-            'testimonials': bool(re.search(r'testimonial|review|ulasan|kata.*mereka|kata.*klien', content, re.IGNORECASE)),
-            'pricing': bool(re.search(r'pricing|harga|paket|price|tarif', content, re.IGNORECASE)),
-            'footer': bool(re.search(r'<footer', content, re.IGNORECASE)),
-            'credit': bool(re.search(r'Irvando Demas Arifiandani|irvandoda\.my\.id', content, re.IGNORECASE))
-        }
-        
-        # Count missing sections
-        missing = [key for key, value in sections.items() if not value]
-        
-        return {
-            'file': file_path.name,
-            'sections': sections,
-            'missing': missing,
-            'complete': len(missing) == 0
-        }
-    except Exception as e:
+    return analysis_from_scan(scan_file(file_path))
+
+def analysis_from_scan(result):
+    """Convert a scanner record into the section analysis summary"""
+    if result.error is not None:
         return {
-            'file': file_path.name,
-            'error': str(e),
+            'file': result.file,
+            'error': result.error,
             'complete': False
         }
+    return {
+        'file': result.file,
+        'sections': result.sections,
+        'missing': result.missing,
+        'complete': result.complete
+    }
 
-def main():
-    """Main function"""
-    lp_dir = Path('/www/wwwroot/portfolio.irvandoda.my.id/LP')
-    
-    if not lp_dir.exists():
-        print(f"❌ Directory not found: {lp_dir}")
+def tally(result, section_stats, missing_stats, delta=1):
+    """Add one analysis result to the counters (delta=-1 takes it out again)"""
+    if 'error' in result:
         return
-    
-    html_files = list(lp_dir.glob('*.html'))
-    total = len(html_files)
-    
-    print(f"📁 Analyzing {total} HTML files...\n")
-    
-    results = []
-    section_stats = defaultdict(int)
-    missing_stats = defaultdict(int)
-    
-    for html_file in html_files:
-        result = analyze_html_file(html_file)
-        results.append(result)
-        
-        if 'error' not in result:
-            for section, exists in result['sections'].items():
-                if exists:
-                    section_stats[section] += 1
-            
-            for missing in result['missing']:
-                missing_stats[missing] += 1
-    
-    # Print summary
+    for section, exists in result['sections'].items():
+        if exists:
+            section_stats[section] += delta
+            if not section_stats[section]:
+                del section_stats[section]
+    for missing in result['missing']:
+        missing_stats[missing] += delta
+        if not missing_stats[missing]:
+            del missing_stats[missing]
+
+def print_summary(results, section_stats, missing_stats, total):
+    """Print section statistics and incomplete files for analysis results"""
     print("=" * 80)
     print("SECTION STATISTICS")
     print("=" * 80)
-    section_names = {
-        'header': 'Header/Navigation',
-        'hero': 'Hero Section',
-        'hero_headline': 'Hero Headline',
-        'hero_cta': 'Hero CTA',
-        'benefit': 'Benefit Section',
-        'preview': 'Preview Section',
-        'testimonials': 'Testimonials',
-        'pricing': 'Pricing Section',
-        'footer': 'Footer',
-        'credit': 'Credit Footer'
-    }
     
     for section, count in sorted(section_stats.items()):
         percentage = (count / total) * 100
         status = "✅" if percentage >= 90 else "⚠️" if percentage >= 50 else "❌"
-        print(f"{status} {section_names.get(section, section):<25} {count:>3}/{total} ({percentage:>5.1f}%)")
+        print(f"{status} {SECTION_NAMES.get(section, section):<25} {count:>3}/{total} ({percentage:>5.1f}%)")
     
     print("\n" + "=" * 80)
     print("MISSING SECTIONS STATISTICS")
     print("=" * 80)
     for section, count in sorted(missing_stats.items(), key=lambda x: x[1], reverse=True):
-        print(f"❌ {section_names.get(section, section):<25} Missing in {count:>3} files")
+        print(f"❌ {SECTION_NAMES.get(section, section):<25} Missing in {count:>3} files")
     
     # Files with missing sections
     incomplete_files = [r for r in results if not r.get('complete', False) and 'error' not in r]
@@ -122,6 +99,55 @@ def main():
     complete_files = [r for r in results if r.get('complete', False)]
     print(f"\n✅ Complete files: {len(complete_files)}/{total}")
 
+def main(argv=None):
+    """Main function"""
+    parser = argparse.ArgumentParser(description='Analyze landing pages for required sections')
+    parser.add_argument('--no-cache', action='store_true', help='re-analyze every file, ignoring the scan cache')
+    parser.add_argument('--profile', action='store_true', help='time every detector per file (implies --no-cache)')
+    parser.add_argument('--profile-dir', default=str(PROFILE_DIR), help=f'where --profile writes its JSON/CSV export (default: {PROFILE_DIR})')
+    parser.add_argument('--detector-budget', type=float, default=DETECTOR_BUDGET_MS, metavar='MS', help=f'flag files where one detector takes longer (default: {DETECTOR_BUDGET_MS:g})')
+    parser.add_argument('--file-budget', type=float, default=FILE_BUDGET_MS, metavar='MS', help=f'flag files whose scan takes longer (default: {FILE_BUDGET_MS:g})')
+    args = parser.parse_args(argv)
+    
+    lp_dir = LP_DIR
+    
+    if not lp_dir.exists():
+        print(f"❌ Directory not found: {lp_dir}")
+        return
+    
+    html_files = iter_html_files(lp_dir)
+    total = len(html_files)
+    
+    print(f"📁 Analyzing {total} HTML files...\n")
+    
+    profile = DetectorProfile(args.detector_budget, args.file_budget) if args.profile else None
+    cache = None if args.no_cache or profile is not None else ScanCache()
+    scan = partial(scan_file, profile=profile) if cache is None else cache.scan
+    
+    results = []
+    section_stats = defaultdict(int)
+    missing_stats = defaultdict(int)
+    
+    for html_file in html_files:
+        result = analysis_from_scan(scan(html_file))
+        results.append(result)
+        tally(result, section_stats, missing_stats)
+    
+    if cache is not None:
+        cache.prune()
+        cache.save()
+    
+    print_summary(results, section_stats, missing_stats, total)
+    
+    if profile is not None:
+        print()
+        profile.print_summary()
+        profile_dir = Path(args.profile_dir)
+        profile_dir.mkdir(parents=True, exist_ok=True)
+        profile.to_json(profile_dir / 'analyze_landing_pages.json')
+        profile.to_csv(profile_dir / 'analyze_landing_pages.csv')
+        print(f"\n📋 Profile: {profile_dir / 'analyze_landing_pages.json'} (+ .csv)")
+
 if __name__ == '__main__':
     main()
 
@@ -0,0 +1,166 @@
+#!/usr/bin/env python3
+"""
+Build stage: replace the Tailwind Play CDN with purged static CSS.
+Harvests the utility classes each page uses from class=/className=
+attributes and script string literals, runs the local tailwindcss package
+over exactly those classes and links the hashed result. Pages without an
+inline tailwind.config share one stylesheet; pages with one get their own.
+"""
+import argparse
+import re
+from pathlib import Path
+
+from edit_plan import EditPlan
+from lp_build import add_dir_argument, run_node_script, write_asset, write_report
+from lp_executor import add_jobs_argument, print_task_output, run_tasks
+from lp_io import write_text
+from lp_scanner import LP_DIR, iter_html_files
+from tag_tree import iter_tokens
+
+TAILWIND_SCRIPT = LP_DIR.parent / 'tailwind_build.cjs'
+
+TAILWIND_CDN_RE = re.compile(
+    r'[ \t]*<script\b[^>]*\ssrc=["\']https://cdn\.tailwindcss\.com[^"\']*["\'][^>]*>\s*</script>[ \t]*\n?',
+    re.IGNORECASE
+)
+INLINE_CONFIG_RE = re.compile(
+    r'[ \t]*<script>\s*tailwind\.config\s*=\s*(\{.*?\})\s*;?\s*</script>[ \t]*\n?',
+    re.DOTALL
+)
+_SCRIPT_RE = re.compile(r'<script\b[^>]*>(.*?)</script>', re.DOTALL | re.IGNORECASE)
+_STRING_RE = re.compile(r'"((?:[^"\\\n]|\\.)*)"|\'((?:[^\'\\\n]|\\.)*)\'|`((?:[^`\\]|\\.)*)`')
+_TEMPLATE_EXPR_RE = re.compile(r'\$\{[^}]*\}')
+_CLASS_TOKEN_RE = re.compile(r'^[^\s"<{}`;]+$')
+
+
+def _class_tokens(text):
+    """Candidate class names in a string, including `${cond ? 'a' : 'b'}` parts"""
+    tokens = {token for token in _TEMPLATE_EXPR_RE.sub(' ', text).split()
+              if len(token) < 200 and _CLASS_TOKEN_RE.match(token) and not token.startswith(('http:', 'https:'))}
+    for expression in _TEMPLATE_EXPR_RE.findall(text):
+        for literal in _string_literals(expression):
+            tokens |= _class_tokens(literal)
+    return tokens
+
+def _string_literals(code):
+    for m in _STRING_RE.finditer(code):
+        yield next(group for group in m.groups() if group is not None)
+
+def _attribute_classes(content, start, end):
+    """Classes from class=/className= attributes in content[start:end]"""
+    classes = set()
+    for token in iter_tokens(content, start, end):
+        if token.kind != 'open':
+            continue
+        for name in ('class', 'className'):
+            value = token.attrs.get(name)
+            if not isinstance(value, str):
+                continue
+            if value.startswith('{'):
+                for literal in _string_literals(value):
+                    classes |= _class_tokens(literal)
+            else:
+                classes |= _class_tokens(value)
+    return classes
+
+def harvest_classes(content):
+    """Every class name the page can put on an element
+
+    Reads class= and className= attributes (including string parts of
+    className={...} expressions) and string literals in scripts, so classes
+    picked at runtime like `scrolled ? 'bg-white' : ''` are kept too.
+    """
+    classes = _attribute_classes(content, 0, len(content))
+    for script in _SCRIPT_RE.finditer(content):
+        # JSX markup inside text/babel scripts, then plain string literals
+        classes |= _attribute_classes(content, script.start(1), script.end(1))
+        for literal in _string_literals(script.group(1)):
+            classes |= _class_tokens(literal)
+    return classes
+
+def harvest_file(file_path):
+    """Classes and inline config of one page, None if it doesn't use the CDN"""
+    with open(file_path, 'r', encoding='utf-8') as f:
+        content = f.read()
+    if not TAILWIND_CDN_RE.search(content):
+        return None
+    config = INLINE_CONFIG_RE.search(content)
+    return {
+        'classes': sorted(harvest_classes(content)),
+        'config': config.group(1) if config else None,
+    }
+
+def run_tailwind(jobs):
+    """Generate CSS for [{id, classes, config}] with the local tailwindcss"""
+    return run_node_script(TAILWIND_SCRIPT, jobs)
+
+def link_stylesheet(content, href):
+    """Swap the CDN script (and inline config) for a stylesheet link"""
+    plan = EditPlan()
+    cdn = TAILWIND_CDN_RE.search(content)
+    indent = re.match(r'[ \t]*', cdn.group(0)).group(0)
+    plan.replace(cdn.start(), cdn.end() - cdn.start(), f'{indent}<link rel="stylesheet" href="{href}">\n')
+    config = INLINE_CONFIG_RE.search(content)
+    if config:
+        plan.delete(config.start(), config.end() - config.start())
+    return plan.apply(content)
+
+def main(argv=None):
+    """Main function"""
+    parser = add_jobs_argument(add_dir_argument(argparse.ArgumentParser(description='Replace the Tailwind CDN with purged static CSS')))
+    parser.add_argument('--per-page', action='store_true', help='one stylesheet per page instead of a shared one')
+    args = parser.parse_args(argv)
+
+    pages_dir = Path(args.dir)
+    if not pages_dir.exists():
+        print(f"❌ Directory not found: {pages_dir} (run lp_build.py first)")
+        return
+
+    pages = {}
+    for task in run_tasks(harvest_file, iter_html_files(pages_dir), args.jobs):
+        print_task_output(task)
+        if task.value:
+            pages[task.path] = task.value
+
+    # Pages with their own config can't share the library stylesheet
+    jobs = []
+    shared = {path for path, page in pages.items() if page['config'] is None and not args.per_page}
+    if shared:
+        union = sorted({name for path in shared for name in pages[path]['classes']})
+        jobs.append({'id': 'shared', 'classes': union, 'config': None})
+    for path, page in pages.items():
+        if path not in shared:
+            jobs.append({'id': path.name, 'classes': page['classes'], 'config': page['config']})
+
+    print(f"🎨 Generating CSS for {len(pages)} pages ({len(jobs)} stylesheets)...")
+    try:
+        css = run_tailwind(jobs) if jobs else {}
+    except (RuntimeError, OSError) as e:
+        print(f"❌ Tailwind build failed, pages keep the CDN: {e}")
+        return
+
+    hrefs = {job_id: write_asset(pages_dir, 'tailwind.css', text.encode('utf-8')) for job_id, text in css.items()}
+    report = []
+    for path, page in pages.items():
+        job_id = 'shared' if path in shared else path.name
+        with open(path, 'r', encoding='utf-8') as f:
+            content = f.read()
+        write_text(path, link_stylesheet(content, hrefs[job_id]))
+        report.append({
+            'file': path.name,
+            'classes': len(page['classes']),
+            'stylesheet': hrefs[job_id],
+            'css_bytes': len(css[job_id].encode('utf-8')),
+        })
+
+    users = {}
+    for entry in report:
+        users.setdefault(entry['stylesheet'], []).append(entry)
+    for href, entries in users.items():
+        print(f"✅ {href} ({entries[0]['css_bytes']:,} bytes, {len(entries)} pages)")
+    report_file = write_report('build_tailwind', report, pages_dir)
+    print(f"\n✨ Linked static Tailwind CSS in {len(report)} pages")
+    print(f"📋 Report: {report_file}")
+
+if __name__ == '__main__':
+    main()
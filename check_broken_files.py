@@ -1,100 +1,111 @@
 #!/usr/bin/env python3
 """
 Check all HTML files for issues (blank, whitescreen, broken structure)
+and audit them against performance budgets (see lp_perf.py); the run
+fails when a page goes over its budget. Source pages and deploy builds
+(--dir) have separate budget files, as prerendering, vendoring and
+minifying change every metric.
 """
-import re
+import argparse
+import json
+from functools import partial
 from pathlib import Path
 
-def check_html_file(file_path):
-    """Check if HTML file is valid and complete"""
+from lp_cache import ScanCache
+from lp_io import write_text
+from lp_perf import METRICS, over_budget, page_budgets
+from lp_scanner import LP_DIR, iter_html_files, scan_file
+
+BUDGET_FILE = LP_DIR.parent / 'perf_budgets.json'
+DEPLOY_BUDGET_FILE = LP_DIR.parent / 'perf_budgets.deploy.json'
+
+def load_budget_config(budget_file=BUDGET_FILE):
+    """Budget overrides: {"default": {...}, "pages": {file: {...}}}, empty without a file"""
     try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            content = f.read()
-        
-        issues = []
-        
-        # Check if file is too small (likely broken)
-        if len(content.strip()) < 500:
-            issues.append("File terlalu kecil (kemungkinan kosong/rusak)")
-        
-        # Check for basic HTML structure
-        if not re.search(r'<!DOCTYPE\s+html', content, re.IGNORECASE):
-            issues.append("Tidak ada DOCTYPE")
-        
-        if not re.search(r'<html', content, re.IGNORECASE):
-            issues.append("Tidak ada tag <html>")
-        
-        if not re.search(r'<body', content, re.IGNORECASE):
-            issues.append("Tidak ada tag <body>")
-        
-        # Check for React files
-        is_react = 'type="text/babel"' in content or 'ReactDOM' in content
-        
-        if is_react:
-            # Check if React root exists
-            if not re.search(r'<div\s+id=["\']root["\']', content):
-                issues.append("React: Tidak ada div#root")
-            
-            if not re.search(r'ReactDOM\.(createRoot|render)', content):
-                issues.append("React: Tidak ada ReactDOM render")
-            
-            # Check for closing tags
-            if content.count('<div id="root">') > 0 and content.count('</div>') < 3:
-                issues.append("React: Struktur tidak lengkap")
-        
-        # Check for closing body/html tags
-        if not re.search(r'</body>', content, re.IGNORECASE):
-            issues.append("Tidak ada closing tag </body>")
-        
-        if not re.search(r'</html>', content, re.IGNORECASE):
-            issues.append("Tidak ada closing tag </html>")
-        
-        # Check for syntax errors (unclosed tags, broken JSX)
-        if is_react:
-            # Check for unclosed JSX tags
-            open_divs = len(re.findall(r'<div', content))
-            close_divs = len(re.findall(r'</div>', content))
-            if open_divs > close_divs + 5:  # Allow some difference
-                issues.append("React: Kemungkinan tag tidak tertutup")
-        
-        # Check if file has actual content (not just empty structure)
-        text_content = re.sub(r'<[^>]+>', '', content)
-        if len(text_content.strip()) < 100:
-            issues.append("Konten terlalu sedikit")
-        
-        return {
-            'file': file_path.name,
-            'size': len(content),
-            'is_react': is_react,
-            'issues': issues,
-            'broken': len(issues) > 0
-        }
-    except Exception as e:
+        with open(budget_file, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return {}
+
+def record_budgets(config, results):
+    """Config granting every page currently over the shared budgets exactly what it uses
+
+    Pages that got back under the shared budgets lose their override, so
+    budgets only ever tighten and any growth fails the next run.
+    """
+    shared = page_budgets({'default': config.get('default', {})}, None)
+    pages = {}
+    for result in results:
+        over = over_budget(result.get('perf', {}), shared)
+        if over:
+            pages[result['file']] = {entry['metric']: entry['value'] for entry in over}
+    return {'default': config.get('default', {}), 'pages': pages}
+
+def check_html_file(file_path, budget_config=None):
+    """Check if HTML file is valid and complete"""
+    return check_from_scan(scan_file(file_path, perf=True), budget_config)
+
+def check_from_scan(result, budget_config=None):
+    """Convert a scanner record into the structure check summary"""
+    if result.error is not None:
         return {
-            'file': file_path.name,
-            'error': str(e),
+            'file': result.file,
+            'error': result.error,
             'broken': True
         }
+    return {
+        'file': result.file,
+        'size': result.size,
+        'is_react': result.is_react,
+        'issues': result.issues,
+        'broken': result.broken,
+        'perf': result.perf,
+        'over_budget': over_budget(result.perf, page_budgets(budget_config, result.file)),
+    }
 
-def main():
+def main(argv=None):
     """Main function"""
-    lp_dir = Path('/www/wwwroot/portfolio.irvandoda.my.id/LP')
+    parser = argparse.ArgumentParser(description='Check landing pages for blank/broken structure')
+    parser.add_argument('--no-cache', action='store_true', help='re-check every file, ignoring the scan cache')
+    parser.add_argument('--dir', default=str(LP_DIR), help=f'pages to check, e.g. a deploy build (default: {LP_DIR})')
+    parser.add_argument('--budgets', help=f'performance budget file (default: {BUDGET_FILE.name}, or {DEPLOY_BUDGET_FILE.name} with --dir)')
+    parser.add_argument('--record-budgets', action='store_true', help="write the current usage of pages over budget as their budgets instead of failing")
+    args = parser.parse_args(argv)
+    
+    lp_dir = Path(args.dir)
     
     if not lp_dir.exists():
         print(f"❌ Directory not found: {lp_dir}")
-        return
+        return 1
+    
+    source = lp_dir.resolve() == LP_DIR.resolve()
+    if args.budgets is None:
+        args.budgets = str(BUDGET_FILE if source else DEPLOY_BUDGET_FILE)
     
-    html_files = list(lp_dir.glob('*.html'))
+    try:
+        budget_config = load_budget_config(args.budgets)
+    except (OSError, ValueError) as e:
+        print(f"❌ Can't read budgets {args.budgets}: {e}")
+        return 1
+    
+    html_files = iter_html_files(lp_dir)
     total = len(html_files)
     
     print(f"📁 Checking {total} HTML files...\n")
     
+    # The cache only tracks the source tree
+    cache = None if args.no_cache or not source else ScanCache()
+    scan = partial(scan_file if cache is None else cache.scan, perf=True)
+    
     broken_files = []
+    slow_files = []
     all_results = []
     
     for html_file in html_files:
-        result = check_html_file(html_file)
+        result = check_from_scan(scan(html_file), budget_config)
         all_results.append(result)
+        if result.get('over_budget'):
+            slow_files.append(result)
         
         if result.get('broken', False):
             broken_files.append(result)
@@ -106,20 +117,47 @@ def main():
                     print(f"   - {issue}")
             print()
     
+    if cache is not None:
+        cache.prune()
+        cache.save()
+    
+    for result in slow_files:
+        print(f"🐢 {result['file']}")
+        for entry in result['over_budget']:
+            print(f"   - {entry['metric']}: {entry['value']:,} > {entry['budget']:,}")
+        print()
+    
     print("=" * 80)
     print(f"SUMMARY")
     print("=" * 80)
     print(f"Total files: {total}")
     print(f"Broken files: {len(broken_files)}")
     print(f"Valid files: {total - len(broken_files)}")
+    print(f"Over performance budget: {len(slow_files)}")
     
     if broken_files:
         print(f"\n📋 Broken files list:")
         for result in broken_files:
             print(f"   - {result['file']}")
     
-    return broken_files
+    measured = [result['perf'] for result in all_results if result.get('perf')]
+    if measured:
+        print(f"\n📏 Performance (max over {len(measured)} pages, shared budget):")
+        shared = page_budgets(budget_config, None)
+        for metric in METRICS:
+            print(f"   {metric:<28} {max(perf[metric] for perf in measured):>10,} / {shared[metric]:,}")
+    
+    if args.record_budgets:
+        config = record_budgets(budget_config, all_results)
+        write_text(Path(args.budgets), json.dumps(config, indent=2) + '\n')
+        print(f"\n💾 Recorded budgets of {len(config['pages'])} pages in {args.budgets}")
+        return 0
+    
+    if slow_files:
+        print(f"\n❌ {len(slow_files)} pages over their performance budget (raise it in {args.budgets} if intended)")
+        return 1
+    return 0
 
 if __name__ == '__main__':
-    main()
+    raise SystemExit(main())
 
@@ -2,23 +2,25 @@
 """
 Aggressively remove all HTML sections (with class=) from inside React components
 """
+import argparse
 import re
-from pathlib import Path
 
-def clean_react_component(content):
+from jsx_index import build_index
+from lp_cache import ScanCache
+from lp_executor import add_jobs_argument, print_task_output, run_tasks
+from lp_io import add_dry_run_argument, dry_run_verb, set_dry_run, write_text
+from lp_journal import journaled
+from lp_scanner import LP_DIR, is_babel_file, scan_directory
+
+def clean_react_component(content, index=None):
     """Remove all HTML with class= from React component"""
-    # Find React component return statement
-    return_match = re.search(r'return\s*\(', content)
-    if not return_match:
-        return content, False
-    
-    # Find component end
-    component_end = re.search(r'\)\s*;\s*}\s*;\s*(const\s+root|ReactDOM)', content)
-    if not component_end:
+    if index is None:
+        index = build_index(content)
+    if not index.has_component:
         return content, False
     
-    component_start = return_match.end()
-    component_content = content[component_start:component_end.start()]
+    component_start, component_end = index.body_start, index.body_end
+    component_content = content[component_start:component_end]
     
     # Find all HTML sections with class= (not className=)
     # More aggressive pattern to catch broken HTML
@@ -74,7 +76,7 @@ def clean_react_component(content):
     new_component = re.sub(r'^\s*<[^>]*class\s*=[^>]*>.*$', '', new_component, flags=re.MULTILINE | re.DOTALL)
     
     if changed or new_component != component_content:
-        new_content = content[:component_start] + new_component + content[component_end.start():]
+        new_content = content[:component_start] + new_component + content[component_end:]
         return new_content, True
     
     return content, False
@@ -85,14 +87,13 @@ def fix_file(file_path):
         with open(file_path, 'r', encoding='utf-8') as f:
             content = f.read()
         
-        if 'type="text/babel"' not in content:
+        if not is_babel_file(content):
             return False
         
         new_content, changed = clean_react_component(content)
         
         if changed:
-            with open(file_path, 'w', encoding='utf-8') as f:
-                f.write(new_content)
+            write_text(file_path, new_content)
             return True
         
         return False
@@ -100,29 +101,28 @@ def fix_file(file_path):
         print(f"Error processing {file_path.name}: {str(e)}")
         return False
 
-def main():
+@journaled('clean_all_html')
+def main(argv=None):
     """Main function"""
-    lp_dir = Path('/www/wwwroot/portfolio.irvandoda.my.id/LP')
+    parser = add_dry_run_argument(add_jobs_argument(argparse.ArgumentParser(description='Remove HTML (class=) from React components')))
+    args = parser.parse_args(argv)
+    set_dry_run(args.dry_run)
     
     # Get all React files
-    react_files = []
-    for html_file in lp_dir.glob('*.html'):
-        try:
-            content = html_file.read_text(encoding='utf-8')
-            if 'type="text/babel"' in content:
-                react_files.append(html_file)
-        except:
-            pass
+    cache = ScanCache()
+    react_files = [result.path for result in scan_directory(LP_DIR, cache) if result.is_babel]
+    cache.save()
     
     print(f"🔧 Cleaning HTML from {len(react_files)} React files...\n")
     
     fixed = 0
-    for html_file in react_files:
-        if fix_file(html_file):
-            print(f"✅ Cleaned {html_file.name}")
+    for task in run_tasks(fix_file, react_files, args.jobs):
+        print_task_output(task)
+        if task.value:
+            print(f"✅ {dry_run_verb('Cleaned', 'Would clean')} {task.path.name}")
             fixed += 1
     
-    print(f"\n✨ Cleaned {fixed}/{len(react_files)} files")
+    print(f"\n✨ {dry_run_verb('Cleaned', 'Would clean')} {fixed}/{len(react_files)} files")
 
 if __name__ == '__main__':
     main()
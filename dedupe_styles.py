@@ -0,0 +1,254 @@
+#!/usr/bin/env python3
+"""
+Build stage: move CSS rules repeated across pages into one shared stylesheet.
+Inline <style> blocks are split into top-level rules and normalized; rules
+found on --min-pages or more pages move to a fingerprinted stylesheet under
+assets/ and page-unique rules stay inline. Only rules that are inert on
+pages that don't use them are shared: @keyframes and class-only selectors,
+and only when no page linking the stylesheet mentions them without
+defining them the same way.
+"""
+import argparse
+import re
+from pathlib import Path
+
+from edit_plan import EditPlan
+from lp_build import add_dir_argument, write_asset, write_report
+from lp_executor import add_jobs_argument, print_task_output, run_tasks
+from lp_io import write_text
+from lp_scanner import iter_html_files
+from minify_pages import minify_css
+from tag_tree import iter_tokens
+
+MIN_PAGES = 3
+
+# Rules whose position in the cascade doesn't matter
+_ORDER_FREE = ('@charset', '@import', '@font-face', '@keyframes', '@-webkit-keyframes')
+
+_STYLE_CLOSE_RE = re.compile(r'</style\s*>', re.IGNORECASE)
+_KEYFRAMES_RE = re.compile(r'@(?:-webkit-)?keyframes\s+([\w-]+)\s*\{', re.IGNORECASE)
+_CLASS_SELECTOR_RE = re.compile(r'\.[\w-]+(?:::?[\w-]+(?:\([^)]*\))?)*(?:\s*[\s>]\s*\.[\w-]+(?:::?[\w-]+(?:\([^)]*\))?)*)*')
+_CLASS_NAME_RE = re.compile(r'\.([\w-]+)')
+_RELATIVE_URL_RE = re.compile(r'url\(\s*(?!["\']?(?:[\w+.-]+:|/|#))', re.IGNORECASE)
+_PROPERTY_RE = re.compile(r'[{;]\s*([\w-]+)\s*:')
+_WORD_RE = re.compile(r'[A-Za-z_][\w-]*')
+
+
+def split_rules(css, offset=0):
+    """Top-level (start, end) spans of a stylesheet, None if it doesn't balance
+
+    A rule is an at-statement ending in ";" or a selector/at-rule with a
+    braced block; comments between rules are not part of any rule.
+    """
+    rules = []
+    depth = 0
+    start = None
+    i = 0
+    while i < len(css):
+        c = css[i]
+        if c in '"\'':
+            m = re.compile(r'%s(?:[^%s\\]|\\.)*%s' % (c, c, c), re.DOTALL).match(css, i)
+            if not m:
+                return None
+            i = m.end()
+            continue
+        if css.startswith('/*', i):
+            close = css.find('*/', i + 2)
+            if close == -1:
+                return None
+            i = close + 2
+            continue
+        if start is None and not c.isspace():
+            start = i
+        if c == '{':
+            depth += 1
+        elif c == '}':
+            depth -= 1
+            if depth < 0:
+                return None
+            if depth == 0:
+                rules.append((offset + start, offset + i + 1))
+                start = None
+        elif c == ';' and depth == 0:
+            rules.append((offset + start, offset + i + 1))
+            start = None
+        i += 1
+    return rules if depth == 0 and start is None else None
+
+def normalize_rule(text):
+    """Comment-free, whitespace-collapsed form of a rule used as its identity"""
+    return minify_css(text)
+
+def rule_names(key):
+    """Names a shareable rule defines (keyframes or classes), None if not shareable"""
+    if _RELATIVE_URL_RE.search(key):
+        # Would resolve against assets/ instead of the page
+        return None
+    keyframes = _KEYFRAMES_RE.match(key)
+    if keyframes:
+        return {keyframes.group(1)}
+    selectors, brace, _ = key.partition('{')
+    if not brace or selectors.startswith('@'):
+        return None
+    if not all(_CLASS_SELECTOR_RE.fullmatch(selector.strip()) for selector in selectors.split(',')):
+        return None
+    return set(_CLASS_NAME_RE.findall(selectors))
+
+def declared_properties(key):
+    """Property names a normalized rule sets"""
+    return set(_PROPERTY_RE.findall(key))
+
+def style_blocks(content):
+    """(tag_start, body_start, body_end, close_end) of plain CSS <style> elements"""
+    for token in iter_tokens(content):
+        if token.kind != 'open' or token.tag.lower() != 'style':
+            continue
+        kind = str(token.attrs.get('type', 'text/css')).lower()
+        media = str(token.attrs.get('media', 'all')).lower()
+        if kind != 'text/css' or media != 'all':
+            continue
+        close = _STYLE_CLOSE_RE.search(content, token.end)
+        if close:
+            yield token.start, token.end, close.start(), close.end()
+
+def page_rules(file_path):
+    """Inline style blocks with their rules as (start, end, key), plus every word of the page"""
+    with open(file_path, 'r', encoding='utf-8') as f:
+        content = f.read()
+    blocks = []
+    for tag_start, body_start, body_end, close_end in style_blocks(content):
+        spans = split_rules(content[body_start:body_end], body_start)
+        if spans is None:
+            print(f"⚠️  {file_path.name}: unbalanced <style> at offset {tag_start}, left inline")
+            continue
+        rules = [(start, end, normalize_rule(content[start:end])) for start, end in spans]
+        blocks.append({'span': (tag_start, body_start, body_end, close_end), 'rules': rules})
+    return {'blocks': blocks, 'words': set(_WORD_RE.findall(content))} if blocks else None
+
+def plan_shared(pages, min_pages=MIN_PAGES):
+    """Rules for the shared stylesheet, in stylesheet order
+
+    The stylesheet is linked before a page's first <style>, so a moved
+    class rule must not follow an inline rule setting the same property,
+    and moved rules must keep their order. A page that links the stylesheet gets every
+    shared rule, so none may define a name the page uses without that
+    exact rule. Rules breaking either condition stay inline everywhere.
+    """
+    page_keys = {path: [key for block in page['blocks'] for _, _, key in block['rules']] for path, page in pages.items()}
+    first_seen = {}
+    users = {}
+    for path, keys in page_keys.items():
+        for key in keys:
+            first_seen.setdefault(key, len(first_seen))
+            users.setdefault(key, set()).add(path)
+    names = {key: rule_names(key) for key in users}
+    shared = {key for key, paths in users.items() if len(paths) >= min_pages and names[key]}
+
+    while True:
+        unsafe = set()
+        linking = {path for key in shared for path in users[key]}
+        for path in linking:
+            keys = set(page_keys[path])
+            words = pages[path]['words']
+            unsafe |= {key for key in shared if key not in keys and names[key] & words}
+        for keys in page_keys.values():
+            kept_before = set()
+            last = -1
+            for key in keys:
+                if key not in shared:
+                    if not key.lower().startswith(_ORDER_FREE):
+                        kept_before |= declared_properties(key)
+                elif _KEYFRAMES_RE.match(key):
+                    continue
+                elif kept_before & declared_properties(key) or first_seen[key] < last:
+                    unsafe.add(key)
+                else:
+                    last = first_seen[key]
+        if not unsafe:
+            return sorted(shared, key=first_seen.get)
+        shared -= unsafe
+
+def _line_start(content, offset):
+    """Start of the whitespace run before offset on its line"""
+    while offset > 0 and content[offset - 1] in ' \t':
+        offset -= 1
+    return offset
+
+def dedupe_page(content, blocks, moved, href):
+    """Drop moved rules from a page and link the shared stylesheet"""
+    plan = EditPlan()
+    for block in blocks:
+        tag_start, body_start, body_end, close_end = block['span']
+        rules = block['rules']
+        remaining = [rule for rule in rules if rule[2] not in moved]
+        if len(remaining) == len(rules):
+            continue
+        if not remaining:
+            # Every rule moved: drop the whole element and its line
+            start = _line_start(content, tag_start)
+            end = close_end
+            if content[start - 1:start] in ('', '\n') and content.startswith('\n', close_end):
+                end += 1
+            plan.delete(start, end - start)
+            continue
+        for start, end, key in rules:
+            if key in moved:
+                start = _line_start(content, start)
+                if content[start - 1:start] == '\n' and start - 1 >= body_start:
+                    start -= 1
+                plan.delete(start, end - start)
+
+    first_tag = blocks[0]['span'][0]
+    line_start = _line_start(content, first_tag)
+    plan.insert(line_start, f'{content[line_start:first_tag]}<link rel="stylesheet" href="{href}">\n')
+    return plan.apply(content)
+
+def main(argv=None):
+    """Main function"""
+    parser = add_jobs_argument(add_dir_argument(argparse.ArgumentParser(description='Move CSS rules repeated across pages into a shared stylesheet')))
+    parser.add_argument('--min-pages', type=int, default=MIN_PAGES, help=f'pages a rule must appear on to be shared (default: {MIN_PAGES})')
+    args = parser.parse_args(argv)
+
+    pages_dir = Path(args.dir)
+    if not pages_dir.exists():
+        print(f"❌ Directory not found: {pages_dir} (run lp_build.py first)")
+        return
+
+    pages = {}
+    for task in run_tasks(page_rules, iter_html_files(pages_dir), args.jobs):
+        print_task_output(task)
+        if task.value:
+            pages[task.path] = task.value
+
+    shared = plan_shared(pages, args.min_pages)
+    if not shared:
+        print("✨ No inline CSS rules shared by enough pages")
+        return
+    stylesheet = ('\n'.join(shared) + '\n').encode('utf-8')
+    href = write_asset(pages_dir, 'styles.css', stylesheet)
+    print(f"✅ {href}: {len(shared)} shared rules ({len(stylesheet):,} bytes)")
+
+    moved = set(shared)
+    report = []
+    for path, page in pages.items():
+        if not any(key in moved for block in page['blocks'] for _, _, key in block['rules']):
+            continue
+        with open(path, 'r', encoding='utf-8') as f:
+            content = f.read()
+        new_content = dedupe_page(content, page['blocks'], moved, href)
+        write_text(path, new_content)
+        report.append({'file': path.name, 'bytes_saved': len(content.encode('utf-8')) - len(new_content.encode('utf-8'))})
+
+    saved = sum(entry['bytes_saved'] for entry in report)
+    report_file = write_report('dedupe_styles', {
+        'stylesheet': href,
+        'stylesheet_bytes': len(stylesheet),
+        'rules': shared,
+        'pages': report,
+        'bytes_saved': saved,
+    }, pages_dir)
+    print(f"\n✨ Moved {len(shared)} shared rules out of {len(report)} pages, {saved:,} inline bytes saved")
+    print(f"📋 Report: {report_file}")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""
+Batched edit plans for landing page fixers.
+Detectors emit (offset, delete_len, insert_text) operations against the
+original content; the plan checks them for overlaps and applies them all
+with a single join, so N fixes cost one new string instead of N copies.
+"""
+from dataclasses import dataclass
+from typing import List
+
+
+class EditConflictError(ValueError):
+    """Two edits in a plan touch the same characters"""
+
+
+@dataclass(frozen=True)
+class Edit:
+    """Replace content[offset:offset + delete_len] with insert_text"""
+    offset: int
+    delete_len: int
+    insert_text: str
+    seq: int = 0
+
+    @property
+    def end(self):
+        return self.offset + self.delete_len
+
+
+class EditPlan:
+    """Ordered set of non-overlapping edits against one original string"""
+
+    def __init__(self):
+        self.edits: List[Edit] = []
+
+    def __len__(self):
+        return len(self.edits)
+
+    def __bool__(self):
+        return bool(self.edits)
+
+    def add(self, offset, delete_len=0, insert_text=''):
+        """Queue an edit; inserts at the same offset keep the order they were added"""
+        if offset < 0 or delete_len < 0:
+            raise ValueError(f"Invalid edit at {offset} (delete {delete_len})")
+        self.edits.append(Edit(offset, delete_len, insert_text, len(self.edits)))
+        return self
+
+    def insert(self, offset, text):
+        return self.add(offset, 0, text)
+
+    def delete(self, offset, length):
+        return self.add(offset, length, '')
+
+    def replace(self, offset, length, text):
+        return self.add(offset, length, text)
+
+    def extend(self, other):
+        """Merge another plan computed against the same original content"""
+        for edit in other.edits:
+            self.add(edit.offset, edit.delete_len, edit.insert_text)
+        return self
+
+    def sorted_edits(self):
+        """Edits in application order, raising EditConflictError on overlaps"""
+        edits = sorted(self.edits, key=lambda e: (e.offset, e.delete_len > 0, e.seq))
+        last_end = 0
+        last = None
+        for edit in edits:
+            if last is not None and edit.offset < last_end:
+                raise EditConflictError(
+                    f"Edit at {edit.offset} overlaps edit at {last.offset}..{last.end}"
+                )
+            if edit.delete_len:
+                last_end = edit.end
+                last = edit
+        return edits
+
+    def apply(self, content):
+        """Return content with every edit applied, built with one join"""
+        pieces = []
+        pos = 0
+        for edit in self.sorted_edits():
+            if edit.end > len(content):
+                raise EditConflictError(f"Edit at {edit.offset} runs past end of content")
+            pieces.append(content[pos:edit.offset])
+            pieces.append(edit.insert_text)
+            pos = edit.end
+        pieces.append(content[pos:])
+        return ''.join(pieces)
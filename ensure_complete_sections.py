@@ -2,247 +2,64 @@
 """
 Ensure all React files have complete sections (Benefits, Preview, Testimonials, Pricing) as JSX
 """
+import argparse
 import re
-from pathlib import Path
 
-def has_section_in_jsx(content, section_type):
+from jsx_index import build_index
+from lp_detectors import detector_set
+from lp_io import add_dry_run_argument, dry_run_verb, set_dry_run, write_text
+from lp_journal import journaled
+from lp_scanner import LP_DIR, is_babel_file, scan_directory
+from section_templates import SECTIONS, render_section
+
+SECTION_JSX_DETECTORS = detector_set({
+    'benefit': r'id=["\']benefits["\'].*?className|benefit.*?className|keuntungan.*?className',
+    'preview': r'id=["\']preview["\'].*?className|preview.*?className|galeri.*?className',
+    'testimonials': r'id=["\']testimonials["\'].*?className|testimonial.*?className|kata.*?mereka.*?className',
+    'pricing': r'id=["\']pricing["\'].*?className|pricing.*?className|harga.*?className|paket.*?className'
+}, re.IGNORECASE | re.DOTALL)
+
+def has_section_in_jsx(content, section_type, index=None):
     """Check if section exists as JSX in React component"""
-    patterns = {
-        'benefit': r'id=["\']benefits["\'].*?className|benefit.*?className|keuntungan.*?className',
-        'preview': r'id=["\']preview["\'].*?className|preview.*?className|galeri.*?className',
-        'testimonials': r'id=["\']testimonials["\'].*?className|testimonial.*?className|kata.*?mereka.*?className',
-        'pricing': r'id=["\']pricing["\'].*?className|pricing.*?className|harga.*?className|paket.*?className'
-    }
-    pattern = patterns.get(section_type, '')
-    if not pattern:
+    detector = SECTION_JSX_DETECTORS.detectors.get(section_type)
+    if detector is None:
         return False
     
     # Check if it's inside React component (after return statement)
-    return_match = re.search(r'return\s*\(', content)
-    if return_match:
-        component_content = content[return_match.end():]
-        # Find component end
-        component_end = re.search(r'\)\s*;\s*}\s*;\s*(const\s+root|ReactDOM)', component_content)
-        if component_end:
-            component_content = component_content[:component_end.start()]
-            return bool(re.search(pattern, component_content, re.IGNORECASE | re.DOTALL))
-    return False
+    if index is None:
+        index = build_index(content)
+    if not index.has_component:
+        return False
+    return detector.search(content, index.body_start, index.body_end)
 
-def get_jsx_section_template(section_type):
+def get_jsx_section_template(section_type, data=None):
     """Get JSX template for section"""
-    templates = {
-        'benefit': '''                    {/* Benefits Section */}
-                    <section id="benefits" className="py-20 bg-white text-black">
-                        <div className="container mx-auto px-6">
-                            <div className="text-center mb-12">
-                                <h2 className="text-3xl md:text-4xl font-bold text-gray-900 mb-4">Keunggulan Kami</h2>
-                                <p className="text-gray-600 text-lg max-w-2xl mx-auto">Mengapa memilih layanan kami? Berikut keunggulan yang kami tawarkan.</p>
-                            </div>
-                            <div className="grid md:grid-cols-3 gap-8">
-                                <div className="p-6 rounded-xl bg-gray-50 hover:shadow-lg transition-all">
-                                    <div className="w-12 h-12 bg-blue-100 rounded-lg flex items-center justify-center mb-4">
-                                        <svg className="w-6 h-6 text-blue-600" fill="none" stroke="currentColor" viewBox="0 0 24 24">
-                                            <path strokeLinecap="round" strokeLinejoin="round" strokeWidth="2" d="M5 13l4 4L19 7"></path>
-                                        </svg>
-                                    </div>
-                                    <h3 className="text-xl font-bold text-gray-900 mb-2">Profesional</h3>
-                                    <p className="text-gray-600">Tim berpengalaman dan terpercaya dalam memberikan layanan terbaik.</p>
-                                </div>
-                                <div className="p-6 rounded-xl bg-gray-50 hover:shadow-lg transition-all">
-                                    <div className="w-12 h-12 bg-green-100 rounded-lg flex items-center justify-center mb-4">
-                                        <svg className="w-6 h-6 text-green-600" fill="none" stroke="currentColor" viewBox="0 0 24 24">
-                                            <path strokeLinecap="round" strokeLinejoin="round" strokeWidth="2" d="M12 8v4l3 3m6-3a9 9 0 11-18 0 9 9 0 0118 0z"></path>
-                                        </svg>
-                                    </div>
-                                    <h3 className="text-xl font-bold text-gray-900 mb-2">Cepat & Efisien</h3>
-                                    <p className="text-gray-600">Proses yang cepat tanpa mengorbankan kualitas hasil kerja.</p>
-                                </div>
-                                <div className="p-6 rounded-xl bg-gray-50 hover:shadow-lg transition-all">
-                                    <div className="w-12 h-12 bg-purple-100 rounded-lg flex items-center justify-center mb-4">
-                                        <svg className="w-6 h-6 text-purple-600" fill="none" stroke="currentColor" viewBox="0 0 24 24">
-                                            <path strokeLinecap="round" strokeLinejoin="round" strokeWidth="2" d="M9 12l2 2 4-4m5.618-4.016A11.955 11.955 0 0112 2.944a11.955 11.955 0 01-8.618 3.04A12.02 12.02 0 003 9c0 5.591 3.824 10.29 9 11.622 5.176-1.332 9-6.03 9-11.622 0-1.042-.133-2.052-.382-3.016z"></path>
-                                        </svg>
-                                    </div>
-                                    <h3 className="text-xl font-bold text-gray-900 mb-2">Terpercaya</h3>
-                                    <p className="text-gray-600">Komitmen tinggi terhadap kepuasan dan kepercayaan pelanggan.</p>
-                                </div>
-                            </div>
-                        </div>
-                    </section>''',
-        
-        'preview': '''                    {/* Preview Section */}
-                    <section id="preview" className="py-20 bg-gray-50">
-                        <div className="container mx-auto px-6">
-                            <div className="text-center mb-12">
-                                <h2 className="text-3xl md:text-4xl font-bold text-gray-900 mb-4">Galeri Karya Kami</h2>
-                                <p className="text-gray-600 text-lg max-w-2xl mx-auto">Lihat hasil kerja kami yang telah membantu banyak klien.</p>
-                            </div>
-                            <div className="grid md:grid-cols-3 gap-6">
-                                <div className="rounded-xl overflow-hidden shadow-lg hover:shadow-xl transition-all">
-                                    <img src="https://images.unsplash.com/photo-1556742049-0cfed4f6a45d?q=80&w=800&auto=format&fit=crop" alt="Preview 1" className="w-full h-64 object-cover hover:scale-110 transition-transform duration-500" />
-                                </div>
-                                <div className="rounded-xl overflow-hidden shadow-lg hover:shadow-xl transition-all">
-                                    <img src="https://images.unsplash.com/photo-1556761175-5973dc0f32e7?q=80&w=800&auto=format&fit=crop" alt="Preview 2" className="w-full h-64 object-cover hover:scale-110 transition-transform duration-500" />
-                                </div>
-                                <div className="rounded-xl overflow-hidden shadow-lg hover:shadow-xl transition-all">
-                                    <img src="https://images.unsplash.com/photo-1556761175-b413da4baf72?q=80&w=800&auto=format&fit=crop" alt="Preview 3" className="w-full h-64 object-cover hover:scale-110 transition-transform duration-500" />
-                                </div>
-                            </div>
-                        </div>
-                    </section>''',
-        
-        'testimonials': '''                    {/* Testimonials Section */}
-                    <section id="testimonials" className="py-20 bg-white">
-                        <div className="container mx-auto px-6">
-                            <div className="text-center mb-12">
-                                <h2 className="text-3xl md:text-4xl font-bold text-gray-900 mb-4">Apa Kata Mereka</h2>
-                                <p className="text-gray-600 text-lg max-w-2xl mx-auto">Testimoni dari klien yang telah menggunakan layanan kami.</p>
-                            </div>
-                            <div className="grid md:grid-cols-3 gap-8">
-                                <div className="bg-gray-50 p-6 rounded-xl">
-                                    <div className="flex text-yellow-400 mb-4">
-                                        {[...Array(5)].map((_, i) => (
-                                            <svg key={i} className="w-5 h-5 fill-current" fill="currentColor" viewBox="0 0 20 20"><path d="M9.049 2.927c.3-.921 1.603-.921 1.902 0l1.07 3.292a1 1 0 00.95.69h3.462c.969 0 1.371 1.24.588 1.81l-2.8 2.034a1 1 0 00-.364 1.118l1.07 3.292c.3.921-.755 1.688-1.54 1.118l-2.8-2.034a1 1 0 00-1.175 0l-2.8 2.034c-.784.57-1.838-.197-1.539-1.118l1.07-3.292a1 1 0 00-.364-1.118L2.98 8.72c-.783-.57-.38-1.81.588-1.81h3.461a1 1 0 00.951-.69l1.07-3.292z"></path></svg>
-                                        ))}
-                                    </div>
-                                    <p className="text-gray-700 mb-4 italic">"Layanan yang sangat memuaskan! Hasilnya sesuai ekspektasi dan prosesnya cepat."</p>
-                                    <div className="flex items-center gap-3">
-                                        <div className="w-10 h-10 bg-gray-300 rounded-full flex items-center justify-center font-bold text-gray-700">AB</div>
-                                        <div>
-                                            <h5 className="font-bold text-gray-900">Ahmad Budi</h5>
-                                            <p className="text-sm text-gray-600">Klien</p>
-                                        </div>
-                                    </div>
-                                </div>
-                                <div className="bg-gray-50 p-6 rounded-xl">
-                                    <div className="flex text-yellow-400 mb-4">
-                                        {[...Array(5)].map((_, i) => (
-                                            <svg key={i} className="w-5 h-5 fill-current" fill="currentColor" viewBox="0 0 20 20"><path d="M9.049 2.927c.3-.921 1.603-.921 1.902 0l1.07 3.292a1 1 0 00.95.69h3.462c.969 0 1.371 1.24.588 1.81l-2.8 2.034a1 1 0 00-.364 1.118l1.07 3.292c.3.921-.755 1.688-1.54 1.118l-2.8-2.034a1 1 0 00-1.175 0l-2.8 2.034c-.784.57-1.838-.197-1.539-1.118l1.07-3.292a1 1 0 00-.364-1.118L2.98 8.72c-.783-.57-.38-1.81.588-1.81h3.461a1 1 0 00.951-.69l1.07-3.292z"></path></svg>
-                                        ))}
-                                    </div>
-                                    <p className="text-gray-700 mb-4 italic">"Sangat profesional dan detail. Saya sangat puas dengan hasilnya!"</p>
-                                    <div className="flex items-center gap-3">
-                                        <div className="w-10 h-10 bg-gray-300 rounded-full flex items-center justify-center font-bold text-gray-700">SD</div>
-                                        <div>
-                                            <h5 className="font-bold text-gray-900">Sari Dewi</h5>
-                                            <p className="text-sm text-gray-600">Klien</p>
-                                        </div>
-                                    </div>
-                                </div>
-                                <div className="bg-gray-50 p-6 rounded-xl">
-                                    <div className="flex text-yellow-400 mb-4">
-                                        {[...Array(5)].map((_, i) => (
-                                            <svg key={i} className="w-5 h-5 fill-current" fill="currentColor" viewBox="0 0 20 20"><path d="M9.049 2.927c.3-.921 1.603-.921 1.902 0l1.07 3.292a1 1 0 00.95.69h3.462c.969 0 1.371 1.24.588 1.81l-2.8 2.034a1 1 0 00-.364 1.118l1.07 3.292c.3.921-.755 1.688-1.54 1.118l-2.8-2.034a1 1 0 00-1.175 0l-2.8 2.034c-.784.57-1.838-.197-1.539-1.118l1.07-3.292a1 1 0 00-.364-1.118L2.98 8.72c-.783-.57-.38-1.81.588-1.81h3.461a1 1 0 00.951-.69l1.07-3.292z"></path></svg>
-                                        ))}
-                                    </div>
-                                    <p className="text-gray-700 mb-4 italic">"Pelayanan sangat baik dan hasilnya melebihi ekspektasi. Highly recommended!"</p>
-                                    <div className="flex items-center gap-3">
-                                        <div className="w-10 h-10 bg-gray-300 rounded-full flex items-center justify-center font-bold text-gray-700">RP</div>
-                                        <div>
-                                            <h5 className="font-bold text-gray-900">Rudi Pratama</h5>
-                                            <p className="text-sm text-gray-600">Klien</p>
-                                        </div>
-                                    </div>
-                                </div>
-                            </div>
-                        </div>
-                    </section>''',
-        
-        'pricing': '''                    {/* Pricing Section */}
-                    <section id="pricing" className="py-20 bg-gray-50">
-                        <div className="container mx-auto px-6">
-                            <div className="text-center mb-12">
-                                <h2 className="text-3xl md:text-4xl font-bold text-gray-900 mb-4">Paket & Harga</h2>
-                                <p className="text-gray-600 text-lg max-w-2xl mx-auto">Pilih paket yang sesuai dengan kebutuhan Anda.</p>
-                            </div>
-                            <div className="grid md:grid-cols-3 gap-8 max-w-5xl mx-auto">
-                                <div className="bg-white p-8 rounded-xl shadow-lg">
-                                    <h3 className="text-xl font-bold text-gray-900 mb-4">Paket Basic</h3>
-                                    <div className="text-3xl font-bold text-gray-900 mb-6">Rp 500.000</div>
-                                    <ul className="space-y-3 mb-8">
-                                        <li className="flex items-center gap-2">
-                                            <svg className="w-5 h-5 text-green-500" fill="currentColor" viewBox="0 0 20 20"><path fillRule="evenodd" d="M16.707 5.293a1 1 0 010 1.414l-8 8a1 1 0 01-1.414 0l-4-4a1 1 0 011.414-1.414L8 12.586l7.293-7.293a1 1 0 011.414 0z" clipRule="evenodd"/></svg>
-                                            <span className="text-gray-600">Fitur dasar</span>
-                                        </li>
-                                        <li className="flex items-center gap-2">
-                                            <svg className="w-5 h-5 text-green-500" fill="currentColor" viewBox="0 0 20 20"><path fillRule="evenodd" d="M16.707 5.293a1 1 0 010 1.414l-8 8a1 1 0 01-1.414 0l-4-4a1 1 0 011.414-1.414L8 12.586l7.293-7.293a1 1 0 011.414 0z" clipRule="evenodd"/></svg>
-                                            <span className="text-gray-600">Support email</span>
-                                        </li>
-                                    </ul>
-                                    <button className="w-full bg-gray-200 text-gray-800 py-3 rounded-lg font-bold hover:bg-gray-300 transition-colors">Pilih Paket</button>
-                                </div>
-                                <div className="bg-blue-600 text-white p-8 rounded-xl shadow-xl transform scale-105 relative">
-                                    <div className="absolute top-0 right-0 bg-yellow-400 text-gray-900 px-3 py-1 rounded-bl-lg rounded-tr-xl text-xs font-bold">POPULER</div>
-                                    <h3 className="text-xl font-bold mb-4">Paket Premium</h3>
-                                    <div className="text-3xl font-bold mb-6">Rp 1.000.000</div>
-                                    <ul className="space-y-3 mb-8">
-                                        <li className="flex items-center gap-2">
-                                            <svg className="w-5 h-5" fill="currentColor" viewBox="0 0 20 20"><path fillRule="evenodd" d="M16.707 5.293a1 1 0 010 1.414l-8 8a1 1 0 01-1.414 0l-4-4a1 1 0 011.414-1.414L8 12.586l7.293-7.293a1 1 0 011.414 0z" clipRule="evenodd"/></svg>
-                                            <span>Semua fitur Basic</span>
-                                        </li>
-                                        <li className="flex items-center gap-2">
-                                            <svg className="w-5 h-5" fill="currentColor" viewBox="0 0 20 20"><path fillRule="evenodd" d="M16.707 5.293a1 1 0 010 1.414l-8 8a1 1 0 01-1.414 0l-4-4a1 1 0 011.414-1.414L8 12.586l7.293-7.293a1 1 0 011.414 0z" clipRule="evenodd"/></svg>
-                                            <span>Support prioritas</span>
-                                        </li>
-                                        <li className="flex items-center gap-2">
-                                            <svg className="w-5 h-5" fill="currentColor" viewBox="0 0 20 20"><path fillRule="evenodd" d="M16.707 5.293a1 1 0 010 1.414l-8 8a1 1 0 01-1.414 0l-4-4a1 1 0 011.414-1.414L8 12.586l7.293-7.293a1 1 0 011.414 0z" clipRule="evenodd"/></svg>
-                                            <span>Update gratis</span>
-                                        </li>
-                                    </ul>
-                                    <button className="w-full bg-white text-blue-600 py-3 rounded-lg font-bold hover:bg-gray-100 transition-colors">Pilih Paket</button>
-                                </div>
-                                <div className="bg-white p-8 rounded-xl shadow-lg">
-                                    <h3 className="text-xl font-bold text-gray-900 mb-4">Paket Enterprise</h3>
-                                    <div className="text-3xl font-bold text-gray-900 mb-6">Rp 2.000.000</div>
-                                    <ul className="space-y-3 mb-8">
-                                        <li className="flex items-center gap-2">
-                                            <svg className="w-5 h-5 text-green-500" fill="currentColor" viewBox="0 0 20 20"><path fillRule="evenodd" d="M16.707 5.293a1 1 0 010 1.414l-8 8a1 1 0 01-1.414 0l-4-4a1 1 0 011.414-1.414L8 12.586l7.293-7.293a1 1 0 011.414 0z" clipRule="evenodd"/></svg>
-                                            <span className="text-gray-600">Semua fitur Premium</span>
-                                        </li>
-                                        <li className="flex items-center gap-2">
-                                            <svg className="w-5 h-5 text-green-500" fill="currentColor" viewBox="0 0 20 20"><path fillRule="evenodd" d="M16.707 5.293a1 1 0 010 1.414l-8 8a1 1 0 01-1.414 0l-4-4a1 1 0 011.414-1.414L8 12.586l7.293-7.293a1 1 0 011.414 0z" clipRule="evenodd"/></svg>
-                                            <span className="text-gray-600">Custom development</span>
-                                        </li>
-                                        <li className="flex items-center gap-2">
-                                            <svg className="w-5 h-5 text-green-500" fill="currentColor" viewBox="0 0 20 20"><path fillRule="evenodd" d="M16.707 5.293a1 1 0 010 1.414l-8 8a1 1 0 01-1.414 0l-4-4a1 1 0 011.414-1.414L8 12.586l7.293-7.293a1 1 0 011.414 0z" clipRule="evenodd"/></svg>
-                                            <span className="text-gray-600">Dedicated support</span>
-                                        </li>
-                                    </ul>
-                                    <button className="w-full bg-gray-200 text-gray-800 py-3 rounded-lg font-bold hover:bg-gray-300 transition-colors">Pilih Paket</button>
-                                </div>
-                            </div>
-                        </div>
-                    </section>'''
-    }
-    return templates.get(section_type, '')
+    if section_type not in SECTIONS:
+        return ''
+    return render_section(section_type, 'jsx', data)
 
-def ensure_sections_in_react(file_path):
+def ensure_sections_in_react(file_path, content=None):
     """Ensure all sections exist as JSX in React component"""
     try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            content = f.read()
-        
-        if 'type="text/babel"' not in content:
-            return False
+        if content is None:
+            with open(file_path, 'r', encoding='utf-8') as f:
+                content = f.read()
         
-        # Find React component return statement
-        return_match = re.search(r'return\s*\(', content)
-        if not return_match:
+        if not is_babel_file(content):
             return False
         
-        # Find component end
-        component_end = re.search(r'\)\s*;\s*}\s*;\s*(const\s+root|ReactDOM)', content)
-        if not component_end:
+        # Find React component body
+        index = build_index(content)
+        if not index.has_component:
             return False
         
-        component_start = return_match.end()
-        component_content = content[component_start:component_end.start()]
+        component_start, component_end = index.body_start, index.body_end
+        component_content = content[component_start:component_end]
         
         # Check which sections are missing
-        missing_sections = []
-        for section_type in ['benefit', 'preview', 'testimonials', 'pricing']:
-            if not has_section_in_jsx(content, section_type):
-                missing_sections.append(section_type)
+        present = SECTION_JSX_DETECTORS.scan(content, index.body_start, index.body_end)
+        missing_sections = [section_type for section_type in ['benefit', 'preview', 'testimonials', 'pricing']
+                            if section_type not in present]
         
         if not missing_sections:
             return False
@@ -268,10 +85,9 @@ def ensure_sections_in_react(file_path):
         
         if sections_to_add:
             new_component = component_content[:insert_pos] + '\n                    ' + '\n                    '.join(sections_to_add) + '\n                    ' + component_content[insert_pos:]
-            new_content = content[:component_start] + new_component + content[component_end.start():]
+            new_content = content[:component_start] + new_component + content[component_end:]
             
-            with open(file_path, 'w', encoding='utf-8') as f:
-                f.write(new_content)
+            write_text(file_path, new_content)
             
             return True
         
@@ -280,21 +96,24 @@ def ensure_sections_in_react(file_path):
         print(f"Error processing {file_path.name}: {str(e)}")
         return False
 
-def main():
+@journaled('ensure_complete_sections')
+def main(argv=None):
     """Main function"""
-    lp_dir = Path('/www/wwwroot/portfolio.irvandoda.my.id/LP')
+    parser = add_dry_run_argument(argparse.ArgumentParser(description='Ensure React landing pages have complete JSX sections'))
+    args = parser.parse_args(argv)
+    set_dry_run(args.dry_run)
     
-    html_files = [f for f in lp_dir.glob('*.html') if 'type="text/babel"' in f.read_text(encoding='utf-8')]
+    react_files = [result for result in scan_directory(LP_DIR) if result.is_babel]
     
-    print(f"🔧 Ensuring complete sections in {len(html_files)} React files...\n")
+    print(f"🔧 Ensuring complete sections in {len(react_files)} React files...\n")
     
     fixed = 0
-    for html_file in html_files:
-        if ensure_sections_in_react(html_file):
-            print(f"✅ Added missing sections to {html_file.name}")
+    for result in react_files:
+        if ensure_sections_in_react(result.path, result.content):
+            print(f"✅ {dry_run_verb('Added', 'Would add')} missing sections to {result.file}")
             fixed += 1
     
-    print(f"\n✨ Updated {fixed}/{len(html_files)} files")
+    print(f"\n✨ {dry_run_verb('Updated', 'Would update')} {fixed}/{len(react_files)} files")
 
 if __name__ == '__main__':
     main()
@@ -3,8 +3,15 @@
 Fix all React files that have mixed HTML (class) and JSX (className) structure
 This will remove HTML sections outside React component and add them as JSX inside
 """
+import argparse
 import re
-from pathlib import Path
+
+from jsx_index import build_index
+from lp_executor import add_jobs_argument, print_task_output, run_tasks
+from lp_io import add_dry_run_argument, dry_run_verb, set_dry_run, write_text
+from lp_journal import journaled
+from lp_scanner import LP_DIR, is_babel_file
+from tag_tree import html_section_spans
 
 def convert_html_to_jsx(html_content):
     """Convert HTML attributes to JSX"""
@@ -25,49 +32,79 @@ def convert_html_to_jsx(html_content):
     jsx = re.sub(r'clip-rule', 'clipRule', jsx)
     return jsx
 
-def extract_html_sections(content):
+def extract_html_sections(content, index=None):
     """Extract HTML sections that are outside React component"""
     sections = []
     
-    # Find React component return statement
-    return_match = re.search(r'return\s*\(', content)
-    if not return_match:
+    # Find React component body
+    if index is None:
+        index = build_index(content)
+    if not index.has_component:
         return sections
     
-    # Find where component ends
-    component_end_patterns = [
-        r'\)\s*;\s*}\s*;\s*const\s+root',
-        r'\)\s*;\s*}\s*;\s*ReactDOM',
-        r'\)\s*;\s*}\s*;\s*\n\s*const\s+root',
-    ]
+    # Find HTML sections with class= (not className=) between return and
+    # component end: <!-- comment --> followed by <section class= or <div class=
+    for start, end in html_section_spans(content, index.body_start, index.body_end):
+        sections.append({
+            'start': start,
+            'end': end,
+            'content': content[start:end]
+        })
     
-    component_end = None
-    for pattern in component_end_patterns:
-        match = re.search(pattern, content)
-        if match:
-            component_end = match.start()
-            break
+    return sections
+
+def fix_mixed_component(content, index=None):
+    """Move HTML sections of the React component to its end as JSX; returns (content, changed)"""
+    # Check if file has mixed structure
+    if not re.search(r'class\s*=', content):
+        return content, False  # No HTML with class= found
     
-    if not component_end:
-        return sections
+    # Find React component body
+    if index is None:
+        index = build_index(content)
+    if not index.has_component:
+        return content, False
     
-    # Extract content between return and component end
-    component_content = content[return_match.end():component_end]
+    # Find HTML sections with class= inside component
+    component_start, component_end = index.body_start, index.body_end
+    html_sections = extract_html_sections(content, index)
     
-    # Find HTML sections with class= (not className=)
-    # Pattern: <!-- comment --> followed by <section class= or <div class=
-    html_section_pattern = r'(<!--[^>]*?-->)?\s*<(section|div)[^>]*class\s*=[^>]*>.*?</\2>'
+    if not html_sections:
+        return content, False
     
-    matches = list(re.finditer(html_section_pattern, component_content, re.DOTALL | re.IGNORECASE))
+    # Remove HTML sections from component
+    pieces = []
+    last = component_start
+    for section in html_sections:
+        pieces.append(content[last:section['start']])
+        last = section['end']
+    pieces.append(content[last:component_end])
+    new_component = ''.join(pieces)
     
-    for match in matches:
-        sections.append({
-            'start': return_match.end() + match.start(),
-            'end': return_match.end() + match.end(),
-            'content': match.group(0)
-        })
+    # Convert removed sections to JSX and add before closing tag
+    jsx_sections = []
+    for section in html_sections:
+        html_section = section['content']
+        jsx_section = convert_html_to_jsx(html_section)
+        # Add as comment if it was a comment
+        if html_section.strip().startswith('<!--'):
+            jsx_section = '{/* ' + html_section.replace('<!--', '').replace('-->', '').strip() + ' */}\n                    ' + jsx_section
+        jsx_sections.append(jsx_section)
     
-    return sections
+    # Find closing tag of main div
+    closing_div = re.search(r'</div>\s*\)\s*;', new_component)
+    if closing_div:
+        # Insert JSX sections before closing div
+        insert_pos = closing_div.start()
+        new_component = new_component[:insert_pos] + '\n                    ' + '\n                    '.join(jsx_sections) + '\n                    ' + new_component[insert_pos:]
+    else:
+        # Add before closing parenthesis
+        closing_paren = new_component.rfind(')')
+        if closing_paren > 0:
+            new_component = new_component[:closing_paren] + '\n                    ' + '\n                    '.join(jsx_sections) + '\n                    ' + new_component[closing_paren:]
+    
+    # Reconstruct file
+    return content[:component_start] + new_component + content[component_end:], True
 
 def fix_react_file(file_path):
     """Fix React file with mixed structure"""
@@ -75,93 +112,28 @@ def fix_react_file(file_path):
         with open(file_path, 'r', encoding='utf-8') as f:
             content = f.read()
         
-        if 'type="text/babel"' not in content:
-            return False
-        
-        # Check if file has mixed structure
-        if not re.search(r'class\s*=', content):
-            return False  # No HTML with class= found
-        
-        # Find React component return statement
-        return_match = re.search(r'return\s*\(', content)
-        if not return_match:
-            return False
-        
-        # Find where component ends
-        component_end_patterns = [
-            r'\)\s*;\s*}\s*;\s*const\s+root',
-            r'\)\s*;\s*}\s*;\s*ReactDOM',
-        ]
-        
-        component_end = None
-        for pattern in component_end_patterns:
-            match = re.search(pattern, content)
-            if match:
-                component_end = match.start()
-                break
-        
-        if not component_end:
+        if not is_babel_file(content):
             return False
         
-        # Extract component content
-        component_start = return_match.end()
-        component_content = content[component_start:component_end]
-        
-        # Find HTML sections with class= inside component
-        html_sections = []
-        pattern = r'(<!--[^>]*?-->)?\s*<(section|div)[^>]*class\s*=[^>]*>.*?</\2>'
-        
-        for match in re.finditer(pattern, component_content, re.DOTALL | re.IGNORECASE):
-            html_sections.append(match)
-        
-        if not html_sections:
+        new_content, changed = fix_mixed_component(content)
+        if not changed:
             return False
         
-        # Remove HTML sections from component
-        new_component = component_content
-        offset = 0
-        for match in reversed(html_sections):
-            start = match.start() + offset
-            end = match.end() + offset
-            new_component = new_component[:start] + new_component[end:]
-            offset -= (end - start)
-        
-        # Convert removed sections to JSX and add before closing tag
-        jsx_sections = []
-        for match in html_sections:
-            html_section = match.group(0)
-            jsx_section = convert_html_to_jsx(html_section)
-            # Add as comment if it was a comment
-            if html_section.strip().startswith('<!--'):
-                jsx_section = '{/* ' + html_section.replace('<!--', '').replace('-->', '').strip() + ' */}\n                    ' + jsx_section
-            jsx_sections.append(jsx_section)
-        
-        # Find closing tag of main div
-        closing_div = re.search(r'</div>\s*\)\s*;', new_component)
-        if closing_div:
-            # Insert JSX sections before closing div
-            insert_pos = closing_div.start()
-            new_component = new_component[:insert_pos] + '\n                    ' + '\n                    '.join(jsx_sections) + '\n                    ' + new_component[insert_pos:]
-        else:
-            # Add before closing parenthesis
-            closing_paren = new_component.rfind(')')
-            if closing_paren > 0:
-                new_component = new_component[:closing_paren] + '\n                    ' + '\n                    '.join(jsx_sections) + '\n                    ' + new_component[closing_paren:]
-        
-        # Reconstruct file
-        new_content = content[:component_start] + new_component + content[component_end:]
-        
-        with open(file_path, 'w', encoding='utf-8') as f:
-            f.write(new_content)
+        write_text(file_path, new_content)
         
         return True
     except Exception as e:
         print(f"Error processing {file_path.name}: {str(e)}")
         return False
 
-def main():
+@journaled('fix_all_mixed_files')
+def main(argv=None):
     """Main function"""
-    lp_dir = Path('/www/wwwroot/portfolio.irvandoda.my.id/LP')
+    parser = add_dry_run_argument(add_jobs_argument(argparse.ArgumentParser(description='Fix React files with mixed HTML/JSX structure')))
+    args = parser.parse_args(argv)
+    set_dry_run(args.dry_run)
+    
+    lp_dir = LP_DIR
     
     if not lp_dir.exists():
         print(f"❌ Directory not found: {lp_dir}")
@@ -206,19 +178,23 @@ def main():
     
     print(f"🔧 Fixing {len(broken_files)} React files with mixed structure...\n")
     
+    existing = [lp_dir / filename for filename in broken_files if (lp_dir / filename).exists()]
+    results = {task.path.name: task for task in run_tasks(fix_react_file, existing, args.jobs)}
+    
     fixed = 0
     for filename in broken_files:
-        file_path = lp_dir / filename
-        if file_path.exists():
-            if fix_react_file(file_path):
-                print(f"✅ Fixed {filename}")
-                fixed += 1
-            else:
-                print(f"⚠️  {filename} - No changes needed or error")
-        else:
+        task = results.get(filename)
+        if task is None:
             print(f"❌ {filename} - File not found")
+            continue
+        print_task_output(task)
+        if task.value:
+            print(f"✅ {dry_run_verb('Fixed', 'Would fix')} {filename}")
+            fixed += 1
+        else:
+            print(f"⚠️  {filename} - No changes needed or error")
     
-    print(f"\n✨ Fixed {fixed}/{len(broken_files)} files")
+    print(f"\n✨ {dry_run_verb('Fixed', 'Would fix')} {fixed}/{len(broken_files)} files")
 
 if __name__ == '__main__':
     main()
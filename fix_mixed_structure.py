@@ -3,8 +3,13 @@
 Fix React files that have mixed HTML (class) and JSX (className) structure
 This will convert HTML sections to JSX and move them inside React component
 """
+import argparse
 import re
-from pathlib import Path
+
+from jsx_index import build_index
+from lp_io import add_dry_run_argument, dry_run_verb, set_dry_run, write_text
+from lp_journal import journaled
+from lp_scanner import LP_DIR, is_babel_file
 
 def convert_html_to_jsx(html_content):
     """Convert HTML attributes to JSX"""
@@ -16,62 +21,63 @@ def convert_html_to_jsx(html_content):
     jsx = re.sub(r'<(\w+)([^>]*?)(?<!/)>', r'<\1\2 />', jsx)
     return jsx
 
+def convert_mixed_component(content, index=None):
+    """Convert class= markup in the React component to JSX; returns (content, changed)"""
+    # Find the React component body
+    if index is None:
+        index = build_index(content)
+    if not index.has_component:
+        return content, False
+    
+    # Extract the component content
+    component_start, component_end = index.body_start, index.body_end
+    component_content = content[component_start:component_end]
+    
+    # Find HTML sections with class= that are outside JSX
+    # Look for sections that start with <!-- and have class=
+    
+    # Pattern to find HTML sections: <!-- Section --> followed by <section class=
+    pattern = r'(<!--\s*[^>]*?-->\s*)?<section[^>]*class\s*=[^>]*>.*?</section>'
+    matches = list(re.finditer(pattern, component_content, re.DOTALL | re.IGNORECASE))
+    
+    if not matches:
+        # Try finding any HTML with class= inside component
+        pattern2 = r'<[^>]+class\s*=[^>]*>'
+        if re.search(pattern2, component_content):
+            # This file has mixed structure
+            # We need to convert all class= to className= in the component
+            fixed_component = convert_html_to_jsx(component_content)
+            return content[:component_start] + fixed_component + content[component_end:], True
+    
+    return content, False
+
 def fix_react_file(file_path):
     """Fix React file with mixed structure"""
     try:
         with open(file_path, 'r', encoding='utf-8') as f:
             content = f.read()
         
-        if 'type="text/babel"' not in content:
-            return False
-        
-        # Find the React component return statement
-        return_match = re.search(r'return\s*\(', content)
-        if not return_match:
-            return False
-        
-        # Find where the component ends (before closing );)
-        component_end = re.search(r'\)\s*;\s*}\s*;\s*const\s+root', content)
-        if not component_end:
-            # Try alternative pattern
-            component_end = re.search(r'\)\s*;\s*}\s*;\s*ReactDOM', content)
-        
-        if not component_end:
+        if not is_babel_file(content):
             return False
         
-        # Extract the component content
-        component_start = return_match.end()
-        component_content = content[component_start:component_end.start()]
-        
-        # Find HTML sections with class= that are outside JSX
-        # Look for sections that start with <!-- and have class=
-        html_sections = []
-        
-        # Pattern to find HTML sections: <!-- Section --> followed by <section class=
-        pattern = r'(<!--\s*[^>]*?-->\s*)?<section[^>]*class\s*=[^>]*>.*?</section>'
-        matches = list(re.finditer(pattern, component_content, re.DOTALL | re.IGNORECASE))
-        
-        if not matches:
-            # Try finding any HTML with class= inside component
-            pattern2 = r'<[^>]+class\s*=[^>]*>'
-            if re.search(pattern2, component_content):
-                # This file has mixed structure
-                # We need to convert all class= to className= in the component
-                fixed_component = convert_html_to_jsx(component_content)
-                new_content = content[:component_start] + fixed_component + content[component_end.start():]
-                
-                with open(file_path, 'w', encoding='utf-8') as f:
-                    f.write(new_content)
-                return True
+        new_content, changed = convert_mixed_component(content)
+        if changed:
+            write_text(file_path, new_content)
+            return True
         
         return False
     except Exception as e:
         print(f"Error processing {file_path.name}: {str(e)}")
         return False
 
-def main():
+@journaled('fix_mixed_structure')
+def main(argv=None):
     """Main function"""
-    lp_dir = Path('/www/wwwroot/portfolio.irvandoda.my.id/LP')
+    parser = add_dry_run_argument(argparse.ArgumentParser(description='Fix React files with mixed HTML/JSX structure'))
+    args = parser.parse_args(argv)
+    set_dry_run(args.dry_run)
+    
+    lp_dir = LP_DIR
     
     # Files that definitely need fixing
     priority_files = ['fotografer.html', 'desaingrafis.html']
@@ -83,12 +89,12 @@ def main():
         file_path = lp_dir / filename
         if file_path.exists():
             if fix_react_file(file_path):
-                print(f"✅ Fixed {filename}")
+                print(f"✅ {dry_run_verb('Fixed', 'Would fix')} {filename}")
                 fixed += 1
             else:
                 print(f"⚠️  {filename} needs manual fix")
     
-    print(f"\n✨ Fixed {fixed} files")
+    print(f"\n✨ {dry_run_verb('Fixed', 'Would fix')} {fixed} files")
     print("\nNote: Other files may also need fixing. Consider rebuilding them.")
 
 if __name__ == '__main__':
@@ -1,6 +1,10 @@
 #!/usr/bin/env python3
+import argparse
 import re
-from pathlib import Path
+
+from lp_io import add_dry_run_argument, dry_run_verb, set_dry_run, write_text
+from lp_journal import journaled
+from lp_scanner import LP_DIR, is_react_file, scan_directory
 
 CREDIT_FOOTER_REACT = '''                            {/* Credit Footer */}
                             <div className="border-t border-gray-200/30 mt-8 pt-8">
@@ -33,15 +37,12 @@ CREDIT_FOOTER_REACT = '''                            {/* Credit Footer */}
                                 </div>
                             </div>'''
 
-def is_react_file(content):
-    """Check if file uses React"""
-    return 'type="text/babel"' in content or 'ReactDOM.createRoot' in content
-
-def fix_react_credit(file_path):
+def fix_react_credit(file_path, content=None):
     """Fix credit footer placement in React files"""
     try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            content = f.read()
+        if content is None:
+            with open(file_path, 'r', encoding='utf-8') as f:
+                content = f.read()
         
         if not is_react_file(content):
             return False
@@ -75,9 +76,8 @@ def fix_react_credit(file_path):
                         content,
                         count=1
                     )
-                    with open(file_path, 'w', encoding='utf-8') as f:
-                        f.write(content)
-                    print(f"✅ Fixed credit in {file_path.name}")
+                    write_text(file_path, content)
+                    print(f"✅ {dry_run_verb('Fixed', 'Would fix')} credit in {file_path.name}")
                     return True
         else:
             # Credit doesn't exist, add it
@@ -89,9 +89,8 @@ def fix_react_credit(file_path):
                     content,
                     count=1
                 )
-                with open(file_path, 'w', encoding='utf-8') as f:
-                    f.write(content)
-                print(f"✅ Added credit to {file_path.name}")
+                write_text(file_path, content)
+                print(f"✅ {dry_run_verb('Added', 'Would add')} credit to {file_path.name}")
                 return True
         
         return False
@@ -99,26 +98,31 @@ def fix_react_credit(file_path):
         print(f"❌ Error processing {file_path.name}: {str(e)}")
         return False
 
-def main():
+@journaled('fix_react_credits')
+def main(argv=None):
     """Main function"""
-    lp_dir = Path('/www/wwwroot/portfolio.irvandoda.my.id/LP')
+    parser = add_dry_run_argument(argparse.ArgumentParser(description='Move credit footers inside React components'))
+    args = parser.parse_args(argv)
+    set_dry_run(args.dry_run)
+    
+    lp_dir = LP_DIR
     
     if not lp_dir.exists():
         print(f"❌ Directory not found: {lp_dir}")
         return
     
-    html_files = [f for f in lp_dir.glob('*.html') if is_react_file(f.read_text(encoding='utf-8'))]
-    total = len(html_files)
+    react_files = [result for result in scan_directory(lp_dir) if result.is_react]
+    total = len(react_files)
     success = 0
     
     print(f"📁 Found {total} React HTML files")
     print("🔧 Fixing credit footer placement...\n")
     
-    for html_file in html_files:
-        if fix_react_credit(html_file):
+    for result in react_files:
+        if fix_react_credit(result.path, result.content):
             success += 1
     
-    print(f"\n✨ Done! Fixed {success}/{total} React files")
+    print(f"\n✨ Done! {dry_run_verb('Fixed', 'Would fix')} {success}/{total} React files")
 
 if __name__ == '__main__':
     main()
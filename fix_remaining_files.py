@@ -2,38 +2,13 @@
 """
 Fix remaining files that need Hero section or proper navigation
 """
+import argparse
 import re
-from pathlib import Path
 
-def has_hero_section(content):
-    """Check if file has hero section"""
-    # Check for various hero patterns
-    patterns = [
-        r'hero|Hero',
-        r'id=["\']home|id=["\']beranda',
-        r'<header|<section[^>]*hero',
-        r'className.*hero|class.*hero',
-        r'py-20.*header|py-24.*header',
-        r'flex.*items-center.*justify-center.*h-screen',
-        r'pt-32|pt-48|pt-20.*pb-20'
-    ]
-    for pattern in patterns:
-        if re.search(pattern, content, re.IGNORECASE):
-            return True
-    return False
-
-def has_navigation(content):
-    """Check if file has navigation"""
-    patterns = [
-        r'<nav',
-        r'Navigation|navigation',
-        r'className.*nav|class.*nav',
-        r'sticky.*top-0|fixed.*top-0'
-    ]
-    for pattern in patterns:
-        if re.search(pattern, content, re.IGNORECASE):
-            return True
-    return False
+from edit_plan import EditPlan
+from lp_io import add_dry_run_argument, dry_run_verb, set_dry_run, write_text
+from lp_journal import journaled
+from lp_scanner import LP_DIR, has_navigation, is_react_file
 
 def add_navigation_to_react_file(file_path):
     """Add navigation to React file that doesn't have it"""
@@ -45,7 +20,7 @@ def add_navigation_to_react_file(file_path):
             return False
         
         # Check if it's a React file
-        if 'type="text/babel"' not in content and 'ReactDOM' not in content:
+        if not is_react_file(content):
             return False
         
         # Find where to insert nav (after opening body or root div)
@@ -68,11 +43,10 @@ def add_navigation_to_react_file(file_path):
         pattern = r'(<div className="min-h-screen|<div className="min-h-screen flex)'
         match = re.search(pattern, content)
         if match:
-            insert_pos = match.end()
-            content = content[:insert_pos] + '\n' + nav_template + '\n                    ' + content[insert_pos:]
-            with open(file_path, 'w', encoding='utf-8') as f:
-                f.write(content)
-            print(f"✅ Added navigation to {file_path.name}")
+            plan = EditPlan().insert(match.end(), '\n' + nav_template + '\n                    ')
+            content = plan.apply(content)
+            write_text(file_path, content)
+            print(f"✅ {dry_run_verb('Added', 'Would add')} navigation to {file_path.name}")
             return True
         
         return False
@@ -80,9 +54,14 @@ def add_navigation_to_react_file(file_path):
         print(f"❌ Error processing {file_path.name}: {str(e)}")
         return False
 
-def main():
+@journaled('fix_remaining_files')
+def main(argv=None):
     """Main function"""
-    lp_dir = Path('/www/wwwroot/portfolio.irvandoda.my.id/LP')
+    parser = add_dry_run_argument(argparse.ArgumentParser(description='Add navigation to remaining React landing pages'))
+    args = parser.parse_args(argv)
+    set_dry_run(args.dry_run)
+    
+    lp_dir = LP_DIR
     
     if not lp_dir.exists():
         print(f"❌ Directory not found: {lp_dir}")
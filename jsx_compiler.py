@@ -0,0 +1,351 @@
+#!/usr/bin/env python3
+"""
+Compile the JSX subset used by the landing pages to React.createElement calls.
+JavaScript outside JSX is copied through untouched; JSX elements, fragments,
+attributes, spreads and text children are rewritten the way Babel's classic
+runtime does. Anything Babel would reject raises JsxCompileError with the
+offset of the problem instead of producing half-compiled output.
+"""
+import html
+import json
+import re
+
+from jsx_index import EXPRESSION_PREFIX
+
+_JS_TOKEN_RE = re.compile(r'[\'"`/(){}\[\]<]')
+_JSX_CHILD_RE = re.compile(r'[<{}>]')
+_TAG_NAME_RE = re.compile(r'[A-Za-z_$][\w$.:-]*')
+# What may follow "<" for it to open an element or fragment
+_TAG_START_RE = re.compile(r'[A-Za-z_$>]')
+_CLOSING_TAG_RE = re.compile(r'</\s*([A-Za-z_$][\w$.:-]*)?\s*>')
+_ATTR_NAME_RE = re.compile(r'[A-Za-z_$][\w$:-]*')
+_IDENT_RE = re.compile(r'[A-Za-z_$][\w$]*')
+_IDENT_CHAR_RE = re.compile(r'[\w$]')
+_EMPTY_EXPRESSION_RE = re.compile(r'\s*(?:/\*.*?\*/\s*|//[^\n]*(?:\n\s*|$))*', re.DOTALL)
+_LINE_SPLIT_RE = re.compile(r'\r\n|\n|\r')
+
+_CLOSERS = {'(': ')', '[': ']', '{': '}'}
+
+
+class JsxCompileError(ValueError):
+    """JSX that Babel would refuse to compile"""
+
+    def __init__(self, message, offset):
+        super().__init__(message)
+        self.offset = offset
+
+    def location(self, text):
+        """1-based (line, column) of the error in text"""
+        line = text.count('\n', 0, self.offset) + 1
+        column = self.offset - (text.rfind('\n', 0, self.offset) + 1) + 1
+        return line, column
+
+
+def js_string(value):
+    """JS string literal for value, safe to embed in an inline <script>"""
+    return json.dumps(value, ensure_ascii=False).replace('</', '<\\/')
+
+def clean_jsx_text(text):
+    """Collapse JSX text the way Babel does; None if nothing is left"""
+    collapsed = collapse_jsx_text(text)
+    return html.unescape(collapsed) if collapsed else None
+
+def collapse_jsx_text(text):
+    """Babel's JSX text whitespace rules applied to the source ('' if nothing is left)
+
+    The result is a single line, so it means the same JSX text as the input.
+    """
+    lines = _LINE_SPLIT_RE.split(text)
+    last_non_empty = max((i for i, line in enumerate(lines) if line.strip(' \t')), default=-1)
+    result = []
+    for i, line in enumerate(lines):
+        line = line.replace('\t', ' ')
+        if i != 0:
+            line = line.lstrip(' ')
+        if i != len(lines) - 1:
+            line = line.rstrip(' ')
+        if line:
+            if i != last_non_empty:
+                line += ' '
+            result.append(line)
+    return ''.join(result)
+
+
+class _Compiler:
+    """Recursive-descent JSX compiler over one script body"""
+
+    def __init__(self, text, start, end):
+        self.text = text
+        self.start = start
+        self.end = end
+
+    def error(self, message, offset):
+        raise JsxCompileError(message, offset)
+
+    def prev_token(self, i):
+        """Previous significant token before i (identifier word or single char)"""
+        text = self.text
+        j = i - 1
+        while j >= self.start and text[j].isspace():
+            j -= 1
+        if j < self.start:
+            return None
+        if _IDENT_CHAR_RE.match(text[j]):
+            k = j
+            while k > self.start and _IDENT_CHAR_RE.match(text[k - 1]):
+                k -= 1
+            return text[k:j + 1]
+        return text[j]
+
+    def skip_string(self, i):
+        quote = self.text[i]
+        j = i + 1
+        while j < self.end:
+            ch = self.text[j]
+            if ch == '\\':
+                j += 2
+                continue
+            if ch == quote:
+                return j + 1
+            if ch == '\n':
+                break
+            j += 1
+        self.error("Unterminated string literal", i)
+
+    def skip_regex(self, i):
+        j = i + 1
+        in_class = False
+        while j < self.end:
+            ch = self.text[j]
+            if ch == '\\':
+                j += 2
+                continue
+            if ch == '\n':
+                break
+            if in_class:
+                in_class = ch != ']'
+            elif ch == '[':
+                in_class = True
+            elif ch == '/':
+                return j + 1
+            j += 1
+        self.error("Unterminated regular expression", i)
+
+    def skip_comment(self, i, closer):
+        j = self.text.find(closer, i + 2, self.end)
+        if j == -1:
+            if closer == '\n':
+                return self.end
+            self.error("Unterminated comment", i)
+        return j + len(closer)
+
+    def compile_template(self, i):
+        """Copy a template literal, compiling JSX inside ${...}"""
+        text = self.text
+        pieces = []
+        j = i + 1
+        pos = i
+        while j < self.end:
+            ch = text[j]
+            if ch == '\\':
+                j += 2
+                continue
+            if ch == '`':
+                pieces.append(text[pos:j + 1])
+                return ''.join(pieces), j + 1
+            if text.startswith('${', j):
+                pieces.append(text[pos:j + 2])
+                code, close = self.compile_js(j + 2, '}')
+                pieces.append(code)
+                pos = j = close
+                continue
+            j += 1
+        self.error("Unterminated template literal", i)
+
+    def compile_js(self, i, closer=None):
+        """Compile JS from i up to the matching closer
+
+        Returns (code, offset of the closer) - or of the end of the script
+        when closer is None.
+        """
+        text = self.text
+        pieces = []
+        opened_at = i - 1
+        while i < self.end:
+            m = _JS_TOKEN_RE.search(text, i, self.end)
+            if not m:
+                break
+            j = m.start()
+            ch = text[j]
+            pieces.append(text[i:j])
+            if ch in '\'"':
+                i = self.skip_string(j)
+                pieces.append(text[j:i])
+            elif ch == '`':
+                code, i = self.compile_template(j)
+                pieces.append(code)
+            elif ch == '/':
+                nxt = text[j + 1:j + 2]
+                if nxt == '/':
+                    i = self.skip_comment(j, '\n')
+                elif nxt == '*':
+                    i = self.skip_comment(j, '*/')
+                elif self.prev_token(j) in EXPRESSION_PREFIX:
+                    i = self.skip_regex(j)
+                else:
+                    i = j + 1
+                pieces.append(text[j:i])
+            elif ch in _CLOSERS:
+                code, close = self.compile_js(j + 1, _CLOSERS[ch])
+                pieces.append(ch + code + _CLOSERS[ch])
+                i = close + 1
+            elif ch in ')]}':
+                if ch != closer:
+                    self.error(f"Unexpected '{ch}'", j)
+                return ''.join(pieces), j
+            else:
+                if _TAG_START_RE.match(text, j + 1) and self.prev_token(j) in EXPRESSION_PREFIX:
+                    code, i = self.compile_element(j)
+                    pieces.append(code)
+                else:
+                    pieces.append(ch)
+                    i = j + 1
+        if closer is not None:
+            self.error(f"Unclosed '{text[opened_at]}'", opened_at)
+        pieces.append(text[i:self.end])
+        return ''.join(pieces), self.end
+
+    def compile_attributes(self, i, tag_start):
+        """Compile attributes from i; returns (props code, offset, self_closing)"""
+        text = self.text
+        props = []
+        while i < self.end:
+            ch = text[i]
+            if ch.isspace():
+                i += 1
+            elif text.startswith('/>', i):
+                return props, i + 2, True
+            elif ch == '>':
+                return props, i + 1, False
+            elif ch == '{':
+                code, close = self.compile_js(i + 1, '}')
+                if not code.strip().startswith('...'):
+                    self.error("Expected '...' in JSX spread attribute", i)
+                props.append(code.strip())
+                i = close + 1
+            else:
+                m = _ATTR_NAME_RE.match(text, i)
+                if not m:
+                    self.error(f"Unexpected '{ch}' in tag", i)
+                name = m.group(0)
+                key = name if _IDENT_RE.fullmatch(name) else js_string(name)
+                i = m.end()
+                while i < self.end and text[i].isspace():
+                    i += 1
+                if i >= self.end or text[i] != '=':
+                    props.append(f'{key}: true')
+                    continue
+                i += 1
+                while i < self.end and text[i].isspace():
+                    i += 1
+                if i < self.end and text[i] in '"\'':
+                    close = text.find(text[i], i + 1, self.end)
+                    if close == -1:
+                        self.error("Unterminated attribute string", i)
+                    props.append(f'{key}: {js_string(html.unescape(text[i + 1:close]))}')
+                    i = close + 1
+                elif i < self.end and text[i] == '{':
+                    code, close = self.compile_js(i + 1, '}')
+                    if _EMPTY_EXPRESSION_RE.fullmatch(code):
+                        self.error("JSX attributes must only be assigned a non-empty expression", i)
+                    props.append(f'{key}: {code.strip()}')
+                    i = close + 1
+                else:
+                    self.error(f"Invalid value for attribute {name}", i)
+        self.error("Unterminated JSX tag", tag_start)
+
+    def compile_children(self, i, tag, tag_start):
+        """Compile children up to the closing tag; returns (children, offset after it)"""
+        text = self.text
+        children = []
+        while i < self.end:
+            m = _JSX_CHILD_RE.search(text, i, self.end)
+            if not m:
+                break
+            j = m.start()
+            child_text = clean_jsx_text(text[i:j])
+            if child_text is not None:
+                children.append(js_string(child_text))
+            ch = text[j]
+            if ch in '}>':
+                self.error(f"Unexpected '{ch}' in JSX text, use {{'{ch}'}}", j)
+            if ch == '{':
+                code, close = self.compile_js(j + 1, '}')
+                if not _EMPTY_EXPRESSION_RE.fullmatch(code):
+                    children.append(code.strip())
+                i = close + 1
+            elif text.startswith('<!--', j):
+                self.error("HTML comment inside JSX", j)
+            elif text.startswith('</', j):
+                closing = _CLOSING_TAG_RE.match(text, j)
+                if closing is None:
+                    self.error("Malformed closing tag", j)
+                name = closing.group(1) or ''
+                if name != tag:
+                    expected = f'</{tag}>' if tag else '</>'
+                    self.error(f"Expected {expected} to close tag at {tag_start}, found {closing.group(0)}", j)
+                return children, closing.end()
+            else:
+                if not _TAG_START_RE.match(text, j + 1):
+                    self.error("Unexpected '<' in JSX text", j)
+                code, i = self.compile_element(j)
+                children.append(code)
+        self.error(f"Unclosed <{tag}>", tag_start)
+
+    def compile_element(self, i):
+        """Compile one JSX element at "<"; returns (code, offset after it)"""
+        text = self.text
+        if text.startswith('<>', i):
+            children, end = self.compile_children(i + 2, '', i)
+            return self.create_element('React.Fragment', [], children), end
+
+        m = _TAG_NAME_RE.match(text, i + 1)
+        if m is None:
+            self.error("Unexpected '<' in JSX text", i)
+        tag = m.group(0)
+        if '.' not in tag and (tag[0].islower() or '-' in tag or ':' in tag):
+            element_type = js_string(tag)
+        else:
+            element_type = tag
+        props, j, self_closing = self.compile_attributes(m.end(), i)
+        if self_closing:
+            return self.create_element(element_type, props, []), j
+        children, end = self.compile_children(j, tag, i)
+        return self.create_element(element_type, props, children), end
+
+    @staticmethod
+    def create_element(element_type, props, children):
+        args = [element_type, '{' + ', '.join(props) + '}' if props else 'null'] + children
+        return f"React.createElement({', '.join(args)})"
+
+
+def compile_jsx(text, start=0, end=None):
+    """Compile text[start:end] to plain JavaScript
+
+    Raises JsxCompileError for JSX that does not parse.
+    """
+    end = len(text) if end is None else end
+    code, _ = _Compiler(text, start, end).compile_js(start)
+    return code
+
+
+if __name__ == '__main__':
+    import sys
+
+    source = sys.stdin.read()
+    try:
+        print(compile_jsx(source))
+    except JsxCompileError as e:
+        line, column = e.location(source)
+        print(f"❌ {line}:{column}: {e}", file=sys.stderr)
+        sys.exit(1)
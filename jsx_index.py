@@ -0,0 +1,454 @@
+#!/usr/bin/env python3
+"""
+Offset index of the React component inside a text/babel landing page.
+A small JS/JSX tokenizer balances brackets and quotes once per file and
+records the component body, JSX element spans, comments and strings so
+fixers can query offsets instead of re-running regex hunts.
+"""
+import re
+from bisect import bisect_right
+from dataclasses import dataclass, field
+from typing import List, Optional, Tuple
+
+_BABEL_SCRIPT_RE = re.compile(r'<script[^>]*type=["\']text/babel["\'][^>]*>', re.IGNORECASE)
+_SCRIPT_CLOSE_RE = re.compile(r'</script\s*>', re.IGNORECASE)
+
+_JS_TOKEN_RE = re.compile(r'</script|[\'"`/(){}\[\]<]', re.IGNORECASE)
+_JSX_CHILD_RE = re.compile(r'[<{]')
+_TAG_NAME_RE = re.compile(r'[A-Za-z][\w.:-]*')
+# What may follow "<" for it to open an element or fragment
+_TAG_START_RE = re.compile(r'[A-Za-z>]')
+_CLOSING_TAG_RE = re.compile(r'</\s*([\w.:-]*)\s*>')
+_ATTR_NAME_RE = re.compile(r'[^\s=/>{}"\']+')
+_IDENT_CHAR_RE = re.compile(r'[\w$]')
+
+# Old-style component end, kept as a fallback for markup the tokenizer can't balance
+_COMPONENT_END_RE = re.compile(r'\)\s*;\s*}\s*;\s*(const\s+root|ReactDOM)')
+_ROOT_TAIL_RE = re.compile(r'\)\s*;?\s*}\s*;?\s*(?:const\s+root|ReactDOM)')
+_RETURN_PAREN_RE = re.compile(r'return\s*\(')
+
+# Tokens after which "<" starts JSX and "/" starts a regex literal
+EXPRESSION_PREFIX = set('(,=:?[{};!&|+-*%~^<>') | {None, 'return', 'yield', 'typeof', 'case', 'default', 'else', 'in', 'of', 'await'}
+
+# HTML void tags, tolerated without "/>" because mixed pages contain raw HTML
+_VOID_TAGS = {'area', 'base', 'br', 'col', 'embed', 'hr', 'img', 'input', 'link', 'meta', 'source', 'track', 'wbr'}
+
+_CLOSERS = {'(': ')', '[': ']', '{': '}'}
+
+
+@dataclass
+class JsxElement:
+    """A JSX element span; end is exclusive"""
+    tag: str
+    start: int
+    end: int
+    depth: int
+    self_closing: bool = False
+
+
+@dataclass
+class JsxIndex:
+    """Offsets of everything the fixers look for in one file"""
+    script_start: int = 0
+    script_end: int = 0
+    body_start: Optional[int] = None
+    body_end: Optional[int] = None
+    returns: List[Tuple[int, int]] = field(default_factory=list)
+    elements: List[JsxElement] = field(default_factory=list)
+    comments: List[Tuple[int, int]] = field(default_factory=list)
+    strings: List[Tuple[int, int]] = field(default_factory=list)
+    texts: List[Tuple[int, int]] = field(default_factory=list)
+    balanced: bool = True
+
+    @property
+    def has_component(self):
+        return self.body_start is not None
+
+    def body(self, content):
+        """Text between "return (" and its closing parenthesis"""
+        if not self.has_component:
+            return ''
+        return content[self.body_start:self.body_end]
+
+    def in_comment(self, pos):
+        return _in_spans(self.comments, pos)
+
+    def in_string(self, pos):
+        return _in_spans(self.strings, pos)
+
+    def is_code(self, pos):
+        """True if pos is neither inside a comment nor a string literal"""
+        return not self.in_comment(pos) and not self.in_string(pos)
+
+    def elements_in(self, start, end, tag=None):
+        """Elements fully contained in [start, end)"""
+        return [
+            element for element in self.elements
+            if element.start >= start and element.end <= end and (tag is None or element.tag == tag)
+        ]
+
+    def body_elements(self, tag=None):
+        if not self.has_component:
+            return []
+        return self.elements_in(self.body_start, self.body_end, tag)
+
+
+def _in_spans(spans, pos):
+    i = bisect_right(spans, (pos, float('inf'))) - 1
+    return i >= 0 and spans[i][0] <= pos < spans[i][1]
+
+
+class _Tokenizer:
+    """Single forward pass over a script, recording spans as it goes"""
+
+    def __init__(self, text, start, end):
+        self.text = text
+        self.end = end
+        self.start = start
+        self.returns = []
+        self.elements = []
+        self.comments = []
+        self.strings = []
+        self.texts = []
+        self.stack = []
+        self.balanced = True
+
+    def prev_token(self, i):
+        """Previous significant token before i (identifier word or single char)"""
+        text = self.text
+        j = i - 1
+        while j >= self.start and text[j].isspace():
+            j -= 1
+        if j < self.start:
+            return None
+        if _IDENT_CHAR_RE.match(text[j]):
+            k = j
+            while k > self.start and _IDENT_CHAR_RE.match(text[k - 1]):
+                k -= 1
+            return text[k:j + 1]
+        return text[j]
+
+    def skip_string(self, i):
+        quote = self.text[i]
+        j = i + 1
+        while j < self.end:
+            ch = self.text[j]
+            if ch == '\\':
+                j += 2
+                continue
+            if ch == quote or ch == '\n':
+                break
+            j += 1
+        j = min(j + 1, self.end)
+        self.strings.append((i, j))
+        return j
+
+    def _skip_template(self, i):
+        j = i + 1
+        text = self.text
+        while j < self.end:
+            ch = text[j]
+            if ch == '\\':
+                j += 2
+                continue
+            if ch == '`':
+                j += 1
+                break
+            if ch == '$' and text.startswith('${', j):
+                j = (yield self._scan_js(j + 2, '}')) + 1
+                continue
+            j += 1
+        j = min(j, self.end)
+        self.strings.append((i, j))
+        return j
+
+    def skip_regex(self, i):
+        j = i + 1
+        in_class = False
+        while j < self.end:
+            ch = self.text[j]
+            if ch == '\\':
+                j += 2
+                continue
+            if ch == '\n':
+                break
+            if in_class:
+                in_class = ch != ']'
+            elif ch == '[':
+                in_class = True
+            elif ch == '/':
+                j += 1
+                break
+            j += 1
+        self.strings.append((i, j))
+        return j
+
+    def skip_comment(self, i, opener, closer):
+        j = self.text.find(closer, i + len(opener), self.end)
+        j = self.end if j == -1 else j + len(closer)
+        self.comments.append((i, j))
+        return j
+
+    def scan_js(self, i, closer=None):
+        """Scan JS from i up to the matching closer; returns its offset
+
+        Nested scans are generators driven from an explicit stack, so deeply
+        nested markup or brackets can't exhaust Python's recursion limit.
+        """
+        stack = [self._scan_js(i, closer)]
+        value = None
+        while stack:
+            try:
+                call = stack[-1].send(value)
+            except StopIteration as done:
+                stack.pop()
+                value = done.value
+                continue
+            stack.append(call)
+            value = None
+        return value
+
+    def _scan_js(self, i, closer=None):
+        """Generator form of scan_js(); yields nested scans, returns the offset"""
+        text = self.text
+        # (opener offset, closer, opens a return) of brackets open inside this scan
+        groups = []
+        while i < self.end:
+            m = _JS_TOKEN_RE.search(text, i, self.end)
+            if not m:
+                break
+            j = m.start()
+            ch = text[j]
+            if m.group(0) != ch:
+                # </script> ends the block whatever the nesting
+                break
+            if ch in '\'"':
+                i = self.skip_string(j)
+            elif ch == '`':
+                i = yield from self._skip_template(j)
+            elif ch == '/':
+                nxt = text[j + 1:j + 2]
+                if nxt == '/':
+                    i = self.skip_comment(j, '//', '\n')
+                elif nxt == '*':
+                    i = self.skip_comment(j, '/*', '*/')
+                elif self.prev_token(j) in EXPRESSION_PREFIX:
+                    i = self.skip_regex(j)
+                else:
+                    i = j + 1
+            elif ch in _CLOSERS:
+                groups.append((j, _CLOSERS[ch], ch == '(' and self.prev_token(j) == 'return'))
+                i = j + 1
+            elif ch in ')]}':
+                if groups:
+                    start, expected, is_return = groups.pop()
+                    if ch != expected:
+                        # Mismatched bracket: close the innermost group here
+                        self.balanced = False
+                    if is_return:
+                        self.returns.append((start, j))
+                    i = j + 1
+                elif ch == closer:
+                    return j
+                elif closer is not None:
+                    # Mismatched bracket: close the current group here
+                    self.balanced = False
+                    return j
+                else:
+                    i = j + 1
+            elif ch == '<':
+                if _TAG_START_RE.match(text, j + 1) and self.prev_token(j) in EXPRESSION_PREFIX:
+                    i = yield self._scan_element(j)
+                else:
+                    i = j + 1
+        if groups or closer is not None:
+            self.balanced = False
+        for start, _, is_return in reversed(groups):
+            if is_return:
+                self.returns.append((start, self.end))
+        return self.end
+
+    def _scan_attributes(self, i):
+        """Scan tag attributes; returns (offset after tag, self_closing)"""
+        text = self.text
+        while i < self.end:
+            ch = text[i]
+            if ch.isspace():
+                i += 1
+            elif text.startswith('/>', i):
+                return i + 2, True
+            elif ch == '>':
+                return i + 1, False
+            elif ch == '{':
+                i = (yield self._scan_js(i + 1, '}')) + 1
+            elif ch in '"\'':
+                i = self.skip_string(i)
+            elif ch == '<':
+                # Broken tag, let the caller resync on the new one
+                self.balanced = False
+                return i, True
+            else:
+                m = _ATTR_NAME_RE.match(text, i)
+                i = m.end() if m else i + 1
+                while i < self.end and text[i].isspace():
+                    i += 1
+                if i < self.end and text[i] == '=':
+                    i += 1
+                    while i < self.end and text[i].isspace():
+                        i += 1
+                    if i < self.end and text[i] in '"\'':
+                        i = self.skip_string(i)
+                    elif i < self.end and text[i] == '{':
+                        i = (yield self._scan_js(i + 1, '}')) + 1
+        return self.end, True
+
+    def _scan_element(self, i):
+        """Scan one JSX element starting at "<"; returns offset after it"""
+        text = self.text
+        depth = len(self.stack)
+        if text.startswith('<>', i):
+            tag = ''
+            j = i + 2
+        else:
+            m = _TAG_NAME_RE.match(text, i + 1)
+            if m is None:
+                # Not a tag name: the "<" is text
+                self.balanced = False
+                return i + 1
+            tag = m.group(0)
+            j, self_closing = yield from self._scan_attributes(m.end())
+            if self_closing or tag.lower() in _VOID_TAGS:
+                self.elements.append(JsxElement(tag, i, j, depth, True))
+                return j
+
+        self.stack.append(tag)
+        try:
+            j = yield from self._scan_children(j, tag)
+        finally:
+            self.stack.pop()
+        self.elements.append(JsxElement(tag, i, j, depth))
+        return j
+
+    def _scan_children(self, i, tag):
+        """Scan element children up to and including the closing tag"""
+        text = self.text
+        while i < self.end:
+            m = _JSX_CHILD_RE.search(text, i, self.end)
+            if not m:
+                break
+            j = m.start()
+            if j > i:
+                self.texts.append((i, j))
+            if text[j] == '{':
+                if text.startswith('{/*', j):
+                    i = self.skip_comment(j, '{/*', '*/}')
+                else:
+                    i = (yield self._scan_js(j + 1, '}')) + 1
+            elif text.startswith('<!--', j):
+                i = self.skip_comment(j, '<!--', '-->')
+            elif text.startswith('</', j):
+                if text[j:j + 8].lower() == '</script':
+                    break
+                closing = _CLOSING_TAG_RE.match(text, j)
+                if closing is None:
+                    i = j + 2
+                    continue
+                name = closing.group(1)
+                if name == tag:
+                    return closing.end()
+                if name in self.stack:
+                    # Closes an ancestor: this element was left open
+                    self.balanced = False
+                    return j
+                # Stray closing tag, skip it
+                self.balanced = False
+                i = closing.end()
+            else:
+                if _TAG_START_RE.match(text, j + 1):
+                    i = yield self._scan_element(j)
+                else:
+                    if text[j + 1:j + 2].isalpha():
+                        # "<" before a letter no tag name starts with, e.g. "<ü"
+                        self.balanced = False
+                    i = j + 1
+        self.balanced = False
+        return self.end
+
+
+def iter_babel_scripts(content):
+    """(tag_start, body_start, body_end) of every text/babel script"""
+    pos = 0
+    while True:
+        m = _BABEL_SCRIPT_RE.search(content, pos)
+        if not m:
+            return
+        close = _SCRIPT_CLOSE_RE.search(content, m.end())
+        body_end = close.start() if close else len(content)
+        yield m.start(), m.end(), body_end
+        pos = close.end() if close else len(content)
+
+def _find_script(content):
+    """Offsets of the text/babel script body, or None for plain HTML pages"""
+    for _, start, end in iter_babel_scripts(content):
+        return start, end
+    return None
+
+
+def _fallback_component(content, start, end):
+    """Regex lookup of the component body, for markup that doesn't balance"""
+    for m in _RETURN_PAREN_RE.finditer(content, start, end):
+        # Skip "return () =>" cleanup functions in useEffect
+        if re.match(r'\s*\)\s*=>', content[m.end():m.end() + 20]):
+            continue
+        component_end = _COMPONENT_END_RE.search(content, m.end())
+        if component_end:
+            return m.end(), component_end.start()
+        return None
+    return None
+
+
+def tokenize_script(content, start, end):
+    """Index one script body without looking for the rendered component"""
+    tokenizer = _Tokenizer(content, start, end)
+    tokenizer.scan_js(start)
+    return JsxIndex(
+        script_start=start,
+        script_end=end,
+        returns=sorted(tokenizer.returns),
+        elements=sorted(tokenizer.elements, key=lambda e: (e.start, -e.end)),
+        comments=sorted(tokenizer.comments),
+        strings=sorted(tokenizer.strings),
+        texts=sorted(tokenizer.texts),
+        balanced=tokenizer.balanced,
+    )
+
+def build_index(content):
+    """Tokenize the React script of a page once and index its offsets"""
+    script = _find_script(content)
+    if script is None:
+        return JsxIndex()
+    start, end = script
+    index = tokenize_script(content, start, end)
+
+    # The rendered component is the "return (...)" right before the root render
+    for open_paren, close_paren in index.returns:
+        if close_paren < end and _ROOT_TAIL_RE.match(content, close_paren):
+            index.body_start, index.body_end = open_paren + 1, close_paren
+            break
+    else:
+        found = _fallback_component(content, start, end)
+        if found:
+            index.body_start, index.body_end = found
+    return index
+
+
+if __name__ == '__main__':
+    import sys
+    from pathlib import Path
+
+    for name in sys.argv[1:]:
+        text = Path(name).read_text(encoding='utf-8')
+        idx = build_index(text)
+        status = "✅" if idx.balanced else "⚠️"
+        print(f"{status} {Path(name).name}: body={idx.body_start}..{idx.body_end} "
+              f"elements={len(idx.elements)} comments={len(idx.comments)} strings={len(idx.strings)}")
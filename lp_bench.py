@@ -0,0 +1,204 @@
+#!/usr/bin/env python3
+"""
+Benchmark suite for the landing page detectors and fixers.
+Runs every detector and fixer over a synthetic corpus (see lp_corpus.py)
+and reports the total time, throughput and slowest page of each, so a
+backtracking pattern that blows up on large pages shows up next to the
+ones that scale. Results can be saved as a named baseline and later runs
+compared against it; a benchmark more than --threshold and at least
+--min-slowdown-ms slower than the baseline fails the run, so timer noise
+on millisecond-sized benchmarks can't. Everything runs offline on the Python stdlib.
+"""
+import argparse
+import fnmatch
+import json
+import platform
+import time
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Callable
+
+from add_credits import plan_credit
+from add_missing_sections import plan_missing_sections
+from clean_all_html import clean_react_component
+from fix_all_mixed_files import fix_mixed_component
+from fix_mixed_structure import convert_mixed_component
+from jsx_index import build_index
+from lp_corpus import CORPUS_VERSION, MAX_KB, SEED, corpus_dir, generate_corpus
+from lp_io import atomic_write
+from lp_perf import page_metrics
+from lp_scanner import DETECTORS, LP_DIR, has_mixed_structure, scan_content
+from remove_remaining_html import remove_html_from_react_component
+from tag_tree import build_tree
+
+BASELINE_DIR = LP_DIR.parent / '.lp_bench' / 'baselines'
+THRESHOLD = 0.25
+# Slowdowns below this are timer noise, whatever their relative size
+MIN_SLOWDOWN_MS = 5.0
+
+
+@dataclass
+class Benchmark:
+    """One timed function, called with the content of every page"""
+    name: str
+    group: str
+    func: Callable[[str], object]
+
+
+def default_benchmarks():
+    """Every detector of the scanner, the parsers and the content fixers"""
+    benchmarks = [Benchmark(f'detect:{detector.name}', 'detector', detector.search) for detector in DETECTORS]
+    benchmarks += [
+        Benchmark('detect:registry', 'detector', DETECTORS.scan),
+        Benchmark('detect:mixed_structure', 'detector', has_mixed_structure),
+        Benchmark('scan_content', 'detector', lambda content: scan_content('page.html', content)),
+        Benchmark('page_metrics', 'detector', page_metrics),
+        Benchmark('jsx_index', 'parser', build_index),
+        Benchmark('tag_tree', 'parser', build_tree),
+        Benchmark('clean_all_html', 'fixer', clean_react_component),
+        Benchmark('remove_remaining_html', 'fixer', remove_html_from_react_component),
+        Benchmark('fix_all_mixed_files', 'fixer', fix_mixed_component),
+        Benchmark('fix_mixed_structure', 'fixer', convert_mixed_component),
+        Benchmark('add_missing_sections', 'fixer', plan_missing_sections),
+        Benchmark('add_credits', 'fixer', plan_credit),
+    ]
+    return benchmarks
+
+def run_benchmarks(benchmarks, paths, repeat=3):
+    """({name: result}, corpus bytes) of timing every benchmark on every page
+
+    Each page is read once and every benchmark runs on it repeat times;
+    the fastest run counts, which filters out scheduler noise.
+    """
+    stats = {b.name: {'group': b.group, 'seconds': 0.0, 'slowest': 0.0, 'slowest_page': None, 'errors': 0}
+             for b in benchmarks}
+    total_bytes = 0
+    for path in paths:
+        with open(path, 'r', encoding='utf-8') as f:
+            content = f.read()
+        total_bytes += len(content.encode('utf-8'))
+        for benchmark in benchmarks:
+            best = None
+            for _ in range(repeat):
+                start = time.perf_counter()
+                try:
+                    benchmark.func(content)
+                except Exception:
+                    stats[benchmark.name]['errors'] += 1
+                    break
+                elapsed = time.perf_counter() - start
+                best = elapsed if best is None else min(best, elapsed)
+            if best is None:
+                continue
+            entry = stats[benchmark.name]
+            entry['seconds'] += best
+            if best > entry['slowest']:
+                entry['slowest'], entry['slowest_page'] = best, Path(path).name
+    for entry in stats.values():
+        entry['mb_per_s'] = total_bytes / entry['seconds'] / 1e6 if entry['seconds'] else None
+    return stats, total_bytes
+
+def compare(results, baseline, threshold=THRESHOLD, min_slowdown_ms=MIN_SLOWDOWN_MS):
+    """{name: relative change} against a baseline, plus the names that regressed
+
+    A regression is slower by more than threshold and by at least
+    min_slowdown_ms in total.
+    """
+    changes = {}
+    regressed = []
+    for name, entry in results.items():
+        old = baseline.get(name)
+        if not old or not old['seconds']:
+            continue
+        change = entry['seconds'] / old['seconds'] - 1
+        changes[name] = change
+        if change > threshold and (entry['seconds'] - old['seconds']) * 1000 >= min_slowdown_ms:
+            regressed.append(name)
+    return changes, regressed
+
+def print_results(results, changes=None, regressed=()):
+    """Table of benchmark results, with deltas when comparing"""
+    print(f"{'benchmark':<28} {'total':>10} {'MB/s':>8} {'slowest':>10}  page" + ('  vs baseline' if changes is not None else ''))
+    for name, entry in results.items():
+        rate = f"{entry['mb_per_s']:.1f}" if entry['mb_per_s'] else '-'
+        line = f"{name:<28} {entry['seconds']:>9.3f}s {rate:>8} {entry['slowest'] * 1000:>8.1f}ms  {entry['slowest_page'] or '-'}"
+        if entry['errors']:
+            line += f"  ({entry['errors']} errors)"
+        if changes is not None and name in changes:
+            mark = '❌' if name in regressed else '✅'
+            line += f"  {mark} {changes[name]:+.0%}"
+        print(line)
+
+def baseline_file(name):
+    return BASELINE_DIR / f'{name}.json'
+
+def main(argv=None):
+    """Main function"""
+    parser = argparse.ArgumentParser(description='Benchmark the landing page detectors and fixers on a synthetic corpus')
+    parser.add_argument('--pages', type=int, default=100, help='corpus size (default: 100; try 1000 or 10000)')
+    parser.add_argument('--max-kb', type=int, default=MAX_KB, help=f'largest page in KB (default: {MAX_KB})')
+    parser.add_argument('--seed', type=int, default=SEED, help=f'corpus seed (default: {SEED})')
+    parser.add_argument('--corpus', help='benchmark an existing directory of pages instead')
+    parser.add_argument('--repeat', type=int, default=3, help='runs per page, the fastest counts (default: 3)')
+    parser.add_argument('--only', action='append', metavar='PATTERN', help='only benchmarks matching this glob (repeatable)')
+    parser.add_argument('--save', metavar='NAME', help='save the results as baseline NAME')
+    parser.add_argument('--compare', metavar='NAME', help='compare with baseline NAME, failing on regressions')
+    parser.add_argument('--threshold', type=float, default=THRESHOLD, help=f'slowdown that counts as a regression (default: {THRESHOLD})')
+    parser.add_argument('--min-slowdown-ms', type=float, default=MIN_SLOWDOWN_MS, help=f'smallest total slowdown that counts as a regression (default: {MIN_SLOWDOWN_MS:g} ms)')
+    args = parser.parse_args(argv)
+
+    if args.corpus:
+        paths = sorted(Path(args.corpus).glob('*.html'))
+        corpus = {'dir': args.corpus}
+    else:
+        out_dir = corpus_dir(args.pages, args.max_kb, args.seed)
+        print(f"📁 Preparing corpus in {out_dir}...")
+        paths = generate_corpus(out_dir, args.pages, args.max_kb, args.seed)
+        corpus = {'version': CORPUS_VERSION, 'pages': args.pages, 'max_kb': args.max_kb, 'seed': args.seed}
+    if not paths:
+        print("❌ No pages to benchmark")
+        return 1
+
+    benchmarks = default_benchmarks()
+    if args.only:
+        benchmarks = [b for b in benchmarks if any(fnmatch.fnmatch(b.name, pattern) for pattern in args.only)]
+    print(f"⏱️  {len(benchmarks)} benchmarks on {len(paths)} pages, best of {args.repeat}\n")
+    results, total_bytes = run_benchmarks(benchmarks, paths, args.repeat)
+
+    changes = None
+    regressed = []
+    if args.compare:
+        try:
+            with open(baseline_file(args.compare), 'r', encoding='utf-8') as f:
+                baseline = json.load(f)
+        except (OSError, ValueError) as e:
+            print(f"❌ Can't read baseline {args.compare}: {e}")
+            return 1
+        if baseline['corpus'] != corpus:
+            print(f"⚠️  Baseline {args.compare} was taken on a different corpus: {baseline['corpus']}")
+        changes, regressed = compare(results, baseline['results'], args.threshold, args.min_slowdown_ms)
+    print_results(results, changes, regressed)
+    print(f"\n📊 {total_bytes:,} bytes per benchmark")
+
+    if args.save:
+        data = {
+            'corpus': corpus,
+            'repeat': args.repeat,
+            'python': platform.python_version(),
+            'machine': platform.platform(),
+            'created': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+            'results': results,
+        }
+        path = baseline_file(args.save)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        atomic_write(path, json.dumps(data, indent=2).encode('utf-8'))
+        print(f"💾 Saved baseline {path}")
+
+    if regressed:
+        print(f"❌ {len(regressed)} benchmarks regressed by more than {args.threshold:.0%} and {args.min_slowdown_ms:g} ms: {', '.join(regressed)}")
+        return 1
+    return 0
+
+if __name__ == '__main__':
+    raise SystemExit(main())
@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""
+Build deploy copies of the landing pages.
+LP/ stays the editable source tree the fixers work on; the build copies it
+to deploy/LP and runs each build stage over the copy in order.
+"""
+import argparse
+import hashlib
+import importlib
+import json
+import shutil
+import subprocess
+from pathlib import Path
+
+from lp_executor import add_jobs_argument
+from lp_io import atomic_write
+from lp_scanner import LP_DIR, iter_html_files
+
+DEPLOY_DIR = LP_DIR.parent / 'deploy' / 'LP'
+
+# (module, description) in the order they run; each module has main(argv)
+# accepting --dir and --jobs
+STAGES = [
+    ('responsive_images', 'Add responsive srcset and lazy loading to images'),
+    ('svg_sprites', 'Move repeated inline SVG icons into a shared sprite'),
+    ('prerender', 'Prerender React pages into #root'),
+    ('precompile_babel', 'Compile text/babel JSX to plain JavaScript'),
+    ('build_tailwind', 'Generate purged Tailwind CSS'),
+    ('dedupe_styles', 'Move shared inline CSS into a fingerprinted stylesheet'),
+    ('vendor_assets', 'Vendor CDN scripts and stylesheets with SRI'),
+    ('minify_pages', 'Minify markup, inline CSS and scripts'),
+    ('precompress', 'Write precompressed .gz/.br siblings'),
+]
+
+
+def add_dir_argument(parser):
+    """Add the shared --dir option of build stages"""
+    parser.add_argument(
+        '--dir', default=str(DEPLOY_DIR),
+        help=f'deploy copy of the landing pages to process (default: {DEPLOY_DIR})'
+    )
+    return parser
+
+def write_report(name, data, pages_dir=DEPLOY_DIR):
+    """Write a build stage report as JSON next to the pages and return its path"""
+    report_file = Path(pages_dir).parent / 'reports' / f'{name}.json'
+    report_file.parent.mkdir(parents=True, exist_ok=True)
+    atomic_write(report_file, json.dumps(data, indent=2, ensure_ascii=False).encode('utf-8'))
+    return report_file
+
+def write_asset(pages_dir, name, data):
+    """Write a content-hashed asset under pages_dir/assets
+
+    name is the logical file name (e.g. "tailwind.css"); the file is saved
+    as "tailwind.<hash>.css" and its URL relative to the pages is returned.
+    """
+    stem, dot, ext = name.rpartition('.')
+    digest = hashlib.sha256(data).hexdigest()[:10]
+    file_name = f'{stem}.{digest}.{ext}' if dot else f'{name}.{digest}'
+    asset_file = Path(pages_dir) / 'assets' / file_name
+    if not asset_file.exists():
+        asset_file.parent.mkdir(parents=True, exist_ok=True)
+        atomic_write(asset_file, data)
+    return f'assets/{file_name}'
+
+def run_node_script(script, payload):
+    """Run a build helper script with node, passing JSON on stdin and returning its JSON output"""
+    node = shutil.which('node')
+    if node is None:
+        raise RuntimeError("node is not installed")
+    result = subprocess.run(
+        [node, str(script)], input=json.dumps(payload),
+        capture_output=True, text=True, cwd=Path(script).parent
+    )
+    if result.returncode != 0:
+        raise RuntimeError(result.stderr.strip().splitlines()[-1] if result.stderr.strip() else f'{Path(script).name} failed')
+    return json.loads(result.stdout)
+
+def sync_sources(src=LP_DIR, dest=DEPLOY_DIR):
+    """Copy every source page over the deploy tree, dropping deleted pages
+
+    Generated assets are removed too, so every build starts clean.
+    """
+    dest.mkdir(parents=True, exist_ok=True)
+    shutil.rmtree(dest / 'assets', ignore_errors=True)
+    sources = iter_html_files(src)
+    names = {path.name for path in sources}
+    for stale in iter_html_files(dest):
+        if stale.name not in names:
+            stale.unlink()
+    for path in sources:
+        shutil.copy2(path, dest / path.name)
+    return len(sources)
+
+def main(argv=None):
+    """Main function"""
+    parser = add_jobs_argument(argparse.ArgumentParser(description='Build deploy copies of the landing pages'))
+    parser.add_argument('--out', default=str(DEPLOY_DIR), help=f'output directory (default: {DEPLOY_DIR})')
+    parser.add_argument('--skip', action='append', default=[], metavar='STAGE', help='skip a build stage (repeatable)')
+    args = parser.parse_args(argv)
+
+    if not LP_DIR.exists():
+        print(f"❌ Directory not found: {LP_DIR}")
+        return
+
+    out_dir = Path(args.out)
+    total = sync_sources(LP_DIR, out_dir)
+    print(f"📁 Copied {total} pages to {out_dir}\n")
+
+    for name, description in STAGES:
+        if name in args.skip:
+            print(f"⏭️  Skipping {name}")
+            continue
+        print(f"🔨 {description} ({name})")
+        importlib.import_module(name).main(['--dir', str(out_dir), '--jobs', str(args.jobs)])
+        print()
+
+    print(f"✨ Build finished: {out_dir}")
+
+if __name__ == '__main__':
+    main()
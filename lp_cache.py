@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+"""
+Persistent scan cache so unchanged landing pages are never re-analyzed.
+Entries are keyed by path + size + mtime, with a content-hash fallback.
+Performance metrics are only computed for callers that ask for them and
+are cached next to the scan record under their own fingerprint.
+"""
+import hashlib
+import json
+from pathlib import Path
+
+from lp_io import atomic_write
+from lp_perf import measure_page, perf_fingerprint as metrics_fingerprint
+from lp_scanner import LP_DIR, ScanResult, attach_perf, detector_fingerprint, scan_content
+
+CACHE_FILE = LP_DIR.parent / '.lp_cache' / 'scan.json'
+
+
+def content_hash(data):
+    """SHA-256 of raw file bytes"""
+    return hashlib.sha256(data).hexdigest()
+
+
+class ScanCache:
+    """On-disk cache of ScanResult records"""
+
+    def __init__(self, cache_file=CACHE_FILE, fingerprint=None, perf_fingerprint=None):
+        self.cache_file = Path(cache_file)
+        self.fingerprint = fingerprint or detector_fingerprint()
+        self.perf_fingerprint = perf_fingerprint or metrics_fingerprint()
+        self.entries = {}
+        self.hits = 0
+        self.misses = 0
+        self.dirty = False
+        self._seen = set()
+        self.load()
+
+    def load(self):
+        """Load entries, dropping everything if the detectors changed"""
+        try:
+            with open(self.cache_file, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return
+        if data.get('fingerprint') != self.fingerprint:
+            self.dirty = True
+            return
+        self.entries = data.get('entries', {})
+        if data.get('perf_fingerprint') != self.perf_fingerprint:
+            # Metric code or its parsers changed: keep the scans, drop the metrics
+            for entry in self.entries.values():
+                entry.pop('perf', None)
+            self.dirty = True
+
+    def _with_perf(self, entry, result, file_path, content=None):
+        """Fill in result.perf from the entry, measuring the page if it has none"""
+        if 'perf' not in entry:
+            if content is None:
+                try:
+                    with open(file_path, 'r', encoding='utf-8') as f:
+                        content = f.read()
+                except Exception as e:
+                    return ScanResult(file=file_path.name, path=file_path, error=str(e))
+            entry['perf'] = measure_page(content)
+            self.dirty = True
+        return attach_perf(result, entry['perf'])
+
+    def scan(self, file_path, perf=False):
+        """Return the cached record for file_path, re-scanning only if it changed
+
+        With perf=True the record carries its lp_perf metrics too.
+        """
+        file_path = Path(file_path)
+        key = str(file_path)
+        self._seen.add(key)
+        entry = self.entries.get(key)
+
+        try:
+            stat = file_path.stat()
+        except OSError as e:
+            return ScanResult(file=file_path.name, path=file_path, error=str(e))
+
+        if entry and entry['size'] == stat.st_size and entry['mtime_ns'] == stat.st_mtime_ns:
+            self.hits += 1
+            result = ScanResult.from_dict(entry['result'])
+            return self._with_perf(entry, result, file_path) if perf else result
+
+        try:
+            with open(file_path, 'rb') as f:
+                data = f.read()
+            digest = content_hash(data)
+            content = data.decode('utf-8')
+        except Exception as e:
+            return ScanResult(file=file_path.name, path=file_path, error=str(e))
+
+        if entry and entry['sha256'] == digest:
+            # Touched but not modified (checkout, copy): refresh the stat key only
+            self.hits += 1
+            result = ScanResult.from_dict(entry['result'])
+            result.content = content
+        else:
+            self.misses += 1
+            result = scan_content(file_path, content)
+            entry = None
+
+        record = result.to_dict()
+        del record['perf']
+        new_entry = {
+            'size': stat.st_size,
+            'mtime_ns': stat.st_mtime_ns,
+            'sha256': digest,
+            'result': record,
+        }
+        if entry and 'perf' in entry:
+            new_entry['perf'] = entry['perf']
+        self.entries[key] = new_entry
+        self.dirty = True
+        return self._with_perf(new_entry, result, file_path, content) if perf else result
+
+    def prune(self):
+        """Forget files that were not seen since the cache was loaded"""
+        stale = [key for key in self.entries if key not in self._seen]
+        for key in stale:
+            del self.entries[key]
+        if stale:
+            self.dirty = True
+        return len(stale)
+
+    def save(self):
+        """Write the cache atomically if anything changed"""
+        if not self.dirty:
+            return
+        self.cache_file.parent.mkdir(parents=True, exist_ok=True)
+        data = json.dumps({'fingerprint': self.fingerprint, 'perf_fingerprint': self.perf_fingerprint, 'entries': self.entries})
+        atomic_write(self.cache_file, data.encode('utf-8'))
+        self.dirty = False
+
+
+if __name__ == '__main__':
+    import sys
+    from lp_scanner import scan_directory
+
+    if '--clear' in sys.argv:
+        if CACHE_FILE.exists():
+            CACHE_FILE.unlink()
+        print(f"🧹 Cleared {CACHE_FILE}")
+    else:
+        cache = ScanCache()
+        results = list(scan_directory(LP_DIR, cache))
+        cache.prune()
+        cache.save()
+        print(f"📦 {len(results)} files: {cache.hits} cached, {cache.misses} re-scanned")
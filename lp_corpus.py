@@ -0,0 +1,294 @@
+#!/usr/bin/env python3
+"""
+Synthetic landing page corpus for benchmarking the maintenance scripts.
+Pages come in three kinds shaped like the real LP tree: plain HTML with
+class=, clean React pages (text/babel JSX with className=) and mixed
+React pages with HTML sections pasted into the component, which is what
+the clean/fix scripts exist for. Page i of a given seed is always the
+same, whatever the corpus size, so corpora of different sizes share
+their first pages and runs on different machines see the same input.
+"""
+import argparse
+import json
+import math
+import random
+from pathlib import Path
+
+from lp_io import atomic_write
+from lp_scanner import LP_DIR
+
+# Bump when generated pages change so cached corpora are rebuilt
+CORPUS_VERSION = 1
+
+KINDS = ('html', 'jsx', 'mixed')
+MIN_KB = 4
+MAX_KB = 500
+SEED = 1
+CORPUS_ROOT = LP_DIR.parent / '.lp_bench' / 'corpus'
+
+WORDS = (
+    'layanan kami terbaik untuk anda dengan harga terjangkau kualitas premium tim '
+    'profesional berpengalaman siap membantu bisnis tumbuh lebih cepat pelanggan puas '
+    'pesan sekarang juga gratis konsultasi modern desain elegan hasil maksimal setiap '
+    'hari fast reliable secure simple beautiful results growth trusted partner'
+).split()
+COLORS = ('blue', 'indigo', 'emerald', 'rose', 'amber', 'violet', 'sky', 'teal')
+SECTION_TITLES = ('Keunggulan', 'Fitur', 'Galeri', 'Testimonial', 'Kata Mereka', 'Harga', 'Paket', 'Layanan', 'FAQ', 'Tentang Kami')
+CREDIT = 'Dibuat oleh <a href="https://irvandoda.my.id">Irvando Demas Arifiandani</a>'
+
+CHECK_ICON = ('<svg {cls}="w-5 h-5 text-{color}-500" fill="none" stroke="currentColor" viewBox="0 0 24 24">'
+              '<path {linecap}="round" {linejoin}="round" {width}="2" d="M5 13l4 4L19 7"></path></svg>')
+
+
+def _text(rng, low, high):
+    words = [rng.choice(WORDS) for _ in range(rng.randint(low, high))]
+    return ' '.join(words).capitalize()
+
+class _Markup:
+    """Attribute and comment spelling of either HTML or JSX"""
+
+    def __init__(self, jsx):
+        self.jsx = jsx
+        self.cls = 'className' if jsx else 'class'
+
+    def comment(self, text):
+        return f'{{/* {text} */}}' if self.jsx else f'<!-- {text} -->'
+
+    def void(self, tag, attrs):
+        return f'<{tag} {attrs} />' if self.jsx else f'<{tag} {attrs}>'
+
+    def icon(self, color):
+        if self.jsx:
+            names = {'linecap': 'strokeLinecap', 'linejoin': 'strokeLinejoin', 'width': 'strokeWidth'}
+        else:
+            names = {'linecap': 'stroke-linecap', 'linejoin': 'stroke-linejoin', 'width': 'stroke-width'}
+        return CHECK_ICON.format(cls=self.cls, color=color, **names)
+
+def _cards(rng, m, color, indent):
+    cards = []
+    for _ in range(rng.randint(3, 6)):
+        cards.append(f'''{indent}<div {m.cls}="p-6 rounded-xl bg-white shadow hover:shadow-lg transition-all">
+{indent}    <div {m.cls}="w-12 h-12 bg-{color}-100 rounded-lg flex items-center justify-center mb-4">{m.icon(color)}</div>
+{indent}    <h3 {m.cls}="text-xl font-bold text-gray-900 mb-2">{_text(rng, 1, 3)}</h3>
+{indent}    <p {m.cls}="text-gray-600">{_text(rng, 8, 24)}.</p>
+{indent}</div>''')
+    return '\n'.join(cards)
+
+def _gallery(rng, m, color, indent):
+    images = []
+    for _ in range(rng.randint(3, 8)):
+        photo = rng.randrange(10 ** 9, 10 ** 10)
+        src = f'https://images.unsplash.com/photo-{photo}?w=800&q=80'
+        img = m.void('img', f'src="{src}" alt="{_text(rng, 2, 4)}" {m.cls}="w-full h-64 object-cover rounded-xl"')
+        images.append(f'{indent}<div {m.cls}="overflow-hidden rounded-xl">{img}</div>')
+    return '\n'.join(images)
+
+def _quotes(rng, m, color, indent):
+    quotes = []
+    for _ in range(rng.randint(2, 4)):
+        quotes.append(f'''{indent}<div {m.cls}="bg-gray-50 p-6 rounded-xl">
+{indent}    <p {m.cls}="text-gray-700 italic mb-4">"{_text(rng, 12, 30)}."</p>
+{indent}    <div {m.cls}="font-bold text-{color}-600">{_text(rng, 2, 2)}</div>
+{indent}</div>''')
+    return '\n'.join(quotes)
+
+def _prices(rng, m, color, indent):
+    plans = []
+    for _ in range(rng.randint(2, 3)):
+        features = '\n'.join(
+            f'{indent}        <li {m.cls}="flex items-center gap-2">{m.icon(color)}<span>{_text(rng, 2, 5)}</span></li>'
+            for _ in range(rng.randint(3, 6))
+        )
+        plans.append(f'''{indent}<div {m.cls}="border rounded-2xl p-8">
+{indent}    <h3 {m.cls}="text-2xl font-bold mb-2">Paket {_text(rng, 1, 1)}</h3>
+{indent}    <div {m.cls}="text-4xl font-bold text-{color}-600 mb-6">Rp {rng.randint(1, 99)}0.000</div>
+{indent}    <ul {m.cls}="space-y-3 mb-8">
+{features}
+{indent}    </ul>
+{indent}    <a href="#kontak" {m.cls}="block text-center bg-{color}-600 text-white py-3 rounded-lg font-bold">Pilih Paket</a>
+{indent}</div>''')
+    return '\n'.join(plans)
+
+SECTION_BUILDERS = (_cards, _gallery, _quotes, _prices)
+
+def _section(rng, m, indent):
+    """One content section with a leading comment"""
+    color = rng.choice(COLORS)
+    title = rng.choice(SECTION_TITLES)
+    builder = rng.choice(SECTION_BUILDERS)
+    anchor = title.lower().replace(' ', '-')
+    return f'''{indent}{m.comment(f'{title} Section')}
+{indent}<section id="{anchor}-{rng.randrange(1000)}" {m.cls}="py-20 bg-white">
+{indent}    <div {m.cls}="container mx-auto px-6">
+{indent}        <h2 {m.cls}="text-3xl md:text-4xl font-bold text-center text-gray-900 mb-12">{title} {_text(rng, 1, 3)}</h2>
+{indent}        <div {m.cls}="grid md:grid-cols-{rng.randint(2, 4)} gap-8">
+{builder(rng, m, color, indent + '            ')}
+{indent}        </div>
+{indent}    </div>
+{indent}</section>'''
+
+def _nav_and_hero(rng, m, indent):
+    color = rng.choice(COLORS)
+    return f'''{indent}<nav {m.cls}="sticky top-0 z-50 bg-white/90 backdrop-blur border-b">
+{indent}    <div {m.cls}="container mx-auto px-6 py-4 flex justify-between items-center">
+{indent}        <a href="#home" {m.cls}="text-xl font-bold text-{color}-600">{_text(rng, 1, 2)}</a>
+{indent}        <div {m.cls}="hidden md:flex gap-6"><a href="#fitur">Fitur</a><a href="#harga">Harga</a><a href="#kontak">Kontak</a></div>
+{indent}    </div>
+{indent}</nav>
+{indent}<header id="home" {m.cls}="hero pt-32 pb-20 bg-gradient-to-br from-{color}-600 to-gray-900 text-white">
+{indent}    <div {m.cls}="container mx-auto px-6 text-center">
+{indent}        <h1 {m.cls}="text-4xl md:text-6xl font-bold mb-6">{_text(rng, 4, 8)}</h1>
+{indent}        <p {m.cls}="text-xl mb-8 opacity-90">{_text(rng, 10, 20)}.</p>
+{indent}        <a href="#pricing" {m.cls}="bg-white text-{color}-600 px-8 py-4 rounded-full font-bold">Pesan Sekarang</a>
+{indent}    </div>
+{indent}</header>'''
+
+def _footer(rng, m, indent):
+    # Half the pages still need their credit added
+    credit = f'\n{indent}        <p {m.cls}="mt-2 text-sm">{CREDIT}</p>' if rng.random() < 0.5 else ''
+    return f'''{indent}<footer {m.cls}="bg-gray-900 text-gray-400 py-12">
+{indent}    <div {m.cls}="container mx-auto px-6 text-center">
+{indent}        <p>&copy; 2024 {_text(rng, 1, 3)}. All rights reserved.</p>{credit}
+{indent}    </div>
+{indent}</footer>'''
+
+def _head(rng, title, react):
+    scripts = '    <script src="https://cdn.tailwindcss.com"></script>\n'
+    if react:
+        scripts += (
+            '    <script crossorigin src="https://unpkg.com/react@18/umd/react.production.min.js"></script>\n'
+            '    <script crossorigin src="https://unpkg.com/react-dom@18/umd/react-dom.production.min.js"></script>\n'
+            '    <script src="https://unpkg.com/@babel/standalone/babel.min.js"></script>\n'
+        )
+    return f'''<!DOCTYPE html>
+<html lang="id">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>{title}</title>
+{scripts}    <style>
+        .fade-in {{ animation: fadeIn {rng.randint(3, 9) / 10}s ease-in; }}
+        @keyframes fadeIn {{ from {{ opacity: 0; }} to {{ opacity: 1; }} }}
+    </style>
+</head>
+'''
+
+def _fill(rng, target, size, make_section):
+    """Sections until the page would reach target bytes"""
+    sections = []
+    while size < target or not sections:
+        section = make_section()
+        sections.append(section)
+        size += len(section) + 1
+    return '\n'.join(sections)
+
+def generate_page(rng, kind, target):
+    """Markup of one page of the given kind, about target bytes long"""
+    title = _text(rng, 2, 5)
+    if kind == 'html':
+        m = _Markup(jsx=False)
+        indent = '    '
+        head = _head(rng, title, react=False)
+        top = _nav_and_hero(rng, m, indent)
+        bottom = _footer(rng, m, indent)
+        shell = len(head) + len(top) + len(bottom) + 40
+        body = _fill(rng, target, shell, lambda: _section(rng, m, indent))
+        return f'{head}<body {m.cls}="bg-gray-50 fade-in">\n{top}\n{body}\n{bottom}\n</body>\n</html>\n'
+
+    jsx = _Markup(jsx=True)
+    html = _Markup(jsx=False)
+    indent = ' ' * 20
+    head = _head(rng, title, react=True)
+    top = _nav_and_hero(rng, jsx, indent)
+    bottom = _footer(rng, jsx, indent)
+    shell = len(head) + len(top) + len(bottom) + 600
+
+    def section():
+        # Mixed pages have about a third of their sections pasted as HTML
+        pasted = kind == 'mixed' and rng.random() < 0.35
+        return _section(rng, html if pasted else jsx, indent)
+
+    body = _fill(rng, target, shell, section)
+    return f'''{head}<body>
+    <div id="root"></div>
+    <script type="text/babel">
+        const {{ useState }} = React;
+
+        const App = () => {{
+            const [menuOpen, setMenuOpen] = useState(false);
+
+            return (
+                <div className="min-h-screen bg-white">
+{top}
+{body}
+{bottom}
+                </div>
+            );
+        }};
+
+        const root = ReactDOM.createRoot(document.getElementById('root'));
+        root.render(<App />);
+    </script>
+</body>
+</html>
+'''
+
+def page_spec(index, seed=SEED, max_kb=MAX_KB):
+    """(name, kind, target bytes, rng) of page number index"""
+    rng = random.Random(f'{seed}:{index}')
+    kind = KINDS[index % len(KINDS)]
+    # Log-uniform sizes: mostly small pages, a long tail up to max_kb
+    low = math.log(min(MIN_KB, max_kb))
+    target = int(math.exp(rng.uniform(low, math.log(max_kb))) * 1024)
+    return f'page-{index:05d}-{kind}.html', kind, target, rng
+
+def corpus_dir(pages, max_kb=MAX_KB, seed=SEED, root=CORPUS_ROOT):
+    """Default location of a corpus"""
+    return Path(root) / f'{pages}-{max_kb}kb-s{seed}'
+
+def generate_corpus(out_dir, pages, max_kb=MAX_KB, seed=SEED):
+    """Write a corpus to out_dir, reusing it if it was generated with the same settings
+
+    Returns the list of page paths.
+    """
+    out_dir = Path(out_dir)
+    manifest_file = out_dir / 'corpus.json'
+    settings = {'version': CORPUS_VERSION, 'pages': pages, 'max_kb': max_kb, 'seed': seed}
+    try:
+        with open(manifest_file, 'r', encoding='utf-8') as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        manifest = None
+    if manifest and manifest['settings'] == settings and all((out_dir / name).exists() for name in manifest['files']):
+        return [out_dir / name for name in manifest['files']]
+
+    out_dir.mkdir(parents=True, exist_ok=True)
+    for stale in out_dir.glob('page-*.html'):
+        stale.unlink()
+    files = []
+    total = 0
+    for index in range(pages):
+        name, kind, target, rng = page_spec(index, seed, max_kb)
+        data = generate_page(rng, kind, target).encode('utf-8')
+        (out_dir / name).write_bytes(data)
+        files.append(name)
+        total += len(data)
+    atomic_write(manifest_file, json.dumps({'settings': settings, 'files': files, 'bytes': total}, indent=2).encode('utf-8'))
+    return [out_dir / name for name in files]
+
+def main(argv=None):
+    """Main function"""
+    parser = argparse.ArgumentParser(description='Generate a synthetic landing page corpus')
+    parser.add_argument('--pages', type=int, default=100, help='number of pages (default: 100)')
+    parser.add_argument('--max-kb', type=int, default=MAX_KB, help=f'largest page size in KB (default: {MAX_KB})')
+    parser.add_argument('--seed', type=int, default=SEED, help=f'random seed (default: {SEED})')
+    parser.add_argument('--out', help='output directory (default: .lp_bench/corpus/<pages>-<max-kb>kb-s<seed>)')
+    args = parser.parse_args(argv)
+
+    out_dir = Path(args.out) if args.out else corpus_dir(args.pages, args.max_kb, args.seed)
+    files = generate_corpus(out_dir, args.pages, args.max_kb, args.seed)
+    total = sum(path.stat().st_size for path in files)
+    print(f"✨ {len(files)} pages, {total:,} bytes in {out_dir}")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,219 @@
+#!/usr/bin/env python3
+"""
+Detector registry for section and structure rules.
+Each rule is declared once as a regex whose top-level alternatives start
+with a literal keyword. A DetectorSet puts the keywords of all its rules
+into one trie-shaped regex and finds every keyword occurrence in a single
+pass; a rule's own alternatives then only run anchored at occurrences of
+their keyword, so checking a whole set costs one scan of the content.
+"""
+import re
+import time
+from dataclasses import dataclass, field
+from typing import Dict, List, Tuple
+
+_META = set('.^$*+?{}[]()|\\')
+_QUANTIFIERS = set('*+?{')
+_ESCAPED_LITERALS = set('.^$*+?{}[]()|\\/-"\'<>=#!')
+# Characters that match ASCII letters case-insensitively but don't lower() to them
+_FOLD_RE = re.compile('[\u0130\u0131\u017f]')
+# Inline flags and backreferences tie alternatives together
+_UNSPLITTABLE_RE = re.compile(r'^\(\?[aiLmsux]+\)|\(\?P=|\\[1-9]')
+
+
+def split_alternatives(pattern):
+    """Top-level alternatives of a regex"""
+    parts = []
+    depth = 0
+    in_class = False
+    start = 0
+    i = 0
+    while i < len(pattern):
+        c = pattern[i]
+        if c == '\\':
+            i += 2
+            continue
+        if in_class:
+            in_class = c != ']'
+        elif c == '[':
+            in_class = True
+            if pattern.startswith('[]', i) or pattern.startswith('[^]', i):
+                i += 2 if pattern[i + 1] == ']' else 3
+                continue
+        elif c == '(':
+            depth += 1
+        elif c == ')':
+            depth -= 1
+        elif c == '|' and depth == 0:
+            parts.append(pattern[start:i])
+            start = i + 1
+        i += 1
+    parts.append(pattern[start:])
+    return parts
+
+def literal_prefix(pattern):
+    """Literal text every match of a regex alternative starts with"""
+    chars = []
+    i = 0
+    while i < len(pattern):
+        c = pattern[i]
+        if c == '\\' and pattern[i + 1:i + 2] in _ESCAPED_LITERALS:
+            literal, size = pattern[i + 1], 2
+        elif c in _META:
+            break
+        else:
+            literal, size = c, 1
+        if pattern[i + size:i + size + 1] in _QUANTIFIERS:
+            # The character may repeat zero times
+            break
+        chars.append(literal)
+        i += size
+    return ''.join(chars)
+
+def trie_regex(words):
+    """Regex matching the longest of words at a position, shaped as a trie"""
+    trie = {}
+    for word in words:
+        node = trie
+        for c in word:
+            node = node.setdefault(c, {})
+        node[''] = {}
+
+    def emit(node):
+        end = '' in node
+        branches = [re.escape(c) + emit(child) for c, child in sorted(node.items()) if c]
+        if not branches:
+            return ''
+        body = branches[0] if len(branches) == 1 else '(?:' + '|'.join(branches) + ')'
+        if end:
+            return ('(?:' + body + ')?') if len(branches) == 1 and len(body) > 1 else body + '?'
+        return body
+
+    return emit(trie)
+
+
+@dataclass
+class Detector:
+    """One named rule: a regex searched anywhere in the content"""
+    name: str
+    pattern: str
+    flags: int = re.IGNORECASE
+    regex: re.Pattern = field(init=False, repr=False)
+    branches: List[Tuple[str, re.Pattern]] = field(init=False, repr=False)
+
+    def __post_init__(self):
+        self.regex = re.compile(self.pattern, self.flags)
+        # Keywords are matched case-insensitively; the anchored branch
+        # regex decides for case-sensitive rules
+        if _UNSPLITTABLE_RE.search(self.pattern):
+            self.branches = [('', self.regex)]
+            return
+        self.branches = [(literal_prefix(branch).lower(), re.compile(branch, self.flags))
+                         for branch in split_alternatives(self.pattern)]
+
+    @property
+    def keywords(self):
+        return [keyword for keyword, _ in self.branches]
+
+    def search(self, content, pos=0, endpos=None):
+        """Whether the rule matches content[pos:endpos], as a plain regex search"""
+        endpos = len(content) if endpos is None else endpos
+        return self.regex.search(content, pos, endpos) is not None
+
+
+class DetectorSet:
+    """Detectors sharing one keyword prefilter pass"""
+
+    def __init__(self, detectors):
+        self.detectors: Dict[str, Detector] = {detector.name: detector for detector in detectors}
+        keywords = {keyword for detector in self.detectors.values() for keyword in detector.keywords if keyword}
+        self._keywords = keywords
+        # Every keyword that starts where a longer one does
+        self._prefixes = {word: [k for k in keywords if word.startswith(k)] for word in keywords}
+        # Searching lowercased content case-sensitively is much faster than
+        # re.IGNORECASE; the folding regex covers content where that isn't exact
+        trie = trie_regex(keywords)
+        self._ascii = all(keyword.isascii() for keyword in keywords)
+        self._prefilter = re.compile(trie) if keywords else None
+        self._folding_prefilter = re.compile(trie, re.IGNORECASE) if keywords else None
+
+    def __getitem__(self, name):
+        return self.detectors[name]
+
+    def __iter__(self):
+        return iter(self.detectors.values())
+
+    def keyword_positions(self, content, pos=0, endpos=None):
+        """{keyword: [offsets]} of every keyword occurrence in content[pos:endpos]"""
+        positions = {}
+        if self._prefilter is None:
+            return positions
+        endpos = len(content) if endpos is None else endpos
+        text = content.lower()
+        if self._ascii and len(text) == len(content) and not _FOLD_RE.search(content):
+            regex = self._prefilter
+        else:
+            text, regex = content, self._folding_prefilter
+        while True:
+            m = regex.search(text, pos, endpos)
+            if m is None:
+                return positions
+            for keyword in self._keywords_at(m.group()):
+                positions.setdefault(keyword, []).append(m.start())
+            # Resume inside the match so overlapping keywords ("review" in "preview") count
+            pos = m.start() + 1
+
+    def _keywords_at(self, text):
+        """Keywords that a prefilter match (the longest one at its offset) starts with"""
+        prefixes = self._prefixes.get(text.lower())
+        if prefixes is None:
+            # Unicode case folding that lower() doesn't mirror
+            prefixes = [k for k in self._keywords if re.match(re.escape(k), text, re.IGNORECASE)]
+        return prefixes
+
+    def scan(self, content, pos=0, endpos=None, names=None, recorder=None):
+        """Names of the detectors matching content[pos:endpos]
+
+        Same answer as running each detector's search() on its own. With a
+        recorder (lp_profile.FileProfile) the prefilter pass and every
+        detector are timed.
+        """
+        endpos = len(content) if endpos is None else endpos
+        if recorder is None:
+            positions = self.keyword_positions(content, pos, endpos)
+        else:
+            start = time.perf_counter()
+            positions = self.keyword_positions(content, pos, endpos)
+            recorder.record('prefilter', time.perf_counter() - start,
+                            sum(len(offsets) for offsets in positions.values()), endpos - pos)
+        found = set()
+        for detector in self.detectors.values():
+            if names is not None and detector.name not in names:
+                continue
+            if recorder is None:
+                matched = _matches_at(detector, content, positions, pos, endpos)
+            else:
+                start = time.perf_counter()
+                matched = _matches_at(detector, content, positions, pos, endpos)
+                candidates = sum(len(positions.get(keyword, ())) for keyword in set(detector.keywords) if keyword)
+                recorder.record(detector.name, time.perf_counter() - start, int(matched), endpos - pos, candidates)
+            if matched:
+                found.add(detector.name)
+        return found
+
+def _matches_at(detector, content, positions, pos, endpos):
+    """Whether any branch of detector matches at one of its keyword occurrences"""
+    for keyword, branch in detector.branches:
+        if not keyword:
+            # No literal to anchor on: plain search
+            if branch.search(content, pos, endpos):
+                return True
+            continue
+        for offset in positions.get(keyword, ()):
+            if branch.match(content, offset, endpos):
+                return True
+    return False
+
+def detector_set(patterns, flags=re.IGNORECASE):
+    """DetectorSet from a {name: pattern} mapping"""
+    return DetectorSet(Detector(name, pattern, flags) for name, pattern in patterns.items())
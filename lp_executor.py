@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""
+Shared execution engine for the batch fixers.
+Runs a per-file task serially or across a process pool (--jobs N) and
+returns results in input order so console summaries stay deterministic.
+"""
+import io
+import os
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import redirect_stdout
+from dataclasses import dataclass
+from functools import partial
+from pathlib import Path
+from typing import Any, Optional
+
+
+@dataclass
+class TaskResult:
+    """Outcome of one per-file task"""
+    path: Path
+    value: Any = None
+    output: str = ''
+    error: Optional[str] = None
+
+
+def add_jobs_argument(parser):
+    """Add the shared --jobs option to an argparse parser"""
+    parser.add_argument(
+        '-j', '--jobs', type=int, default=1,
+        help='number of worker processes (0 = one per CPU, default: 1)'
+    )
+    return parser
+
+def resolve_jobs(jobs):
+    """Turn the --jobs value into a worker count"""
+    if jobs is None or jobs < 0:
+        return 1
+    if jobs == 0:
+        return os.cpu_count() or 1
+    return jobs
+
+def _run_task(func, path):
+    """Run func(path) capturing its console output"""
+    buffer = io.StringIO()
+    try:
+        with redirect_stdout(buffer):
+            value = func(path)
+        return TaskResult(path=path, value=value, output=buffer.getvalue())
+    except Exception as e:
+        return TaskResult(path=path, output=buffer.getvalue(), error=str(e))
+
+def run_tasks(func, paths, jobs=1, chunksize=None):
+    """Yield a TaskResult for every path, in the order the paths were given
+
+    func must be a module-level function so it can be sent to worker
+    processes. Output printed by func is captured and returned with the
+    result instead of being interleaved on the console.
+    """
+    paths = list(paths)
+    jobs = min(resolve_jobs(jobs), max(len(paths), 1))
+    task = partial(_run_task, func)
+
+    if jobs == 1:
+        for path in paths:
+            yield task(path)
+        return
+
+    if chunksize is None:
+        chunksize = max(1, len(paths) // (jobs * 4))
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        yield from pool.map(task, paths, chunksize=chunksize)
+
+def print_task_output(result):
+    """Replay captured output of a task on the console"""
+    if result.output:
+        print(result.output, end='')
+    if result.error:
+        print(f"❌ Error processing {Path(result.path).name}: {result.error}")
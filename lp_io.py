@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""
+Crash-safe write layer for the landing page fixers.
+Files are written to a temp file next to the target, fsynced and renamed
+over the original, so an interrupted run never leaves a truncated page.
+Writes made while a journal run is active are recorded for rollback, and
+in dry-run mode writes are printed as unified diffs instead.
+"""
+import difflib
+import os
+import stat
+import sys
+import tempfile
+from pathlib import Path
+
+import lp_journal
+
+# Set in the parent process so --jobs workers inherit it
+DRY_RUN_ENV = 'LP_DRY_RUN'
+
+
+def _fsync_dir(directory):
+    """Persist a rename by syncing its directory entry"""
+    try:
+        fd = os.open(directory, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+def atomic_write(path, data):
+    """Replace path with data (bytes) via temp file, fsync and rename"""
+    path = Path(path)
+    fd, tmp_name = tempfile.mkstemp(prefix=f'.{path.name}.', suffix='.tmp', dir=path.parent)
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        mode = stat.S_IMODE(path.stat().st_mode) if path.exists() else 0o644
+        os.chmod(tmp_name, mode)
+        os.replace(tmp_name, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_name)
+        except OSError:
+            pass
+        raise
+    _fsync_dir(path.parent)
+
+def add_dry_run_argument(parser):
+    """Add the shared --dry-run option to an argparse parser"""
+    parser.add_argument(
+        '-n', '--dry-run', action='store_true',
+        help='print a unified diff of every change instead of writing files'
+    )
+    return parser
+
+def set_dry_run(enabled):
+    """Switch dry-run mode on or off for this process and its workers"""
+    if enabled:
+        os.environ[DRY_RUN_ENV] = '1'
+        print("🔍 Dry run - printing diffs, no files will be written\n")
+    else:
+        os.environ.pop(DRY_RUN_ENV, None)
+
+def is_dry_run():
+    return bool(os.environ.get(DRY_RUN_ENV))
+
+def dry_run_verb(done, planned):
+    """done, or planned ("Would add") in dry-run mode, for progress messages"""
+    return planned if is_dry_run() else done
+
+def iter_diff(path, before, after):
+    """Unified diff lines of one file, generated lazily"""
+    name = Path(path).name
+    diff = difflib.unified_diff(
+        before.splitlines(keepends=True), after.splitlines(keepends=True),
+        fromfile=f'a/{name}', tofile=f'b/{name}'
+    )
+    for line in diff:
+        yield line if line.endswith('\n') else line + '\n\\ No newline at end of file\n'
+
+def write_text(path, content, encoding='utf-8'):
+    """Atomically write text to path, journaling the original
+
+    Returns False without touching the file when the content is unchanged.
+    In dry-run mode the change is printed as a diff and nothing is written.
+    """
+    path = Path(path)
+    data = content.encode(encoding)
+    before = path.read_bytes() if path.exists() else None
+    if before == data:
+        return False
+    if is_dry_run():
+        old = before.decode(encoding) if before is not None else ''
+        sys.stdout.writelines(iter_diff(path, old, content))
+        return True
+    lp_journal.record(path, before, data)
+    atomic_write(path, data)
+    return True
+
+def remove_file(path, encoding='utf-8'):
+    """Delete path, journaling its content so a rollback restores it
+
+    Returns False if there is nothing to delete. In dry-run mode the
+    removal is printed as a diff and the file is kept.
+    """
+    path = Path(path)
+    if not path.exists():
+        return False
+    before = path.read_bytes()
+    if is_dry_run():
+        sys.stdout.writelines(iter_diff(path, before.decode(encoding), ''))
+        return True
+    lp_journal.record(path, before, None)
+    path.unlink()
+    _fsync_dir(path.parent)
+    return True
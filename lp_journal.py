@@ -0,0 +1,239 @@
+#!/usr/bin/env python3
+"""
+Journal of fixer runs for one-command rollback.
+Originals are kept once in a content-addressed object store and every run
+appends one JSON line per written file to its manifest, so rolling a run
+back only touches the files that run changed.
+
+    python3 lp_journal.py list
+    python3 lp_journal.py rollback [RUN_ID] [--force]
+    python3 lp_journal.py gc
+"""
+import argparse
+import hashlib
+import json
+import os
+import time
+from contextlib import contextmanager
+from functools import wraps
+from pathlib import Path
+
+from lp_scanner import LP_DIR
+
+JOURNAL_DIR = LP_DIR.parent / '.lp_journal'
+# Manifest of the active run; an environment variable so pool workers inherit it
+RUN_ENV = 'LP_JOURNAL_RUN'
+
+
+def object_id(data):
+    return hashlib.sha256(data).hexdigest()
+
+def _object_path(journal_dir, oid):
+    return Path(journal_dir) / 'objects' / oid[:2] / oid[2:]
+
+def store_object(journal_dir, data):
+    """Save data in the object store once and return its id"""
+    oid = object_id(data)
+    path = _object_path(journal_dir, oid)
+    if not path.exists():
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_file = path.with_name(f'{path.name}.{os.getpid()}.tmp')
+        with open(tmp_file, 'wb') as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_file, path)
+    return oid
+
+def load_object(journal_dir, oid):
+    return _object_path(journal_dir, oid).read_bytes()
+
+def _append(manifest, entry):
+    """Append one JSON line; O_APPEND keeps lines from parallel workers whole"""
+    line = (json.dumps(entry, ensure_ascii=False) + '\n').encode('utf-8')
+    fd = os.open(manifest, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+    try:
+        os.write(fd, line)
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+def start_run(name, journal_dir=JOURNAL_DIR):
+    """Begin a journaled run and return its id"""
+    run_id = f"{time.strftime('%Y%m%d-%H%M%S')}-{os.getpid()}-{name}"
+    runs_dir = Path(journal_dir) / 'runs'
+    runs_dir.mkdir(parents=True, exist_ok=True)
+    manifest = runs_dir / f'{run_id}.jsonl'
+    _append(manifest, {'run': run_id, 'name': name, 'started': time.strftime('%Y-%m-%d %H:%M:%S')})
+    os.environ[RUN_ENV] = str(manifest)
+    return run_id
+
+@contextmanager
+def journal_run(name, journal_dir=JOURNAL_DIR):
+    """Journal every lp_io write made inside the block
+
+    Runs that wrote nothing leave no manifest behind.
+    """
+    run_id = start_run(name, journal_dir)
+    try:
+        yield run_id
+    finally:
+        manifest = Path(os.environ.pop(RUN_ENV))
+        _, entries = read_manifest(manifest)
+        if entries:
+            files = len({entry['path'] for entry in entries})
+            print(f"📝 Journaled {files} files as {run_id} (undo: python3 lp_journal.py rollback {run_id})")
+        else:
+            manifest.unlink()
+
+def journaled(name):
+    """Decorator running a fixer's main() inside a journal run"""
+    def decorator(func):
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            with journal_run(name):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+def record(path, before, after):
+    """Record a write (or, with after=None, a removal) of path in the active run
+
+    The original is stored before the caller renames the new file in, so
+    a crash at any point still leaves a restorable entry.
+    """
+    manifest = os.environ.get(RUN_ENV)
+    if not manifest:
+        return
+    journal_dir = Path(manifest).parent.parent
+    _append(manifest, {
+        'path': str(Path(path).resolve()),
+        'before': store_object(journal_dir, before) if before is not None else None,
+        'after': object_id(after) if after is not None else None,
+    })
+
+def read_manifest(manifest):
+    """Header dict and the list of write entries of a run"""
+    header = {}
+    entries = []
+    with open(manifest, 'r', encoding='utf-8') as f:
+        for line in f:
+            if not line.strip():
+                continue
+            try:
+                entry = json.loads(line)
+            except json.JSONDecodeError:
+                # Torn last line of a crashed run
+                continue
+            if 'run' in entry:
+                header = entry
+            else:
+                entries.append(entry)
+    return header, entries
+
+def list_runs(journal_dir=JOURNAL_DIR):
+    """Run manifests, oldest first"""
+    runs_dir = Path(journal_dir) / 'runs'
+    if not runs_dir.exists():
+        return []
+    return sorted(runs_dir.glob('*.jsonl'), key=lambda p: p.stat().st_mtime_ns)
+
+def find_run(run_id=None, journal_dir=JOURNAL_DIR):
+    """Manifest of run_id (a unique prefix is enough), or of the latest run"""
+    runs = list_runs(journal_dir)
+    if run_id:
+        runs = [p for p in runs if p.stem.startswith(run_id)]
+        if len(runs) > 1:
+            raise ValueError(f"Run id {run_id!r} is ambiguous")
+    if not runs:
+        raise ValueError(f"No journal run found{f' for {run_id!r}' if run_id else ''}")
+    return runs[-1]
+
+def rollback(run_id=None, force=False, journal_dir=JOURNAL_DIR):
+    """Restore every file a run wrote; returns (restored, skipped)
+
+    Files changed again after the run are skipped unless force is set.
+    The rollback is itself journaled, so it can be rolled back too.
+    """
+    from lp_io import atomic_write
+
+    manifest = find_run(run_id, journal_dir)
+    header, entries = read_manifest(manifest)
+
+    # First original and last written version per file
+    files = {}
+    for entry in entries:
+        first, _ = files.get(entry['path'], (entry['before'], None))
+        files[entry['path']] = (first, entry['after'])
+
+    restored = skipped = 0
+    with journal_run(f"rollback-{header.get('name', 'run')}", journal_dir):
+        for path_str, (before, after) in files.items():
+            path = Path(path_str)
+            current = path.read_bytes() if path.exists() else None
+            current_id = object_id(current) if current is not None else None
+            if not force and current_id != after:
+                print(f"⚠️  Skipping {path.name} - changed since the run")
+                skipped += 1
+                continue
+            if before is None:
+                if current is not None:
+                    record(path, current, None)
+                    path.unlink()
+                print(f"🗑️  Removed {path.name}")
+            else:
+                data = load_object(journal_dir, before)
+                record(path, current, data)
+                atomic_write(path, data)
+                print(f"↩️  Restored {path.name}")
+            restored += 1
+    return restored, skipped
+
+def gc(journal_dir=JOURNAL_DIR):
+    """Delete objects no manifest refers to; returns the number removed"""
+    referenced = set()
+    for manifest in list_runs(journal_dir):
+        _, entries = read_manifest(manifest)
+        referenced.update(entry['before'] for entry in entries if entry['before'])
+    removed = 0
+    objects_dir = Path(journal_dir) / 'objects'
+    if objects_dir.exists():
+        for path in objects_dir.glob('*/*'):
+            if path.parent.name + path.name not in referenced:
+                path.unlink()
+                removed += 1
+    return removed
+
+
+def main(argv=None):
+    """Main function"""
+    parser = argparse.ArgumentParser(description='List and roll back journaled fixer runs')
+    sub = parser.add_subparsers(dest='command', required=True)
+    sub.add_parser('list', help='show journaled runs')
+    rollback_parser = sub.add_parser('rollback', help='restore the files a run changed')
+    rollback_parser.add_argument('run', nargs='?', help='run id or prefix (default: latest run)')
+    rollback_parser.add_argument('--force', action='store_true', help='restore files changed after the run too')
+    sub.add_parser('gc', help='delete objects no run refers to')
+    args = parser.parse_args(argv)
+
+    if args.command == 'list':
+        runs = list_runs()
+        if not runs:
+            print("📭 No journaled runs")
+        for manifest in runs:
+            header, entries = read_manifest(manifest)
+            files = len({entry['path'] for entry in entries})
+            print(f"📝 {manifest.stem}  {header.get('started', '?')}  {files} files")
+    elif args.command == 'rollback':
+        try:
+            restored, skipped = rollback(args.run, args.force)
+        except ValueError as e:
+            print(f"❌ {e}")
+            return 1
+        print(f"\n✨ Done! Restored {restored} files, skipped {skipped}")
+    else:
+        print(f"🧹 Removed {gc()} unreferenced objects")
+    return 0
+
+if __name__ == '__main__':
+    raise SystemExit(main())
@@ -0,0 +1,196 @@
+#!/usr/bin/env python3
+"""
+Static performance metrics and budgets for landing pages.
+page_metrics() measures what makes a page slow before it is ever loaded:
+its weight, render-blocking scripts, third-party origins, images without
+lazy loading or dimensions, inline CSS/JS and the size and depth of its
+DOM. The markup outside scripts and the JSX of text/babel scripts are both
+measured; JSX components aren't inlined into each other, so DOM figures of
+React pages are a lower bound. Budgets are plain {metric: limit} maps with
+optional per-page overrides.
+"""
+import hashlib
+from pathlib import Path
+from typing import Dict, List
+from urllib.parse import urlsplit
+
+import jsx_index
+import tag_tree
+from jsx_index import iter_babel_scripts, tokenize_script
+from tag_tree import build_tree
+
+# Site the pages are served from; every other origin is third-party
+SITE_HOST = 'portfolio.irvandoda.my.id'
+
+# Metrics a budget can limit, in report order
+METRICS = [
+    'bytes',
+    'blocking_scripts',
+    'third_party_origins',
+    'images_without_loading',
+    'images_without_dimensions',
+    'inline_css_bytes',
+    'inline_js_bytes',
+    'dom_nodes',
+    'dom_depth',
+]
+
+# Library-wide limits; perf_budgets.json can tighten them or grant single pages more
+DEFAULT_BUDGETS = {
+    'bytes': 50_000,
+    'blocking_scripts': 4,
+    'third_party_origins': 4,
+    'images_without_loading': 6,
+    'images_without_dimensions': 6,
+    'inline_css_bytes': 1_000,
+    'inline_js_bytes': 40_000,
+    'dom_nodes': 400,
+    'dom_depth': 18,
+}
+
+# Script types the browser runs while parsing
+_JS_TYPES = {'', 'text/javascript', 'application/javascript'}
+_URL_ATTRIBUTES = {
+    'script': ('src',), 'link': ('href',), 'img': ('src', 'srcset'), 'source': ('src', 'srcset'),
+    'iframe': ('src',), 'video': ('src', 'poster'), 'audio': ('src',), 'embed': ('src',),
+}
+# <link> relations that never fetch anything
+_NON_FETCHING_RELS = {'canonical', 'alternate', 'author', 'license'}
+
+
+def _attr(element, name):
+    """String value of an attribute, None if missing or a JSX expression"""
+    value = element.attrs.get(name)
+    if value is True:
+        return ''
+    if not isinstance(value, str) or value.startswith('{'):
+        return None
+    return value.strip()
+
+def _urls(element):
+    """Absolute and protocol-relative URLs an element fetches"""
+    tag = element.tag.lower()
+    if tag == 'link' and (_attr(element, 'rel') or '').lower() in _NON_FETCHING_RELS:
+        return
+    for name in _URL_ATTRIBUTES.get(tag, ()):
+        value = _attr(element, name)
+        if not value:
+            continue
+        candidates = [part.split()[0] for part in value.split(',') if part.strip()] if name == 'srcset' else [value]
+        for url in candidates:
+            if url.startswith(('http://', 'https://', '//')):
+                yield url
+
+def _is_dom_element(element):
+    """Lowercase tags become DOM nodes; components and fragments don't"""
+    return element.tag[:1].islower()
+
+def _dom_depths(elements):
+    """{element id: nesting depth} counting only DOM elements"""
+    depths = {}
+    for element in elements:
+        parent = element.parent
+        depth = depths.get(id(parent), 0) if parent is not None else 0
+        depths[id(element)] = depth + 1 if _is_dom_element(element) else depth
+    return depths
+
+def _jsx_elements(content):
+    """Elements of every top-level JSX expression in text/babel scripts"""
+    for _, start, end in iter_babel_scripts(content):
+        index = tokenize_script(content, start, end)
+        last_end = -1
+        for jsx_element in index.elements:
+            if jsx_element.start < last_end:
+                continue
+            last_end = jsx_element.end
+            yield from build_tree(content, jsx_element.start, jsx_element.end).elements
+
+def page_metrics(content):
+    """{metric: value} of one page, plus the third-party origins it uses"""
+    tree = build_tree(content)
+    body = next((element for element in tree.elements if element.tag.lower() == 'body'), None)
+    head_end = body.start if body is not None else len(content)
+    html_depths = _dom_depths(tree.elements)
+    root = next((element for element in tree.elements if element.attrs.get('id') == 'root'), None)
+    root_depth = html_depths.get(id(root), 0)
+
+    jsx = list(_jsx_elements(content))
+    jsx_depths = _dom_depths(jsx)
+    elements = tree.elements + jsx
+
+    blocking = 0
+    inline_css = 0
+    inline_js = 0
+    for element in tree.elements:
+        tag = element.tag.lower()
+        if tag == 'style':
+            inline_css += len(element.inner(content).encode('utf-8'))
+        elif tag == 'script':
+            kind = (_attr(element, 'type') or '').lower()
+            if _attr(element, 'src') is None:
+                if kind in _JS_TYPES or kind in ('module', 'text/babel'):
+                    inline_js += len(element.inner(content).encode('utf-8'))
+            elif element.start < head_end and kind in _JS_TYPES and not ('async' in element.attrs or 'defer' in element.attrs):
+                blocking += 1
+
+    origins = set()
+    without_loading = 0
+    without_dimensions = 0
+    for element in elements:
+        for url in _urls(element):
+            host = urlsplit(url).netloc.lower()
+            if host and host != SITE_HOST:
+                origins.add(host)
+        if element.tag.lower() == 'img':
+            if 'loading' not in element.attrs:
+                without_loading += 1
+            if 'width' not in element.attrs or 'height' not in element.attrs:
+                without_dimensions += 1
+
+    return {
+        'bytes': len(content.encode('utf-8')),
+        'blocking_scripts': blocking,
+        'third_party_origins': len(origins),
+        'images_without_loading': without_loading,
+        'images_without_dimensions': without_dimensions,
+        'inline_css_bytes': inline_css,
+        'inline_js_bytes': inline_js,
+        'dom_nodes': sum(1 for element in elements if _is_dom_element(element)),
+        'dom_depth': max(
+            max(html_depths.values(), default=0),
+            root_depth + max(jsx_depths.values(), default=0),
+        ),
+        'origins': sorted(origins),
+    }
+
+def measure_page(content):
+    """page_metrics(), or {'error': message} if the page can't be measured
+
+    A page the parsers choke on is reported instead of aborting the audit.
+    """
+    try:
+        return page_metrics(content)
+    except Exception as e:
+        return {'error': f"{type(e).__name__}: {e}"}
+
+def perf_fingerprint():
+    """Hash of the metric code and the parsers it relies on, used to invalidate cached metrics"""
+    digest = hashlib.sha256()
+    for module_file in (__file__, jsx_index.__file__, tag_tree.__file__):
+        digest.update(Path(module_file).read_bytes())
+    return digest.hexdigest()
+
+def page_budgets(config, file):
+    """Budgets of one page: the defaults, the config's defaults, then its per-page overrides"""
+    budgets = dict(DEFAULT_BUDGETS)
+    budgets.update((config or {}).get('default', {}))
+    budgets.update((config or {}).get('pages', {}).get(file, {}))
+    return budgets
+
+def over_budget(metrics, budgets) -> List[Dict[str, int]]:
+    """[{metric, value, budget}] of every metric above its budget"""
+    return [
+        {'metric': name, 'value': metrics[name], 'budget': budgets[name]}
+        for name in METRICS
+        if name in metrics and budgets.get(name) is not None and metrics[name] > budgets[name]
+    ]
@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+"""
+Opt-in profiling of the scanner detectors.
+A DetectorProfile is passed to scan_file()/scan_content() and records, for
+every file and detector, the time spent, the matches found and the bytes
+scanned. Files where a detector or the whole scan goes over budget are
+flagged, which is where backtracking patterns show up, and the records
+can be exported as JSON or CSV for tuning the rules.
+"""
+import csv
+import io
+import json
+import time
+from dataclasses import asdict, dataclass, fields
+from typing import Dict, List, Optional
+
+from lp_io import atomic_write
+
+DETECTOR_BUDGET_MS = 20.0
+FILE_BUDGET_MS = 100.0
+
+
+@dataclass
+class DetectorTiming:
+    """One detector run on one file"""
+    file: str
+    detector: str
+    seconds: float
+    matches: int
+    bytes: int
+    # Keyword occurrences a registry detector verified
+    candidates: Optional[int] = None
+
+
+def _count(value):
+    """Match count of a detector's return value"""
+    if value is None:
+        return 0
+    if isinstance(value, (bool, int)):
+        return int(value)
+    if isinstance(value, dict):
+        return sum(1 for v in value.values() if v)
+    return len(value)
+
+class FileProfile:
+    """Recorder the scanner fills in for one file"""
+
+    def __init__(self, profile, file):
+        self.profile = profile
+        self.file = file
+
+    def record(self, detector, seconds, matches, scanned, candidates=None):
+        self.profile.records.append(DetectorTiming(self.file, detector, seconds, matches, scanned, candidates))
+
+    def call(self, detector, scanned, func, *args):
+        """func(*args), recorded as one run of detector"""
+        start = time.perf_counter()
+        value = func(*args)
+        self.record(detector, time.perf_counter() - start, _count(value), scanned)
+        return value
+
+
+class DetectorProfile:
+    """Detector timings of a whole scan"""
+
+    def __init__(self, detector_budget_ms=DETECTOR_BUDGET_MS, file_budget_ms=FILE_BUDGET_MS):
+        self.detector_budget = detector_budget_ms / 1000
+        self.file_budget = file_budget_ms / 1000
+        self.records: List[DetectorTiming] = []
+
+    def file(self, name):
+        return FileProfile(self, name)
+
+    def totals(self):
+        """{detector: totals over all files}, slowest detector first"""
+        totals: Dict[str, dict] = {}
+        for r in self.records:
+            entry = totals.setdefault(r.detector, {
+                'seconds': 0.0, 'files': 0, 'matches': 0, 'bytes': 0, 'max_seconds': 0.0, 'max_file': None,
+            })
+            entry['seconds'] += r.seconds
+            entry['files'] += 1
+            entry['matches'] += r.matches
+            entry['bytes'] += r.bytes
+            if r.seconds > entry['max_seconds']:
+                entry['max_seconds'], entry['max_file'] = r.seconds, r.file
+        return dict(sorted(totals.items(), key=lambda item: item[1]['seconds'], reverse=True))
+
+    def over_budget(self):
+        """Files whose scan or any single detector went over budget, slowest first"""
+        files: Dict[str, dict] = {}
+        for r in self.records:
+            entry = files.setdefault(r.file, {'file': r.file, 'seconds': 0.0, 'detectors': {}})
+            entry['seconds'] += r.seconds
+            if r.seconds > self.detector_budget:
+                entry['detectors'][r.detector] = r.seconds
+        flagged = [entry for entry in files.values() if entry['detectors'] or entry['seconds'] > self.file_budget]
+        return sorted(flagged, key=lambda entry: entry['seconds'], reverse=True)
+
+    def to_json(self, path):
+        data = {
+            'budgets_ms': {'detector': self.detector_budget * 1000, 'file': self.file_budget * 1000},
+            'detectors': self.totals(),
+            'over_budget': self.over_budget(),
+            'records': [asdict(r) for r in self.records],
+        }
+        atomic_write(path, json.dumps(data, indent=2).encode('utf-8'))
+
+    def to_csv(self, path):
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        writer.writerow([f.name for f in fields(DetectorTiming)])
+        for r in self.records:
+            writer.writerow([getattr(r, f.name) for f in fields(DetectorTiming)])
+        atomic_write(path, buffer.getvalue().encode('utf-8'))
+
+    def print_summary(self, top=15):
+        """Slowest detectors and over-budget files"""
+        totals = self.totals()
+        overall = sum(entry['seconds'] for entry in totals.values()) or 1
+        print("=" * 80)
+        print("DETECTOR PROFILE")
+        print("=" * 80)
+        print(f"{'detector':<20} {'total':>9} {'share':>6} {'MB/s':>8} {'matches':>8} {'slowest file':>14}")
+        for name, entry in list(totals.items())[:top]:
+            rate = f"{entry['bytes'] / entry['seconds'] / 1e6:.1f}" if entry['seconds'] else '-'
+            print(f"{name:<20} {entry['seconds'] * 1000:>7.1f}ms {entry['seconds'] / overall:>6.0%} {rate:>8} "
+                  f"{entry['matches']:>8} {entry['max_seconds'] * 1000:>10.1f}ms {entry['max_file']}")
+
+        flagged = self.over_budget()
+        if not flagged:
+            print(f"\n✅ No file over budget ({self.detector_budget * 1000:g}ms per detector, {self.file_budget * 1000:g}ms per file)")
+            return
+        print(f"\n⚠️  {len(flagged)} files over budget ({self.detector_budget * 1000:g}ms per detector, {self.file_budget * 1000:g}ms per file)")
+        for entry in flagged[:top]:
+            slow = ', '.join(f"{name} {seconds * 1000:.1f}ms" for name, seconds in
+                             sorted(entry['detectors'].items(), key=lambda item: item[1], reverse=True))
+            print(f"   {entry['file']:<40} {entry['seconds'] * 1000:>7.1f}ms  {slow}")
@@ -0,0 +1,302 @@
+#!/usr/bin/env python3
+"""
+Single-pass scanner for landing pages.
+Reads each LP file once and runs every detector over the same content.
+"""
+import hashlib
+import json
+import re
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional
+
+from lp_detectors import Detector, DetectorSet
+from lp_perf import measure_page
+
+LP_DIR = Path('/www/wwwroot/portfolio.irvandoda.my.id/LP')
+
+# Required sections (see analyze_landing_pages.py)
+SECTION_PATTERNS = {
+    'header': r'<nav|<header',
+    'hero': r'hero|id=["\']home|id=["\']beranda',
+    'hero_headline': r'<h1|<h2.*hero|hero.*<h1|hero.*<h2',
+    'hero_cta': r'button.*cta|cta.*button|href=["\']#pricing|Beli|Pesan|Daftar|Order',
+    'benefit': r'benefit|keuntungan|fitur|feature|kelebihan',
+    'preview': r'preview|gallery|galeri|tampilan|lihat',
+    'testimonials': r'testimonial|review|ulasan|kata.*mereka|kata.*klien',
+    'pricing': r'pricing|harga|paket|price|tarif',
+    'footer': r'<footer',
+    'credit': r'Irvando Demas Arifiandani|irvandoda\.my\.id',
+}
+
+HERO_PATTERNS = [
+    r'hero|Hero',
+    r'id=["\']home|id=["\']beranda',
+    r'<header|<section[^>]*hero',
+    r'className.*hero|class.*hero',
+    r'py-20.*header|py-24.*header',
+    r'flex.*items-center.*justify-center.*h-screen',
+    r'pt-32|pt-48|pt-20.*pb-20',
+]
+
+NAVIGATION_PATTERNS = [
+    r'<nav',
+    r'Navigation|navigation',
+    r'className.*nav|class.*nav',
+    r'sticky.*top-0|fixed.*top-0',
+]
+
+# Presence checks behind the structure issues: (pattern, flags)
+STRUCTURE_RULES = {
+    'doctype': (r'<!DOCTYPE\s+html', re.IGNORECASE),
+    'html': (r'<html', re.IGNORECASE),
+    'body': (r'<body', re.IGNORECASE),
+    'body_close': (r'</body>', re.IGNORECASE),
+    'html_close': (r'</html>', re.IGNORECASE),
+    'react_root': (r'<div\s+id=["\']root["\']', 0),
+    'react_render': (r'ReactDOM\.(createRoot|hydrateRoot|render)', 0),
+}
+
+# Every presence rule, checked with one keyword pass per file
+DETECTORS = DetectorSet(
+    [Detector(name, pattern) for name, pattern in SECTION_PATTERNS.items()]
+    + [Detector('hero_section', '|'.join(HERO_PATTERNS)), Detector('navigation', '|'.join(NAVIGATION_PATTERNS))]
+    + [Detector(name, pattern, flags) for name, (pattern, flags) in STRUCTURE_RULES.items()]
+)
+
+_OPEN_DIV_RE = re.compile(r'<div')
+_TAG_RE = re.compile(r'<[^>]+>')
+
+_RETURN_RE = re.compile(r'return\s*\(')
+_COMPONENT_RE = re.compile(r'return\s*\(|const\s+\w+\s*=\s*\(\)\s*=>')
+_CLASS_ATTR_RE = re.compile(r'class\s*=')
+
+STRUCTURE_PATTERNS = [_OPEN_DIV_RE, _TAG_RE, _RETURN_RE, _COMPONENT_RE, _CLASS_ATTR_RE]
+
+# Bump when detector logic changes without touching any pattern
+SCANNER_VERSION = 2
+
+
+@dataclass
+class ScanResult:
+    """Everything the maintenance scripts need to know about one landing page"""
+    file: str
+    path: Path
+    size: int = 0
+    sections: Dict[str, bool] = field(default_factory=dict)
+    missing: List[str] = field(default_factory=list)
+    issues: List[str] = field(default_factory=list)
+    is_react: bool = False
+    is_babel: bool = False
+    mixed_structure: bool = False
+    has_credit: bool = False
+    has_hero: bool = False
+    has_navigation: bool = False
+    # lp_perf.page_metrics() of the page, only when scanned with perf=True and measurable
+    perf: Dict[str, object] = field(default_factory=dict)
+    error: Optional[str] = None
+    content: Optional[str] = field(default=None, repr=False, compare=False)
+
+    @property
+    def complete(self):
+        return self.error is None and not self.missing
+
+    @property
+    def broken(self):
+        return self.error is not None or bool(self.issues)
+
+    def to_dict(self):
+        """Serializable form without the file content"""
+        data = asdict(self)
+        del data['content']
+        data['path'] = str(self.path)
+        return data
+
+    @classmethod
+    def from_dict(cls, data):
+        data = dict(data)
+        data['path'] = Path(data['path'])
+        return cls(**data)
+
+
+def detector_fingerprint():
+    """Hash of every detector pattern, used to invalidate cached scan results"""
+    payload = {
+        'version': SCANNER_VERSION,
+        'sections': SECTION_PATTERNS,
+        'hero': HERO_PATTERNS,
+        'navigation': NAVIGATION_PATTERNS,
+        'detectors': [(d.name, d.pattern, int(d.flags)) for d in DETECTORS],
+        'structure': [(p.pattern, p.flags) for p in STRUCTURE_PATTERNS],
+    }
+    return hashlib.sha256(json.dumps(payload, sort_keys=True).encode('utf-8')).hexdigest()
+
+
+def is_react_file(content):
+    """Check if file uses React"""
+    return 'type="text/babel"' in content or 'ReactDOM' in content
+
+def is_babel_file(content):
+    """Check if file is transpiled in the browser by Babel"""
+    return 'type="text/babel"' in content
+
+def has_existing_credit(content):
+    """Check if credit already exists"""
+    return 'Irvando Demas Arifiandani' in content or 'irvandoda.my.id' in content
+
+def has_hero_section(content):
+    """Check if file has hero section"""
+    return DETECTORS['hero_section'].search(content)
+
+def has_navigation(content):
+    """Check if file has navigation"""
+    return DETECTORS['navigation'].search(content)
+
+def has_mixed_structure(content):
+    """Check if file has mixed HTML (class) and JSX (className)"""
+    # class= after the React component starts means HTML was pasted into JSX
+    if _COMPONENT_RE.search(content) and 'className' in content:
+        return_match = _RETURN_RE.search(content)
+        if return_match and _CLASS_ATTR_RE.search(content, return_match.end()):
+            return True
+    return False
+
+def detect_sections(content, found=None):
+    """Check which required sections are present
+
+    found is a DETECTORS.scan() result to reuse instead of scanning again.
+    """
+    if found is None:
+        found = DETECTORS.scan(content, names=SECTION_PATTERNS)
+    return {name: name in found for name in SECTION_PATTERNS}
+
+def check_structure(content, is_react=None, found=None):
+    """Check if HTML is valid and complete, return list of issues"""
+    if is_react is None:
+        is_react = is_react_file(content)
+    if found is None:
+        found = DETECTORS.scan(content, names=STRUCTURE_RULES)
+
+    issues = []
+
+    # Check if file is too small (likely broken)
+    if len(content.strip()) < 500:
+        issues.append("File terlalu kecil (kemungkinan kosong/rusak)")
+
+    # Check for basic HTML structure
+    if 'doctype' not in found:
+        issues.append("Tidak ada DOCTYPE")
+
+    if 'html' not in found:
+        issues.append("Tidak ada tag <html>")
+
+    if 'body' not in found:
+        issues.append("Tidak ada tag <body>")
+
+    if is_react:
+        # Check if React root exists
+        if 'react_root' not in found:
+            issues.append("React: Tidak ada div#root")
+
+        if 'react_render' not in found:
+            issues.append("React: Tidak ada ReactDOM render")
+
+        # Check for closing tags
+        if '<div id="root">' in content and content.count('</div>') < 3:
+            issues.append("React: Struktur tidak lengkap")
+
+    # Check for closing body/html tags
+    if 'body_close' not in found:
+        issues.append("Tidak ada closing tag </body>")
+
+    if 'html_close' not in found:
+        issues.append("Tidak ada closing tag </html>")
+
+    # Check for unclosed JSX tags (allow some difference)
+    if is_react:
+        open_divs = len(_OPEN_DIV_RE.findall(content))
+        close_divs = content.count('</div>')
+        if open_divs > close_divs + 5:
+            issues.append("React: Kemungkinan tag tidak tertutup")
+
+    # Check if file has actual content (not just empty structure)
+    text_content = _TAG_RE.sub('', content)
+    if len(text_content.strip()) < 100:
+        issues.append("Konten terlalu sedikit")
+
+    return issues
+
+def _timed(recorder, name, func, content, *args):
+    """func(content, *args), recorded as detector name when profiling"""
+    if recorder is None:
+        return func(content, *args)
+    return recorder.call(name, len(content), func, content, *args)
+
+def attach_perf(result, metrics):
+    """Give a record its lp_perf.measure_page() metrics; a failed measurement becomes an issue"""
+    if 'error' in metrics:
+        result.issues = result.issues + [f"Performa tidak bisa diukur: {metrics['error']}"]
+    else:
+        result.perf = metrics
+    return result
+
+def scan_content(file_path, content, profile=None, perf=False):
+    """Run every detector over already-loaded content
+
+    With an lp_profile.DetectorProfile, every detector is timed. perf=True
+    also measures the page for the performance budgets (lp_perf), which
+    costs a full markup and JSX parse.
+    """
+    file_path = Path(file_path)
+    recorder = profile.file(file_path.name) if profile is not None else None
+    is_react = _timed(recorder, 'is_react', is_react_file, content)
+    found = DETECTORS.scan(content, recorder=recorder)
+    sections = detect_sections(content, found)
+    result = ScanResult(
+        file=file_path.name,
+        path=file_path,
+        size=len(content),
+        sections=sections,
+        missing=[key for key, value in sections.items() if not value],
+        issues=_timed(recorder, 'check_structure', check_structure, content, is_react, found),
+        is_react=is_react,
+        is_babel=_timed(recorder, 'is_babel', is_babel_file, content),
+        mixed_structure=_timed(recorder, 'mixed_structure', has_mixed_structure, content),
+        has_credit=_timed(recorder, 'has_credit', has_existing_credit, content),
+        has_hero='hero_section' in found,
+        has_navigation='navigation' in found,
+        content=content,
+    )
+    if perf:
+        attach_perf(result, _timed(recorder, 'perf', measure_page, content))
+    return result
+
+def scan_file(file_path, profile=None, perf=False):
+    """Read a landing page once and scan it"""
+    file_path = Path(file_path)
+    try:
+        with open(file_path, 'r', encoding='utf-8') as f:
+            content = f.read()
+    except Exception as e:
+        return ScanResult(file=file_path.name, path=file_path, error=str(e))
+    return scan_content(file_path, content, profile, perf)
+
+def iter_html_files(lp_dir=LP_DIR):
+    """List landing pages in a stable order"""
+    return sorted(Path(lp_dir).glob('*.html'))
+
+def scan_directory(lp_dir=LP_DIR, cache=None) -> Iterator[ScanResult]:
+    """Scan every landing page in lp_dir, one read per file
+
+    With a ScanCache, unchanged files are served from the cache and their
+    records carry no content.
+    """
+    for html_file in iter_html_files(lp_dir):
+        yield cache.scan(html_file) if cache is not None else scan_file(html_file)
+
+if __name__ == '__main__':
+    import sys
+    lp_dir = Path(sys.argv[1]) if len(sys.argv) > 1 else LP_DIR
+    for result in scan_directory(lp_dir):
+        status = "❌" if result.broken else "✅"
+        print(f"{status} {result.file:<40} missing={','.join(result.missing) or '-'}")
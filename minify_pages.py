@@ -0,0 +1,201 @@
+#!/usr/bin/env python3
+"""
+Build stage: strip template indentation and comments from deploy pages.
+Markup whitespace is collapsed (kept verbatim in <pre>, <textarea>,
+whitespace-pre elements and prerendered #root markup), inline CSS is
+minified, and scripts lose indentation and comments while keeping every
+line break, so automatic semicolon insertion is unaffected. JSX text is
+collapsed with Babel's own whitespace rules, so it renders the same.
+"""
+import argparse
+import re
+from pathlib import Path
+
+from edit_plan import EditPlan
+from jsx_compiler import collapse_jsx_text
+from jsx_index import tokenize_script
+from lp_build import add_dir_argument, write_report
+from lp_executor import add_jobs_argument, print_task_output, run_tasks
+from lp_io import write_text
+from lp_scanner import iter_html_files
+from tag_tree import RAW_TEXT_TAGS, build_tree, iter_tokens
+
+# Whitespace next to these tags is never rendered
+_DOCUMENT_TAGS = {'html', 'head', 'body', 'title', 'meta', 'link', 'base', 'script', 'style', 'noscript', 'template'}
+_PRESERVE_TAGS = {'pre', 'textarea'}
+_PRESERVE_CLASSES = {'whitespace-pre', 'whitespace-pre-wrap', 'whitespace-pre-line', 'whitespace-break-spaces'}
+_SCRIPT_TYPES = {'', 'text/javascript', 'application/javascript', 'module', 'text/babel'}
+
+_CSS_STRING_RE = re.compile(r'("(?:[^"\\]|\\.)*"|\'(?:[^\'\\]|\\.)*\')|((?:[^"\']|/\*.*?\*/)+)', re.DOTALL)
+_CSS_TIGHT_RE = re.compile(r'\s*([{};,])\s*')
+_TAG_WHITESPACE_RE = re.compile(r'("[^"]*"|\'[^\']*\')|\s+')
+_LINE_BREAK_RE = re.compile(r'[ \t]*\n\s*')
+_WHITESPACE_RE = re.compile(r'\s+')
+
+
+def minify_css(css):
+    """Drop comments and collapse whitespace in CSS, leaving strings alone"""
+    pieces = []
+    for m in _CSS_STRING_RE.finditer(css):
+        if m.group(1):
+            pieces.append(m.group(1))
+        else:
+            code = re.sub(r'/\*.*?\*/', '', m.group(2), flags=re.DOTALL)
+            code = _CSS_TIGHT_RE.sub(r'\1', re.sub(r'\s+', ' ', code))
+            pieces.append(code.replace(';}', '}'))
+    return ''.join(pieces).strip()
+
+def minify_script(content, start, end):
+    """Script body without indentation, blank lines or comments
+
+    Strings, template literals and regexes are copied as-is, JSX text is
+    collapsed like Babel does and line breaks in code are kept. Scripts
+    that don't tokenize cleanly only lose whitespace around line breaks
+    outside template literals, which no JS or JSX construct depends on.
+    """
+    index = tokenize_script(content, start, end)
+    if index.balanced:
+        spans = sorted(
+            [(a, b, 'keep') for a, b in index.strings]
+            + [(a, b, 'comment') for a, b in index.comments]
+            + [(a, b, 'text') for a, b in index.texts]
+        )
+    else:
+        spans = [(a, b, 'keep') for a, b in index.strings if content[a] == '`']
+    pieces = []
+    pos = start
+    for span_start, span_end, kind in spans:
+        if span_start < pos:
+            # Nested in a span already copied (e.g. a string inside a template)
+            continue
+        pieces.append(_LINE_BREAK_RE.sub('\n', content[pos:span_start]))
+        span = content[span_start:span_end]
+        if kind == 'keep' or span.startswith('<!--'):
+            pieces.append(span)
+        elif kind == 'text':
+            pieces.append(collapse_jsx_text(span))
+        elif span.startswith('//'):
+            pieces.append('\n')
+        elif span.startswith('/*'):
+            # A comment spanning lines counts as a line break for ASI
+            pieces.append('\n' if '\n' in span else ' ')
+        pos = span_end
+    pieces.append(_LINE_BREAK_RE.sub('\n', content[pos:end]))
+    return '\n' + ''.join(pieces).strip() + '\n'
+
+def minify_tag(tag):
+    """Collapse whitespace between the attributes of one tag"""
+    tag = _TAG_WHITESPACE_RE.sub(lambda m: m.group(1) or ' ', tag)
+    return tag.replace(' />', '/>').replace(' >', '>')
+
+def _preserved_spans(content):
+    """{start: end} of elements whose whitespace is significant or must match hydration"""
+    spans = {}
+    for element in build_tree(content).elements:
+        tag = element.tag.lower()
+        if (tag in _PRESERVE_TAGS or _PRESERVE_CLASSES & set(element.classes)
+                or (element.attrs.get('id') == 'root' and element.inner(content).strip())):
+            if not any(start <= element.start < end for start, end in spans.items()):
+                spans[element.start] = element.end
+    return spans
+
+def _collapse_whitespace(text, before, after):
+    """Whitespace between two tags, or in text, reduced to one character"""
+    if not text.strip():
+        if before in _DOCUMENT_TAGS or after in _DOCUMENT_TAGS:
+            return ''
+        return '\n' if '\n' in text else ' '
+    return _WHITESPACE_RE.sub(lambda m: '\n' if '\n' in m.group(0) else ' ', text)
+
+def minify_markup(content):
+    """Minified page markup with its inline CSS and scripts"""
+    preserved = _preserved_spans(content)
+    plan = EditPlan()
+    pos = 0
+    previous = None
+
+    def replace(start, end, text):
+        if text != content[start:end]:
+            plan.replace(start, end - start, text)
+
+    dropped = []
+    for token in iter_tokens(content):
+        if token.start < pos:
+            continue
+        text = content[token.start:token.end]
+        if token.kind == 'comment' and text.startswith('<!--') and not text.startswith('<!--[if') and text[4:-3].strip():
+            # Dropped along with the text around it; conditional comments
+            # and React's empty text separators stay
+            dropped.append(token)
+            continue
+        tag = token.tag.lower() if token.kind != 'comment' else None
+        gap = ''.join(content[a.end if a else pos:b.start if b else token.start]
+                      for a, b in zip([None] + dropped, dropped + [None]))
+        replace(pos, token.start, _collapse_whitespace(gap, previous, tag))
+        dropped = []
+        pos = token.end
+        if token.kind == 'comment':
+            continue
+
+        replace(token.start, token.end, minify_tag(text))
+        previous = tag
+        if token.start in preserved:
+            pos = preserved[token.start]
+        elif token.kind == 'open' and tag in RAW_TEXT_TAGS and not token.self_closing:
+            close = re.compile(r'</%s\s*>' % tag, re.IGNORECASE).search(content, token.end)
+            body_end = close.start() if close else len(content)
+            body = _minify_raw_text(content, token, body_end)
+            if body is not None:
+                replace(token.end, body_end, body)
+            pos = body_end
+
+    gap = ''.join(content[a.end if a else pos:b.start if b else len(content)]
+                  for a, b in zip([None] + dropped, dropped + [None]))
+    replace(pos, len(content), _collapse_whitespace(gap, previous, None))
+    return plan.apply(content)
+
+def _minify_raw_text(content, token, body_end):
+    """New body of a <script>/<style> element, None to leave it alone"""
+    tag = token.tag.lower()
+    if tag == 'style':
+        return minify_css(content[token.end:body_end])
+    script_type = str(token.attrs.get('type', '')).lower()
+    if tag == 'script' and script_type in _SCRIPT_TYPES and 'src' not in token.attrs and content[token.end:body_end].strip():
+        return minify_script(content, token.end, body_end)
+    return None
+
+def minify_file(file_path):
+    """Minify one deploy page in place; returns its size report entry"""
+    with open(file_path, 'r', encoding='utf-8') as f:
+        content = f.read()
+    minified = minify_markup(content)
+    before = len(content.encode('utf-8'))
+    after = len(minified.encode('utf-8'))
+    write_text(file_path, minified)
+    return {'file': file_path.name, 'bytes': before, 'minified': after}
+
+def main(argv=None):
+    """Main function"""
+    parser = add_jobs_argument(add_dir_argument(argparse.ArgumentParser(description='Minify markup, inline CSS and scripts of deploy pages')))
+    args = parser.parse_args(argv)
+
+    pages_dir = Path(args.dir)
+    if not pages_dir.exists():
+        print(f"❌ Directory not found: {pages_dir} (run lp_build.py first)")
+        return
+
+    report = []
+    for task in run_tasks(minify_file, iter_html_files(pages_dir), args.jobs):
+        print_task_output(task)
+        if task.value:
+            report.append(task.value)
+
+    before = sum(entry['bytes'] for entry in report)
+    after = sum(entry['minified'] for entry in report)
+    report_file = write_report('minify_pages', {'pages': report, 'bytes': before, 'minified': after}, pages_dir)
+    saved = before - after
+    print(f"✨ Minified {len(report)} pages: {before:,} -> {after:,} bytes ({saved / before:.0%} saved)" if before else "✨ No pages to minify")
+    print(f"📋 Report: {report_file}")
+
+if __name__ == '__main__':
+    main()
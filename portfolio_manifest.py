@@ -0,0 +1,224 @@
+#!/usr/bin/env python3
+"""
+Generate the SPA's portfolio catalogue from the landing pages in LP/.
+Every page becomes an entry: title from <title>, thumbnail from the first
+image of its hero (template stock photos and avatars don't count), tags from the page type, and id, category, display
+title and description from portfolio_meta.json wherever a page is listed
+there. Entries are written as one JSON chunk per category under
+src/data/portfolios/, which Vite splits into separate files, plus a small
+src/data/portfolios.js index with the labels, counts and a loader, so the
+main bundle no longer carries the whole catalogue. The 'all' view opens on
+a first page of FIRST_PAGE_SIZE entries (_first.json) and only fetches the
+category chunks when asked for more.
+"""
+import argparse
+import html
+import json
+import re
+from urllib.parse import parse_qs, urlsplit
+
+from lp_io import add_dry_run_argument, dry_run_verb, remove_file, set_dry_run, write_text
+from lp_journal import journaled
+from lp_scanner import LP_DIR, is_react_file, iter_html_files
+from responsive_images import is_unsplash, unsplash_variant
+from section_templates import DEFAULT_DATA
+
+META_FILE = LP_DIR.parent / 'portfolio_meta.json'
+DATA_DIR = LP_DIR.parent / 'src' / 'data'
+INDEX_FILE = DATA_DIR / 'portfolios.js'
+CHUNK_DIR = DATA_DIR / 'portfolios'
+# Chunk with the first page of 'all'; the leading underscore keeps it apart from category ids
+FIRST_PAGE_CHUNK = '_first'
+FIRST_PAGE_SIZE = 12
+
+# Pages not listed in portfolio_meta.json
+DEFAULT_CATEGORY = 'lainnya'
+DEFAULT_CATEGORY_LABEL = 'Lainnya'
+DEFAULT_DATE = '2024'
+THUMBNAIL_WIDTH = 800
+# Narrower images are avatars and icons, not something to crop a card from
+MIN_THUMBNAIL_WIDTH = 400
+# Same placeholder PortfolioCard shows when an image fails to load
+PLACEHOLDER_IMAGE = 'https://placehold.co/600x400/9333ea/ffffff?text=Image'
+
+_TITLE_RE = re.compile(r'<title[^>]*>(.*?)</title>', re.IGNORECASE | re.DOTALL)
+_TITLE_SPLIT_RE = re.compile(r'\s+[-|–—]\s+')
+_DESCRIPTION_RE = re.compile(r'<meta\s+name=["\']description["\']\s+content=["\']([^"\']*)["\']', re.IGNORECASE)
+_BODY_RE = re.compile(r'<body\b', re.IGNORECASE)
+_HERO_RE = re.compile(r'<(section|header)\b', re.IGNORECASE)
+_IMAGE_RE = re.compile(r'<img\b[^>]*?\ssrc=["\']([^"\']+)["\']|url\(\s*["\']?((?:https?:)?/[^"\')\s]+)', re.IGNORECASE)
+
+INDEX_TEMPLATE = '''// Generated by portfolio_manifest.py from LP/ and portfolio_meta.json - do not edit.
+// Entries live in one JSON chunk per category (./portfolios/*.json), loaded on demand.
+
+export const categoryLabels = {labels};
+
+export const categoryCounts = {counts};
+
+export const portfolioCount = {total};
+
+const chunks = import.meta.glob('./portfolios/*.json', {{ import: 'default' }});
+
+// First {first_page} entries of 'all', so a first visit doesn't fetch every chunk
+export function loadFirstPage() {{
+    return chunks['./portfolios/{first_chunk}.json']();
+}}
+
+// Entries of one category, or of every category for 'all'
+export function loadPortfolios(category) {{
+    const names = category === 'all' ? Object.keys(categoryCounts) : [category];
+    return Promise.all(
+        names.filter((name) => chunks[`./portfolios/${{name}}.json`])
+            .map((name) => chunks[`./portfolios/${{name}}.json`]())
+    ).then((lists) => lists.flat());
+}}
+'''
+
+
+def load_meta(meta_file=META_FILE):
+    """Curated categories and per-page fields"""
+    with open(meta_file, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+def page_title(content):
+    """Site name part of the page's <title>, None without one"""
+    match = _TITLE_RE.search(content)
+    if not match:
+        return None
+    title = html.unescape(' '.join(match.group(1).split()))
+    return _TITLE_SPLIT_RE.split(title)[0] or None
+
+def page_description(content):
+    match = _DESCRIPTION_RE.search(content)
+    return html.unescape(match.group(1)).strip() if match else None
+
+# Stock photos the section templates fill pages with; they say nothing about the page
+_TEMPLATE_IMAGES = {urlsplit(url).path for url in DEFAULT_DATA['images']}
+
+
+def hero_span(content):
+    """(start, end) of the hero: from <body> to the end of the first <section> or <header>"""
+    body = _BODY_RE.search(content)
+    start = body.start() if body else 0
+    first = _HERO_RE.search(content, start)
+    if not first:
+        return start, len(content)
+    closing_re = re.compile(rf'<(/?){first.group(1)}\b[^>]*>', re.IGNORECASE)
+    depth = 1
+    for match in closing_re.finditer(content, first.end()):
+        depth += -1 if match.group(1) else 1
+        if depth == 0:
+            return start, match.end()
+    return start, len(content)
+
+def is_thumbnail_candidate(url):
+    """Whether an image can stand for the page on its card"""
+    if url.startswith('data:') or url.lower().endswith('.svg'):
+        return False
+    parts = urlsplit(url)
+    if is_unsplash(url) and parts.path in _TEMPLATE_IMAGES:
+        return False
+    params = parse_qs(parts.query)
+    if 'facearea' in params.get('fit', []) + params.get('crop', []):
+        return False
+    width = params.get('w', [''])[0]
+    return not (width.isdigit() and int(width) < MIN_THUMBNAIL_WIDTH)
+
+def hero_image(content):
+    """First image of the page's hero as a card thumbnail, None without one"""
+    start, end = hero_span(content)
+    for match in _IMAGE_RE.finditer(content, start, end):
+        url = html.unescape(match.group(1) or match.group(2))
+        if is_thumbnail_candidate(url):
+            return unsplash_variant(url, THUMBNAIL_WIDTH) if is_unsplash(url) else url
+    return None
+
+def page_entry(file_path, meta=None):
+    """Catalogue entry of one landing page"""
+    meta = meta or {}
+    with open(file_path, 'r', encoding='utf-8') as f:
+        content = f.read()
+    title = meta.get('title') or page_title(content) or file_path.stem.replace('-', ' ').title()
+    return {
+        'id': meta.get('id') or file_path.stem.replace('-', ''),
+        'url': f'/LP/{file_path.name}',
+        'title': title,
+        'category': meta.get('category') or DEFAULT_CATEGORY,
+        'description': meta.get('description') or page_description(content) or f'Landing page untuk {title}.',
+        'image': meta.get('image') or hero_image(content) or PLACEHOLDER_IMAGE,
+        'tags': meta.get('tags') or (['React', 'Tailwind', 'JS'] if is_react_file(content) else ['HTML', 'Tailwind', 'JS']),
+        'date': meta.get('date') or DEFAULT_DATE,
+    }
+
+def build_manifest(lp_dir=LP_DIR, meta=None):
+    """({category: entries}, {category: label}) in meta order, unlisted pages last"""
+    meta = meta if meta is not None else load_meta()
+    pages = {path.name: path for path in iter_html_files(lp_dir)}
+    listed = [name for name in meta.get('pages', {}) if name in pages]
+    unlisted = sorted(set(pages) - set(listed))
+
+    labels = dict(meta.get('categories', {}))
+    chunks = {category: [] for category in labels}
+    for name in listed + unlisted:
+        entry = page_entry(pages[name], meta['pages'].get(name))
+        if entry['category'] not in labels:
+            labels[entry['category']] = DEFAULT_CATEGORY_LABEL if entry['category'] == DEFAULT_CATEGORY else entry['category']
+        chunks.setdefault(entry['category'], []).append(entry)
+    return {category: entries for category, entries in chunks.items() if entries}, labels
+
+def render_index(chunks, labels):
+    """Source of src/data/portfolios.js"""
+    shown = {'all': 'Semua'}
+    shown.update((category, label) for category, label in labels.items() if category in chunks)
+    return INDEX_TEMPLATE.format(
+        labels=json.dumps(shown, ensure_ascii=False, indent=4),
+        counts=json.dumps({category: len(entries) for category, entries in chunks.items()}, indent=4),
+        total=sum(len(entries) for entries in chunks.values()),
+        first_page=FIRST_PAGE_SIZE,
+        first_chunk=FIRST_PAGE_CHUNK,
+    )
+
+def first_page(chunks, size=FIRST_PAGE_SIZE):
+    """Leading entries of the 'all' view, in the order loadPortfolios('all') returns them"""
+    return [entry for entries in chunks.values() for entry in entries][:size]
+
+def write_manifest(chunks, labels, data_dir=DATA_DIR):
+    """Write the chunks and index; returns how many files changed"""
+    chunk_dir = data_dir / CHUNK_DIR.name
+    chunk_dir.mkdir(parents=True, exist_ok=True)
+    changed = 0
+    files = dict(chunks)
+    files[FIRST_PAGE_CHUNK] = first_page(chunks)
+    for name, entries in files.items():
+        data = json.dumps(entries, ensure_ascii=False, indent=2) + '\n'
+        changed += write_text(chunk_dir / f'{name}.json', data)
+    for stale in chunk_dir.glob('*.json'):
+        if stale.stem not in files:
+            remove_file(stale)
+            print(f"🗑️  {dry_run_verb('Removed', 'Would remove')} {stale.name}")
+            changed += 1
+    changed += write_text(data_dir / INDEX_FILE.name, render_index(chunks, labels))
+    return changed
+
+@journaled('portfolio_manifest')
+def main(argv=None):
+    """Main function"""
+    parser = add_dry_run_argument(argparse.ArgumentParser(description='Generate the SPA portfolio catalogue from LP/'))
+    args = parser.parse_args(argv)
+    set_dry_run(args.dry_run)
+
+    if not LP_DIR.exists():
+        print(f"❌ Directory not found: {LP_DIR}")
+        return
+
+    chunks, labels = build_manifest(LP_DIR)
+    for category, entries in chunks.items():
+        missing = sum(1 for entry in entries if entry['image'] == PLACEHOLDER_IMAGE)
+        note = f" ({missing} without image)" if missing else ''
+        print(f"📦 {category}.json: {len(entries)} entries{note}")
+    changed = write_manifest(chunks, labels)
+    total = sum(len(entries) for entries in chunks.values())
+    print(f"\n✨ {total} portfolios in {len(chunks)} category chunks, {changed} files {dry_run_verb('updated', 'would be updated')}")
+
+if __name__ == '__main__':
+    main()
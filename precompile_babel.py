@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""
+Build stage: compile text/babel scripts to plain JavaScript.
+Pages whose JSX compiles get React.createElement code in a module script
+(deferred and strict, like Babel's own execution after the document has
+loaded) and no longer load @babel/standalone; pages that don't compile are
+left untouched and listed in the validation report.
+"""
+import argparse
+import re
+from pathlib import Path
+
+from edit_plan import EditPlan
+from jsx_compiler import JsxCompileError, compile_jsx
+from jsx_index import iter_babel_scripts
+from lp_build import add_dir_argument, write_report
+from lp_executor import add_jobs_argument, print_task_output, run_tasks
+from lp_io import write_text
+from lp_scanner import iter_html_files
+
+BABEL_STANDALONE_RE = re.compile(
+    r'[ \t]*<script\b[^>]*\ssrc=["\'][^"\']*@babel/standalone[^"\']*["\'][^>]*>\s*</script>[ \t]*\n?',
+    re.IGNORECASE
+)
+_BABEL_TYPE_RE = re.compile(r'\s+type=["\']text/babel["\']', re.IGNORECASE)
+
+
+def precompile_page(content):
+    """Compile every text/babel block; returns (new content, errors)
+
+    If any block fails the page is returned unchanged, since it still
+    needs Babel in the browser.
+    """
+    plan = EditPlan()
+    errors = []
+    for tag_start, body_start, body_end in iter_babel_scripts(content):
+        try:
+            code = compile_jsx(content, body_start, body_end)
+        except JsxCompileError as e:
+            line, column = e.location(content)
+            line_start = content.rfind('\n', 0, e.offset) + 1
+            line_end = content.find('\n', e.offset)
+            errors.append({
+                'line': line,
+                'column': column,
+                'message': str(e),
+                'source': content[line_start:line_end if line_end != -1 else len(content)].strip()[:200],
+            })
+            continue
+        tag = content[tag_start:body_start]
+        plan.replace(tag_start, len(tag), _BABEL_TYPE_RE.sub(' type="module"', tag, count=1))
+        plan.replace(body_start, body_end - body_start, code)
+
+    if errors or not plan:
+        return content, errors
+
+    babel = BABEL_STANDALONE_RE.search(content)
+    if babel:
+        plan.delete(babel.start(), babel.end() - babel.start())
+    return plan.apply(content), errors
+
+def precompile_file(file_path):
+    """Precompile one page in place; returns a report entry or None"""
+    with open(file_path, 'r', encoding='utf-8') as f:
+        content = f.read()
+
+    new_content, errors = precompile_page(content)
+    if errors:
+        for error in errors:
+            print(f"❌ {file_path.name}:{error['line']}:{error['column']}: {error['message']}")
+        return {'file': file_path.name, 'compiled': False, 'errors': errors}
+    if new_content == content:
+        return None
+
+    write_text(file_path, new_content)
+    print(f"✅ Compiled {file_path.name} ({len(content) - len(new_content):+,} bytes)")
+    return {'file': file_path.name, 'compiled': True, 'errors': []}
+
+def main(argv=None):
+    """Main function"""
+    parser = add_jobs_argument(add_dir_argument(argparse.ArgumentParser(description='Compile text/babel JSX in deploy pages to plain JavaScript')))
+    args = parser.parse_args(argv)
+
+    pages_dir = Path(args.dir)
+    if not pages_dir.exists():
+        print(f"❌ Directory not found: {pages_dir} (run lp_build.py first)")
+        return
+
+    html_files = iter_html_files(pages_dir)
+    entries = []
+    for task in run_tasks(precompile_file, html_files, args.jobs):
+        print_task_output(task)
+        if task.value:
+            entries.append(task.value)
+
+    compiled = [entry for entry in entries if entry['compiled']]
+    failed = [entry for entry in entries if not entry['compiled']]
+    report_file = write_report('precompile_babel', {
+        'compiled': [entry['file'] for entry in compiled],
+        'failed': failed,
+    }, pages_dir)
+
+    print(f"\n✨ Compiled {len(compiled)}/{len(entries)} Babel pages, {len(failed)} still need Babel")
+    print(f"📋 Report: {report_file}")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+"""
+Build stage: write .gz and .br siblings for static text files.
+Compresses the deploy pages (and their assets/) plus the site's own
+assets/ and dist/assets/ at maximum level so Apache can serve them as-is
+instead of running mod_deflate on every request. Brotli needs the optional
+brotli package; without it only .gz files are written.
+"""
+import argparse
+import gzip
+from functools import partial
+from pathlib import Path
+
+from lp_build import add_dir_argument, write_report
+from lp_executor import add_jobs_argument, print_task_output, run_tasks
+from lp_io import atomic_write
+from lp_scanner import LP_DIR
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+SITE_ROOTS = [LP_DIR.parent / 'assets', LP_DIR.parent / 'dist' / 'assets']
+COMPRESSIBLE = {'.html', '.htm', '.css', '.js', '.mjs', '.json', '.svg', '.xml', '.txt', '.map'}
+MIN_SIZE = 256
+
+ENCODERS = {
+    '.gz': lambda data: gzip.compress(data, compresslevel=9, mtime=0),
+    '.br': lambda data: brotli.compress(data, quality=11),
+}
+
+
+def available_encodings():
+    """Sibling suffixes this environment can produce"""
+    return ['.gz', '.br'] if brotli is not None else ['.gz']
+
+def iter_sources(root):
+    """Compressible files under root, in a stable order"""
+    return sorted(
+        path for path in Path(root).rglob('*')
+        if path.is_file() and path.suffix.lower() in COMPRESSIBLE
+    )
+
+def remove_orphans(root):
+    """Delete .gz/.br siblings whose source file is gone; returns how many"""
+    removed = 0
+    for suffix in ENCODERS:
+        for sibling in Path(root).rglob(f'*{suffix}'):
+            source = sibling.with_suffix('')
+            if source.suffix.lower() in COMPRESSIBLE and not source.exists():
+                sibling.unlink()
+                removed += 1
+    return removed
+
+def compress_file(path, encodings=('.gz',), force=False):
+    """Write compressed siblings of one file; returns its report entry
+
+    A sibling is left alone when it's newer than the source, and removed
+    when compression wouldn't make the file smaller.
+    """
+    size = path.stat().st_size
+    entry = {'file': str(path), 'bytes': size}
+    if size < MIN_SIZE:
+        return entry
+    data = None
+    for suffix in encodings:
+        sibling = path.with_name(path.name + suffix)
+        if not force and sibling.exists() and sibling.stat().st_mtime >= path.stat().st_mtime:
+            entry[suffix[1:]] = sibling.stat().st_size
+            entry['cached'] = True
+            continue
+        if data is None:
+            data = path.read_bytes()
+        compressed = ENCODERS[suffix](data)
+        if len(compressed) >= size:
+            sibling.unlink(missing_ok=True)
+            continue
+        atomic_write(sibling, compressed)
+        entry[suffix[1:]] = len(compressed)
+    return entry
+
+def _ratio(part, whole):
+    return f"{part / whole:.0%}" if whole else '-'
+
+def summarize(label, entries, encodings):
+    """Print the size/ratio line of one root"""
+    total = sum(entry['bytes'] for entry in entries)
+    parts = []
+    for suffix in encodings:
+        key = suffix[1:]
+        compressed = [entry for entry in entries if key in entry]
+        original = sum(entry['bytes'] for entry in compressed)
+        size = sum(entry[key] for entry in compressed)
+        parts.append(f"{key} {size:,} ({_ratio(size, original)})")
+    written = sum(1 for entry in entries if not entry.get('cached') and any(s[1:] in entry for s in encodings))
+    print(f"✅ {label}: {len(entries)} files, {total:,} bytes -> {', '.join(parts)}; {written} recompressed")
+
+def main(argv=None):
+    """Main function"""
+    parser = add_jobs_argument(add_dir_argument(argparse.ArgumentParser(description='Write .gz/.br siblings for static text files')))
+    parser.add_argument('--root', action='append', metavar='DIR', help='extra directory to compress (repeatable, default: assets/ and dist/assets/)')
+    parser.add_argument('--force', action='store_true', help='recompress even if siblings are up to date')
+    args = parser.parse_args(argv)
+
+    encodings = available_encodings()
+    if brotli is None:
+        print("⚠️  brotli is not installed (pip install brotli), writing .gz only")
+
+    roots = [Path(args.dir)] + [Path(root) for root in (args.root or SITE_ROOTS)]
+    compress = partial(compress_file, encodings=encodings, force=args.force)
+    report = {}
+    for root in roots:
+        if not root.exists():
+            print(f"⏭️  {root} not found, skipping")
+            continue
+        removed = remove_orphans(root)
+        entries = []
+        for task in run_tasks(compress, iter_sources(root), args.jobs):
+            print_task_output(task)
+            if task.value:
+                entries.append(task.value)
+        summarize(root, entries, encodings)
+        if removed:
+            print(f"🗑️  Removed {removed} stale siblings in {root}")
+        report[str(root)] = entries
+
+    report_file = write_report('precompress', report, args.dir)
+    print(f"\n✨ Precompressed {sum(len(entries) for entries in report.values())} files ({', '.join(encodings)})")
+    print(f"📋 Report: {report_file}")
+
+if __name__ == '__main__':
+    main()
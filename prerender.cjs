@@ -0,0 +1,89 @@
+// Render compiled landing page scripts to static HTML (used by prerender.py).
+// Reads [{id, code}] as JSON on stdin and writes {id: {html} | {error, component}}
+// to stdout. code is the page's text/babel scripts compiled to createElement
+// calls; whatever it passes to root.render() is rendered with react-dom/server.
+const path = require('path');
+const React = require(path.join(__dirname, 'node_modules', 'react'));
+const { renderToString } = require(path.join(__dirname, 'node_modules', 'react-dom', 'server'));
+
+// Browser globals are off limits while rendering: touching them means the
+// component can't be evaluated statically
+function unavailable(name) {
+  return new Proxy({}, {
+    get(_, key) {
+      throw new Error(`${name}.${String(key)} is not available during prerender`);
+    },
+  });
+}
+
+function prerender(job) {
+  const wrappers = new Map();
+  let failed = null;
+  let element;
+
+  // Track which component is rendering so failures can be attributed
+  function track(type) {
+    if (!wrappers.has(type)) {
+      const name = type.displayName || type.name || 'Anonymous';
+      const wrapper = (props) => {
+        try {
+          return type(props);
+        } catch (error) {
+          // The innermost component sees the error first
+          if (failed === null) failed = name;
+          throw error;
+        }
+      };
+      wrapper.displayName = name;
+      wrappers.set(type, wrapper);
+    }
+    return wrappers.get(type);
+  }
+
+  const PageReact = {
+    ...React,
+    createElement(type, ...rest) {
+      const isComponent = typeof type === 'function' && !(type.prototype && type.prototype.isReactComponent);
+      return React.createElement(isComponent ? track(type) : type, ...rest);
+    },
+  };
+  const root = { render(node) { element = node; } };
+  const ReactDOM = { createRoot: () => root, render: (node) => { element = node; } };
+  const document = new Proxy({}, {
+    get(_, key) {
+      if (key === 'getElementById') return () => ({});
+      throw new Error(`document.${String(key)} is not available during prerender`);
+    },
+  });
+
+  try {
+    Function('React', 'ReactDOM', 'document', 'window', `"use strict";\n${job.code}`)(
+      PageReact, ReactDOM, document, unavailable('window')
+    );
+  } catch (error) {
+    return { error: `page script: ${error.message}`, component: null };
+  }
+  if (element === undefined) {
+    return { error: 'nothing was passed to root.render()', component: null };
+  }
+  try {
+    return { html: renderToString(element) };
+  } catch (error) {
+    return { error: error.message, component: failed };
+  }
+}
+
+async function main() {
+  let input = '';
+  for await (const chunk of process.stdin) input += chunk;
+  const output = {};
+  for (const job of JSON.parse(input)) {
+    output[job.id] = prerender(job);
+  }
+  process.stdout.write(JSON.stringify(output));
+}
+
+main().catch((error) => {
+  process.stderr.write(`${error.stack || error}\n`);
+  process.exit(1);
+});
@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""
+Build stage: prerender React pages into <div id="root">.
+Each page's text/babel scripts are compiled with jsx_compiler and rendered
+once with the local react-dom/server, so the markup is exactly what React
+would produce in the browser. The static HTML goes into #root and the
+createRoot()/render() mount becomes hydrateRoot(), so the page paints
+before any JavaScript runs and React attaches to it afterwards. Pages
+whose components touch browser globals while rendering, or whose JSX
+doesn't compile, are left as they are and listed in the report.
+"""
+import argparse
+import re
+from pathlib import Path
+
+from edit_plan import EditPlan
+from jsx_compiler import JsxCompileError, compile_jsx
+from jsx_index import iter_babel_scripts
+from lp_build import add_dir_argument, run_node_script, write_report
+from lp_executor import add_jobs_argument, print_task_output, run_tasks
+from lp_io import write_text
+from lp_scanner import LP_DIR, iter_html_files
+
+PRERENDER_SCRIPT = LP_DIR.parent / 'prerender.cjs'
+
+EMPTY_ROOT_RE = re.compile(r'(<div\s+id=["\']root["\']\s*>)\s*(</div>)')
+MOUNT_RE = re.compile(
+    r'(?:const|let|var)\s+(\w+)\s*=\s*ReactDOM\.createRoot\(\s*(document\.getElementById\(\s*["\']root["\']\s*\))\s*\)\s*;?'
+    r'\s*\1\.render\(\s*(.*?)\s*\)\s*;',
+    re.DOTALL
+)
+
+
+def page_job(file_path):
+    """Compiled script of one page for the renderer; {'id', 'code'} or {'id', 'error'}"""
+    with open(file_path, 'r', encoding='utf-8') as f:
+        content = f.read()
+    scripts = list(iter_babel_scripts(content))
+    if not scripts or not EMPTY_ROOT_RE.search(content):
+        return None
+    if not any(MOUNT_RE.search(content, body_start, body_end) for _, body_start, body_end in scripts):
+        return {'id': file_path.name, 'error': 'no createRoot(#root).render() mount found'}
+    code = []
+    for _, body_start, body_end in scripts:
+        try:
+            code.append(compile_jsx(content, body_start, body_end))
+        except JsxCompileError as e:
+            line, column = e.location(content)
+            return {'id': file_path.name, 'error': f'JSX does not compile ({line}:{column}: {e})'}
+    return {'id': file_path.name, 'code': '\n'.join(code)}
+
+def hydrate_page(content, html):
+    """Put prerendered markup into #root and hydrate instead of rendering"""
+    plan = EditPlan()
+    root = EMPTY_ROOT_RE.search(content)
+    plan.replace(root.end(1), root.start(2) - root.end(1), html)
+    for _, body_start, body_end in iter_babel_scripts(content):
+        mount = MOUNT_RE.search(content, body_start, body_end)
+        if mount:
+            plan.replace(mount.start(), mount.end() - mount.start(),
+                         f'ReactDOM.hydrateRoot({mount.group(2)}, {mount.group(3)});')
+            break
+    return plan.apply(content)
+
+def main(argv=None):
+    """Main function"""
+    parser = add_jobs_argument(add_dir_argument(argparse.ArgumentParser(description='Prerender React landing pages to static HTML with hydration')))
+    args = parser.parse_args(argv)
+
+    pages_dir = Path(args.dir)
+    if not pages_dir.exists():
+        print(f"❌ Directory not found: {pages_dir} (run lp_build.py first)")
+        return
+
+    jobs = []
+    skipped = []
+    for task in run_tasks(page_job, iter_html_files(pages_dir), args.jobs):
+        print_task_output(task)
+        if task.value is None:
+            continue
+        if 'error' in task.value:
+            skipped.append({'file': task.value['id'], 'component': None, 'error': task.value['error']})
+        else:
+            jobs.append(task.value)
+
+    print(f"⚛️  Rendering {len(jobs)} pages with react-dom/server...")
+    try:
+        results = run_node_script(PRERENDER_SCRIPT, jobs) if jobs else {}
+    except (RuntimeError, OSError, ValueError) as e:
+        print(f"❌ Prerender failed, pages keep client-side rendering: {e}")
+        return
+
+    rendered = []
+    for name, result in results.items():
+        if 'error' in result:
+            skipped.append({'file': name, 'component': result['component'], 'error': result['error']})
+            where = f" in <{result['component']}>" if result['component'] else ''
+            print(f"⚠️  {name}: can't evaluate{where}: {result['error']}")
+            continue
+        path = pages_dir / name
+        with open(path, 'r', encoding='utf-8') as f:
+            content = f.read()
+        write_text(path, hydrate_page(content, result['html']))
+        rendered.append({'file': name, 'html_bytes': len(result['html'].encode('utf-8'))})
+        print(f"✅ {name}: {rendered[-1]['html_bytes']:,} bytes of static HTML")
+
+    report_file = write_report('prerender', {'rendered': rendered, 'skipped': skipped}, pages_dir)
+    print(f"\n✨ Prerendered {len(rendered)} pages, {len(skipped)} still render client-side only")
+    print(f"📋 Report: {report_file}")
+
+if __name__ == '__main__':
+    main()
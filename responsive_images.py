@@ -0,0 +1,251 @@
+#!/usr/bin/env python3
+"""
+Responsive <img> rewriting for Unsplash images in HTML and JSX.
+Adds width-variant srcset/sizes through Unsplash's URL parameters, lazy
+loading and async decoding below the fold, and width/height wherever the
+intrinsic aspect ratio is actually known.
+"""
+import argparse
+import html
+import re
+from dataclasses import dataclass, field
+from pathlib import Path
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+from edit_plan import EditPlan
+from jsx_index import iter_babel_scripts
+from lp_build import add_dir_argument, write_report
+from lp_executor import add_jobs_argument, print_task_output, run_tasks
+from lp_io import write_text
+from lp_scanner import iter_html_files
+from tag_tree import build_tree
+
+UNSPLASH_HOSTS = {'images.unsplash.com', 'plus.unsplash.com'}
+SRCSET_WIDTHS = (320, 480, 640, 800, 1080, 1280, 1600, 1920)
+MAX_WIDTH = 1920
+
+# Tailwind breakpoints, mobile first
+BREAKPOINTS = {'': 0, 'sm': 640, 'md': 768, 'lg': 1024, 'xl': 1280, '2xl': 1536}
+
+_GRID_COLS_RE = re.compile(r'grid-cols-(\d+)')
+_FRACTION_WIDTH_RE = re.compile(r'(?:w|basis)-(\d+)/(\d+)')
+_FIXED_SIZE_RE = re.compile(r'(w|h|size)-(?:(\d+(?:\.5)?)|\[(\d+)px\])')
+_FOLD_TAGS = ('section', 'header')
+
+
+@dataclass
+class ImageStats:
+    """What a rewrite did, for the build report"""
+    images: int = 0
+    responsive: int = 0
+    lazy: int = 0
+    sized: int = 0
+    skipped: list = field(default_factory=list)
+
+    def merge(self, other):
+        self.images += other.images
+        self.responsive += other.responsive
+        self.lazy += other.lazy
+        self.sized += other.sized
+        self.skipped.extend(other.skipped)
+
+
+def is_unsplash(url):
+    return urlsplit(url).hostname in UNSPLASH_HOSTS
+
+def unsplash_variant(url, width, height=None):
+    """Same Unsplash image at another width (and crop height)"""
+    parts = urlsplit(url)
+    params = [(key, value) for key, value in parse_qsl(parts.query, keep_blank_values=True) if key not in ('w', 'h')]
+    params.append(('w', str(width)))
+    if height:
+        params.append(('h', str(height)))
+        if not any(key == 'fit' for key, _ in params):
+            params.append(('fit', 'crop'))
+    return urlunsplit(parts._replace(query=urlencode(params, safe=',')))
+
+def _url_size(url):
+    params = dict(parse_qsl(urlsplit(url).query))
+    width = int(params['w']) if params.get('w', '').isdigit() else None
+    height = int(params['h']) if params.get('h', '').isdigit() else None
+    return width, height
+
+def _breakpoint_classes(element):
+    """(breakpoint px, utility) for responsive classes; hover: and friends are skipped"""
+    for cls in element.classes:
+        prefix, _, utility = cls.rpartition(':')
+        if prefix in BREAKPOINTS:
+            yield BREAKPOINTS[prefix], utility
+
+def _fixed_box(element):
+    """(width px, height px) from w-N/h-N/size-N classes without breakpoints"""
+    width = height = None
+    for breakpoint, utility in _breakpoint_classes(element):
+        m = _FIXED_SIZE_RE.fullmatch(utility)
+        if breakpoint or not m:
+            continue
+        px = int(m.group(3)) if m.group(3) else round(float(m.group(2)) * 4)
+        if m.group(1) in ('w', 'size'):
+            width = px
+        if m.group(1) in ('h', 'size'):
+            height = px
+    return width, height
+
+def slot_fraction(element, breakpoint):
+    """Fraction of the viewport an element gets at a breakpoint"""
+    fraction = 1.0
+    node = element.parent
+    while node is not None and node.tag:
+        best = None
+        for bp, utility in _breakpoint_classes(node):
+            if bp > breakpoint or (best is not None and bp < best[0]):
+                continue
+            cols = _GRID_COLS_RE.fullmatch(utility)
+            part = _FRACTION_WIDTH_RE.fullmatch(utility)
+            if cols and int(cols.group(1)):
+                best = (bp, 1 / int(cols.group(1)))
+            elif part and int(part.group(2)):
+                best = (bp, int(part.group(1)) / int(part.group(2)))
+        if best:
+            fraction *= best[1]
+        node = node.parent
+    return fraction
+
+def image_sizes(element):
+    """sizes attribute for an element from its layout classes"""
+    entries = [
+        (breakpoint, max(1, round(slot_fraction(element, breakpoint) * 100)))
+        for breakpoint in sorted(BREAKPOINTS.values(), reverse=True)
+    ]
+    # Keep only breakpoints where the value changes, widest first
+    result = []
+    for index, (breakpoint, vw) in enumerate(entries):
+        narrower = entries[index + 1][1] if breakpoint else None
+        if breakpoint == 0:
+            result.append(f'{vw}vw')
+        elif vw != narrower:
+            result.append(f'(min-width: {breakpoint}px) {vw}vw')
+    return ', '.join(result)
+
+def _fold_offset(tree):
+    """Images starting before this offset are above the fold"""
+    for element in tree.elements:
+        if element.tag.lower() in _FOLD_TAGS:
+            return element.end
+    images = tree.find(['img'])
+    return images[0].end if images else 0
+
+def _attributes(values, jsx):
+    names = {'srcset': 'srcSet'} if jsx else {}
+    return ''.join(f' {names.get(name, name)}="{value}"' for name, value in values)
+
+def plan_images(content, start=0, end=None, jsx=False, fold=None, plan=None):
+    """Plan responsive attributes for the images in content[start:end]
+
+    fold is the offset where lazy loading starts; by default the end of the
+    first <section>/<header> (the hero). Returns (plan, ImageStats).
+    """
+    plan = EditPlan() if plan is None else plan
+    stats = ImageStats()
+    tree = build_tree(content, start, end)
+    fold = _fold_offset(tree) if fold is None else fold
+
+    for element in tree.find(['img']):
+        stats.images += 1
+        attrs = {name.lower(): value for name, value in element.attrs.items()}
+        src = attrs.get('src')
+        values = []
+
+        if isinstance(src, str) and not src.startswith('{') and is_unsplash(html.unescape(src)):
+            if 'srcset' not in attrs:
+                url = html.unescape(src)
+                url_width, url_height = _url_size(url)
+                box_width, box_height = _fixed_box(element)
+                if box_width:
+                    # Fixed-size box (avatars, logos): 1x and 2x
+                    widths = [box_width, box_width * 2]
+                    ratio = box_height / box_width if box_height else None
+                    sizes = f'{box_width}px'
+                else:
+                    base = url_width or 800
+                    widths = sorted({w for w in SRCSET_WIDTHS if w <= min(base * 2, MAX_WIDTH)} | {base})
+                    ratio = url_height / url_width if url_width and url_height else None
+                    sizes = image_sizes(element)
+                srcset = ', '.join(
+                    f'{unsplash_variant(url, w, round(w * ratio) if ratio else None)} {w}w' for w in widths
+                )
+                values += [('srcset', srcset), ('sizes', sizes)]
+                stats.responsive += 1
+                if 'width' not in attrs and 'height' not in attrs:
+                    if box_width and box_height:
+                        values += [('width', box_width), ('height', box_height)]
+                        stats.sized += 1
+                    elif url_width and url_height:
+                        values += [('width', url_width), ('height', url_height)]
+                        stats.sized += 1
+        elif isinstance(src, str) and src.startswith('{'):
+            stats.skipped.append(f'dynamic src {src[:60]}')
+
+        if element.start >= fold:
+            if 'loading' not in attrs:
+                values.append(('loading', 'lazy'))
+                stats.lazy += 1
+            if 'decoding' not in attrs:
+                values.append(('decoding', 'async'))
+
+        if values:
+            position = element.open_end - 2 if content.startswith('/>', element.open_end - 2) else element.open_end - 1
+            while content[position - 1].isspace():
+                position -= 1
+            plan.insert(position, _attributes(values, jsx))
+    return plan, stats
+
+def rewrite_images(content, jsx=False, lazy=True):
+    """Rewrite the images of a markup fragment, e.g. a section template"""
+    plan, _ = plan_images(content, jsx=jsx, fold=0 if lazy else len(content))
+    return plan.apply(content)
+
+def rewrite_page(content):
+    """Rewrite the HTML and text/babel JSX images of a page; returns (content, stats)"""
+    plan = EditPlan()
+    _, stats = plan_images(content, plan=plan)
+    for _, body_start, body_end in iter_babel_scripts(content):
+        _, script_stats = plan_images(content, body_start, body_end, jsx=True, plan=plan)
+        stats.merge(script_stats)
+    return plan.apply(content), stats
+
+def rewrite_file(file_path):
+    """Rewrite one deploy page in place; returns its report entry"""
+    with open(file_path, 'r', encoding='utf-8') as f:
+        content = f.read()
+    new_content, stats = rewrite_page(content)
+    if new_content != content:
+        write_text(file_path, new_content)
+        print(f"✅ {file_path.name}: {stats.responsive} responsive, {stats.lazy} lazy, {stats.sized} sized")
+    return {'file': file_path.name, **stats.__dict__}
+
+def main(argv=None):
+    """Main function"""
+    parser = add_jobs_argument(add_dir_argument(argparse.ArgumentParser(description='Add responsive srcset/sizes and lazy loading to Unsplash images')))
+    args = parser.parse_args(argv)
+
+    pages_dir = Path(args.dir)
+    if not pages_dir.exists():
+        print(f"❌ Directory not found: {pages_dir} (run lp_build.py first)")
+        return
+
+    report = []
+    total = ImageStats()
+    for task in run_tasks(rewrite_file, iter_html_files(pages_dir), args.jobs):
+        print_task_output(task)
+        if task.value:
+            report.append(task.value)
+            total.merge(ImageStats(**{key: value for key, value in task.value.items() if key != 'file'}))
+
+    report_file = write_report('responsive_images', report, pages_dir)
+    print(f"\n✨ {total.images} images: {total.responsive} responsive, {total.lazy} lazy, "
+          f"{total.sized} with intrinsic size, {len(total.skipped)} dynamic")
+    print(f"📋 Report: {report_file}")
+
+if __name__ == '__main__':
+    main()
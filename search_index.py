@@ -0,0 +1,305 @@
+#!/usr/bin/env python3
+"""
+Build the portfolio SPA's full-text search index from the landing pages.
+Titles, headings and section text are extracted from the HTML and from the
+JSX of text/babel pages, weighted per field and merged into an inverted
+index: terms sorted and front-coded in blocks, posting lists delta- and
+varint-encoded. The result is a single static JSON file the SPA imports
+lazily (see src/data/search.js). Extracted terms are cached per page, so a
+rebuild only re-reads the pages that changed.
+"""
+import argparse
+import base64
+import html
+import json
+import re
+import unicodedata
+from bisect import bisect_right
+from pathlib import Path
+
+from jsx_index import iter_babel_scripts, tokenize_script
+from lp_cache import content_hash
+from lp_io import add_dry_run_argument, atomic_write, dry_run_verb, set_dry_run, write_text
+from lp_scanner import LP_DIR, iter_html_files
+from tag_tree import RAW_TEXT_TAGS, iter_tokens
+
+INDEX_FILE = LP_DIR.parent / 'src' / 'data' / 'search-index.json'
+CACHE_FILE = LP_DIR.parent / '.lp_cache' / 'search.json'
+
+# Bump when extraction or weighting changes, to drop cached terms
+EXTRACTOR_VERSION = 1
+FORMAT_VERSION = 2
+
+# Terms per front-coding block; every block starts with a full term
+BLOCK_SIZE = 16
+FIELD_WEIGHTS = {'title': 8, 'heading': 3, 'text': 1}
+MAX_WEIGHT = 255
+MAX_TERM_LENGTH = 32
+
+_DIGITS = '0123456789abcdefghijklmnopqrstuvwxyz'
+
+HEADING_TAGS = {'h1', 'h2', 'h3', 'h4', 'h5', 'h6'}
+
+STOPWORDS = {
+    'ada', 'adalah', 'akan', 'anda', 'atau', 'bisa', 'dan', 'dari', 'dengan', 'di', 'dalam', 'ini',
+    'itu', 'juga', 'kami', 'ke', 'kita', 'lebih', 'pada', 'sudah', 'tidak', 'untuk', 'yang',
+    'an', 'and', 'are', 'for', 'in', 'is', 'of', 'on', 'our', 'the', 'to', 'we', 'with', 'you', 'your',
+}
+
+_TERM_RE = re.compile(r'[a-z0-9]+')
+_DESCRIPTION_RE = re.compile(r'<meta\s+name=["\']description["\']\s+content=["\']([^"\']*)["\']', re.IGNORECASE)
+_ENTITY_RE = re.compile(r'&(?:#\d+|#x[0-9a-fA-F]+|[A-Za-z]+);')
+# JS strings that are code rather than copy: URLs, paths, ids, class names and SVG path data
+_CODE_STRING_RE = re.compile(r'^[^\s]*[/#:_.=\\@$][^\s]*$|^(?:[\w-]*-[\w-]*\s*)+$|^[Mm][\d\s.,-][\sA-Za-z\d.,-]*$')
+_MARKUP_STRING_RE = re.compile(r'[<>{}]|=["\']')
+# Script code a tokenizer read as JSX text after unbalanced markup
+_CODE_TEXT_RE = re.compile(r'\)\s*;|=>|\bconst\s+\w+\s*=|["\']\s*/?>')
+
+
+def tokenize(text):
+    """Search terms of a text: accents folded, lowercased, stopwords dropped
+
+    src/data/search.js normalizes queries the same way.
+    """
+    folded = unicodedata.normalize('NFKD', text)
+    folded = ''.join(ch for ch in folded if not unicodedata.combining(ch)).lower()
+    return [
+        term[:MAX_TERM_LENGTH] for term in _TERM_RE.findall(folded)
+        if len(term) > 1 and term not in STOPWORDS and not (term.isdigit() and len(term) > 4)
+    ]
+
+def _add(weights, text, field):
+    weight = FIELD_WEIGHTS[field]
+    for term in tokenize(html.unescape(text)):
+        weights[term] = weights.get(term, 0) + weight
+
+def _html_text(content, weights):
+    """Title, heading and body text of the markup outside scripts"""
+    field = None
+    headings = 0
+    in_body = False
+    raw = False
+    last_end = 0
+    for token in iter_tokens(content):
+        if not raw and token.start > last_end:
+            text = content[last_end:token.start]
+            if field == 'title':
+                _add(weights, text, 'title')
+            elif in_body:
+                _add(weights, text, 'heading' if headings else 'text')
+        last_end = token.end
+        tag = token.tag.lower()
+        raw = token.kind == 'open' and tag in RAW_TEXT_TAGS and not token.self_closing
+        if token.kind == 'open':
+            if tag == 'title':
+                field = 'title'
+            elif tag == 'body':
+                in_body = True
+            elif tag in HEADING_TAGS:
+                headings += 1
+        elif token.kind == 'close':
+            if tag == 'title':
+                field = None
+            elif tag in HEADING_TAGS and headings:
+                headings -= 1
+
+    description = _DESCRIPTION_RE.search(content)
+    if description:
+        _add(weights, description.group(1), 'text')
+
+def _jsx_text(content, weights):
+    """JSX text and string-literal copy of every text/babel script"""
+    for _, start, end in iter_babel_scripts(content):
+        index = tokenize_script(content, start, end)
+        headings = sorted((e.start, e.end) for e in index.elements if e.tag.lower() in HEADING_TAGS)
+        heading_starts = [span[0] for span in headings]
+
+        def in_heading(pos):
+            i = bisect_right(heading_starts, pos) - 1
+            return i >= 0 and headings[i][1] > pos
+
+        for text_start, text_end in index.texts:
+            if not index.balanced and _CODE_TEXT_RE.search(content, text_start, text_end):
+                continue
+            _add(weights, content[text_start:text_end], 'heading' if in_heading(text_start) else 'text')
+
+        for string_start, string_end in index.strings:
+            quote = content[string_start]
+            before = content[max(start, string_start - 2):string_start].rstrip()
+            if quote == '/' or before.endswith('='):
+                # Regex literals and JSX attribute values
+                continue
+            value = content[string_start + 1:string_end - 1].strip()
+            if quote == '`':
+                value = re.sub(r'\$\{[^}]*\}', ' ', value)
+            if not value or _CODE_STRING_RE.match(value) or _MARKUP_STRING_RE.search(value) or _ENTITY_RE.fullmatch(value):
+                continue
+            _add(weights, value, 'heading' if in_heading(string_start) else 'text')
+
+def extract_terms(content):
+    """{term: weight} of one landing page"""
+    weights = {}
+    _html_text(content, weights)
+    _jsx_text(content, weights)
+    return {term: min(weight, MAX_WEIGHT) for term, weight in sorted(weights.items())}
+
+
+class TermCache:
+    """Extracted terms per page, keyed like lp_cache.ScanCache"""
+
+    def __init__(self, cache_file=CACHE_FILE):
+        self.cache_file = Path(cache_file)
+        self.entries = {}
+        self.hits = 0
+        self.misses = 0
+        self.dirty = False
+        self.load()
+
+    def load(self):
+        try:
+            with open(self.cache_file, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return
+        if data.get('version') != EXTRACTOR_VERSION:
+            self.dirty = True
+            return
+        self.entries = data.get('entries', {})
+
+    def terms(self, file_path):
+        """Terms of file_path, re-extracted only if it changed"""
+        file_path = Path(file_path)
+        key = str(file_path)
+        entry = self.entries.get(key)
+        stat = file_path.stat()
+        if entry and entry['size'] == stat.st_size and entry['mtime_ns'] == stat.st_mtime_ns:
+            self.hits += 1
+            return entry['terms']
+
+        with open(file_path, 'rb') as f:
+            data = f.read()
+        digest = content_hash(data)
+        if entry and entry['sha256'] == digest:
+            self.hits += 1
+            terms = entry['terms']
+        else:
+            self.misses += 1
+            terms = extract_terms(data.decode('utf-8'))
+        self.entries[key] = {'size': stat.st_size, 'mtime_ns': stat.st_mtime_ns, 'sha256': digest, 'terms': terms}
+        self.dirty = True
+        return terms
+
+    def prune(self, keep):
+        """Forget pages not in keep"""
+        keep = {str(path) for path in keep}
+        stale = [key for key in self.entries if key not in keep]
+        for key in stale:
+            del self.entries[key]
+        if stale:
+            self.dirty = True
+        return len(stale)
+
+    def save(self):
+        if not self.dirty:
+            return
+        self.cache_file.parent.mkdir(parents=True, exist_ok=True)
+        data = json.dumps({'version': EXTRACTOR_VERSION, 'entries': self.entries})
+        atomic_write(self.cache_file, data.encode('utf-8'))
+        self.dirty = False
+
+
+def _varint(value, out):
+    while value > 0x7f:
+        out.append(value & 0x7f | 0x80)
+        value >>= 7
+    out.append(value)
+
+def _shared_prefix(a, b):
+    n = min(len(a), len(b), len(_DIGITS) - 1)
+    i = 0
+    while i < n and a[i] == b[i]:
+        i += 1
+    return i
+
+def encode_index(docs, doc_terms):
+    """Index dict of docs (URLs) and their {term: weight} maps
+
+    Terms are sorted and front-coded in blocks of BLOCK_SIZE: the first
+    term of a block is stored in full, the others as one base-36 digit of
+    prefix length shared with the previous term plus the rest. Each term's
+    posting list is varint(count) followed by varint(doc gap),
+    varint(weight) pairs; "offsets" holds the byte offset of every block's
+    first posting list, and "term_length" the length terms were cut at, so
+    queries can be cut the same way.
+    """
+    postings = {}
+    for doc, terms in enumerate(doc_terms):
+        for term, weight in terms.items():
+            postings.setdefault(term, []).append((doc, weight))
+
+    entries = []
+    offsets = []
+    data = bytearray()
+    previous = ''
+    for i, term in enumerate(sorted(postings)):
+        if i % BLOCK_SIZE == 0:
+            entries.append(term)
+            offsets.append(len(data))
+        else:
+            shared = _shared_prefix(previous, term)
+            entries.append(_DIGITS[shared] + term[shared:])
+        previous = term
+
+        last = 0
+        _varint(len(postings[term]), data)
+        for doc, weight in postings[term]:
+            _varint(doc - last, data)
+            _varint(weight, data)
+            last = doc
+
+    return {
+        'version': FORMAT_VERSION,
+        'block': BLOCK_SIZE,
+        'term_length': MAX_TERM_LENGTH,
+        'docs': docs,
+        'stopwords': sorted(STOPWORDS),
+        'terms': '\n'.join(entries),
+        'offsets': offsets,
+        'postings': base64.b64encode(bytes(data)).decode('ascii'),
+    }
+
+def build_index(lp_dir=LP_DIR, cache=None):
+    """Index dict of every landing page in lp_dir"""
+    pages = iter_html_files(lp_dir)
+    cache = cache if cache is not None else TermCache()
+    doc_terms = [cache.terms(path) for path in pages]
+    cache.prune(pages)
+    return encode_index([f'/LP/{path.name}' for path in pages], doc_terms)
+
+def main(argv=None):
+    """Main function"""
+    parser = add_dry_run_argument(argparse.ArgumentParser(description='Build the SPA search index from LP/'))
+    parser.add_argument('--rebuild', action='store_true', help='ignore cached terms and re-read every page')
+    parser.add_argument('--out', default=str(INDEX_FILE), help=f'index file (default: {INDEX_FILE})')
+    args = parser.parse_args(argv)
+    set_dry_run(args.dry_run)
+
+    if not LP_DIR.exists():
+        print(f"❌ Directory not found: {LP_DIR}")
+        return
+
+    cache = TermCache()
+    if args.rebuild:
+        cache.entries = {}
+    index = build_index(LP_DIR, cache)
+    if not args.dry_run:
+        cache.save()
+
+    data = json.dumps(index, separators=(',', ':')) + '\n'
+    changed = write_text(Path(args.out), data)
+    terms = index['terms'].count('\n') + 1 if index['terms'] else 0
+    print(f"🔎 {len(index['docs'])} pages ({cache.hits} cached, {cache.misses} re-indexed), {terms} terms")
+    print(f"{'✅ ' + dry_run_verb('Wrote', 'Would write') if changed else '⏭️  Unchanged'} {args.out} ({len(data):,} bytes)")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,262 @@
+#!/usr/bin/env python3
+"""
+Section templates the fixers insert into landing pages, kept as one
+element tree per section and compiled to both HTML (class=, explicit end
+tags, repeated markup) and JSX (className=, camelCase SVG attributes,
+self-closing tags, .map() for repeats). Each dialect is compiled once into
+a format string; text and attribute values may reference per-page data
+(brand, accent colour, preview images), and every rendered variant is
+cached, so inserting a section into many pages reuses the same string.
+"""
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Dict, List, Union
+
+from responsive_images import rewrite_images
+
+DIALECTS = ('html', 'jsx')
+
+# Indentation of the section comment and tag in the page
+BASE_DEPTH = {'html': 1, 'jsx': 5}
+INDENT = '    '
+
+VOID_TAGS = {'img', 'br', 'hr', 'input'}
+
+# HTML attribute names that differ in JSX
+JSX_ATTRIBUTES = {
+    'class': 'className',
+    'for': 'htmlFor',
+    'fill-rule': 'fillRule',
+    'clip-rule': 'clipRule',
+    'stroke-linecap': 'strokeLinecap',
+    'stroke-linejoin': 'strokeLinejoin',
+    'stroke-width': 'strokeWidth',
+}
+
+DEFAULT_DATA = {
+    'brand': 'Kami',
+    'accent': 'blue',
+    'images': (
+        'https://images.unsplash.com/photo-1556742049-0cfed4f6a45d?q=80&w=800&auto=format&fit=crop',
+        'https://images.unsplash.com/photo-1556761175-5973dc0f32e7?q=80&w=800&auto=format&fit=crop',
+        'https://images.unsplash.com/photo-1556761175-b413da4baf72?q=80&w=800&auto=format&fit=crop',
+    ),
+}
+
+
+@dataclass
+class Node:
+    """Template element; text and attribute values are str.format templates over the page data"""
+    tag: str
+    attrs: Dict[str, str] = field(default_factory=dict)
+    children: List[Union['Node', 'Comment', str]] = field(default_factory=list)
+    # Render on one line, e.g. small icons
+    inline: bool = False
+    # Emit the element this many times (a .map() in JSX)
+    repeat: int = 1
+
+
+@dataclass
+class Comment:
+    text: str
+
+
+def h(tag, attrs=None, *children, inline=False, repeat=1):
+    return Node(tag, attrs or {}, list(children), inline, repeat)
+
+
+# Shared pieces
+STAR_ICON = h('svg', {'class': 'w-5 h-5 fill-current', 'fill': 'currentColor', 'viewBox': '0 0 20 20'},
+              h('path', {'d': 'M9.049 2.927c.3-.921 1.603-.921 1.902 0l1.07 3.292a1 1 0 00.95.69h3.462c.969 0 1.371 1.24.588 1.81l-2.8 2.034a1 1 0 00-.364 1.118l1.07 3.292c.3.921-.755 1.688-1.54 1.118l-2.8-2.034a1 1 0 00-1.175 0l-2.8 2.034c-.784.57-1.838-.197-1.539-1.118l1.07-3.292a1 1 0 00-.364-1.118L2.98 8.72c-.783-.57-.38-1.81.588-1.81h3.461a1 1 0 00.951-.69l1.07-3.292z'}),
+              inline=True, repeat=5)
+
+def check_icon(color_class):
+    attrs = {'class': f'w-5 h-5 {color_class}'.strip(), 'fill': 'currentColor', 'viewBox': '0 0 20 20'}
+    return h('svg', attrs,
+             h('path', {'fill-rule': 'evenodd', 'd': 'M16.707 5.293a1 1 0 010 1.414l-8 8a1 1 0 01-1.414 0l-4-4a1 1 0 011.414-1.414L8 12.586l7.293-7.293a1 1 0 011.414 0z', 'clip-rule': 'evenodd'}),
+             inline=True)
+
+def section_heading(title, subtitle):
+    return h('div', {'class': 'text-center mb-12'},
+             h('h2', {'class': 'text-3xl md:text-4xl font-bold text-gray-900 mb-4'}, title),
+             h('p', {'class': 'text-gray-600 text-lg max-w-2xl mx-auto'}, subtitle))
+
+def section(comment, section_id, section_class, title, subtitle, grid_class, *cards):
+    return [
+        Comment(comment),
+        h('section', {'id': section_id, 'class': section_class},
+          h('div', {'class': 'container mx-auto px-6'},
+            section_heading(title, subtitle),
+            h('div', {'class': grid_class}, *cards))),
+    ]
+
+def benefit_card(color, icon_path, title, text):
+    return h('div', {'class': 'p-6 rounded-xl bg-gray-50 hover:shadow-lg transition-all'},
+             h('div', {'class': f'w-12 h-12 bg-{color}-100 rounded-lg flex items-center justify-center mb-4'},
+               h('svg', {'class': f'w-6 h-6 text-{color}-600', 'fill': 'none', 'stroke': 'currentColor', 'viewBox': '0 0 24 24'},
+                 h('path', {'stroke-linecap': 'round', 'stroke-linejoin': 'round', 'stroke-width': '2', 'd': icon_path}))),
+             h('h3', {'class': 'text-xl font-bold text-gray-900 mb-2'}, title),
+             h('p', {'class': 'text-gray-600'}, text))
+
+def preview_card(index):
+    return h('div', {'class': 'rounded-xl overflow-hidden shadow-lg hover:shadow-xl transition-all'},
+             h('img', {'src': f'{{images[{index}]}}', 'alt': f'Preview {index + 1}',
+                       'class': 'w-full h-64 object-cover hover:scale-110 transition-transform duration-500'}))
+
+def testimonial_card(quote, initials, name):
+    return h('div', {'class': 'bg-gray-50 p-6 rounded-xl'},
+             h('div', {'class': 'flex text-yellow-400 mb-4'}, STAR_ICON),
+             h('p', {'class': 'text-gray-700 mb-4 italic'}, f'"{quote}"'),
+             h('div', {'class': 'flex items-center gap-3'},
+               h('div', {'class': 'w-10 h-10 bg-gray-300 rounded-full flex items-center justify-center font-bold text-gray-700'}, initials),
+               h('div', None,
+                 h('h5', {'class': 'font-bold text-gray-900'}, name),
+                 h('p', {'class': 'text-sm text-gray-600'}, 'Klien'))))
+
+def pricing_card(name, price, features, featured=False):
+    if featured:
+        card_class = 'bg-{accent}-600 text-white p-8 rounded-xl shadow-xl transform scale-105 relative'
+        title_class, price_class, text_class, icon_class = 'text-xl font-bold mb-4', 'text-3xl font-bold mb-6', None, ''
+        button_class = 'w-full bg-white text-{accent}-600 py-3 rounded-lg font-bold hover:bg-gray-100 transition-colors'
+    else:
+        card_class = 'bg-white p-8 rounded-xl shadow-lg'
+        title_class, price_class = 'text-xl font-bold text-gray-900 mb-4', 'text-3xl font-bold text-gray-900 mb-6'
+        text_class, icon_class = 'text-gray-600', 'text-green-500'
+        button_class = 'w-full bg-gray-200 text-gray-800 py-3 rounded-lg font-bold hover:bg-gray-300 transition-colors'
+    badge = [h('div', {'class': 'absolute top-0 right-0 bg-yellow-400 text-gray-900 px-3 py-1 rounded-bl-lg rounded-tr-xl text-xs font-bold'}, 'POPULER')] if featured else []
+    items = [
+        h('li', {'class': 'flex items-center gap-2'},
+          check_icon(icon_class),
+          h('span', {'class': text_class} if text_class else None, feature))
+        for feature in features
+    ]
+    return h('div', {'class': card_class},
+             *badge,
+             h('h3', {'class': title_class}, name),
+             h('div', {'class': price_class}, price),
+             h('ul', {'class': 'space-y-3 mb-8'}, *items),
+             h('button', {'class': button_class}, 'Pilih Paket'))
+
+
+SECTIONS = {
+    'benefit': section(
+        'Benefits Section', 'benefits', 'py-20 bg-white text-black',
+        'Keunggulan {brand}', 'Mengapa memilih layanan kami? Berikut keunggulan yang kami tawarkan.',
+        'grid md:grid-cols-3 gap-8',
+        benefit_card('blue', 'M5 13l4 4L19 7', 'Profesional',
+                     'Tim berpengalaman dan terpercaya dalam memberikan layanan terbaik.'),
+        benefit_card('green', 'M12 8v4l3 3m6-3a9 9 0 11-18 0 9 9 0 0118 0z', 'Cepat & Efisien',
+                     'Proses yang cepat tanpa mengorbankan kualitas hasil kerja.'),
+        benefit_card('purple', 'M9 12l2 2 4-4m5.618-4.016A11.955 11.955 0 0112 2.944a11.955 11.955 0 01-8.618 3.04A12.02 12.02 0 003 9c0 5.591 3.824 10.29 9 11.622 5.176-1.332 9-6.03 9-11.622 0-1.042-.133-2.052-.382-3.016z',
+                     'Terpercaya', 'Komitmen tinggi terhadap kepuasan dan kepercayaan pelanggan.'),
+    ),
+    'preview': section(
+        'Preview Section', 'preview', 'py-20 bg-gray-50',
+        'Galeri Karya {brand}', 'Lihat hasil kerja kami yang telah membantu banyak klien.',
+        'grid md:grid-cols-3 gap-6',
+        *(preview_card(i) for i in range(3)),
+    ),
+    'testimonials': section(
+        'Testimonials Section', 'testimonials', 'py-20 bg-white',
+        'Apa Kata Mereka', 'Testimoni dari klien yang telah menggunakan layanan kami.',
+        'grid md:grid-cols-3 gap-8',
+        testimonial_card('Layanan yang sangat memuaskan! Hasilnya sesuai ekspektasi dan prosesnya cepat.', 'AB', 'Ahmad Budi'),
+        testimonial_card('Sangat profesional dan detail. Saya sangat puas dengan hasilnya!', 'SD', 'Sari Dewi'),
+        testimonial_card('Pelayanan sangat baik dan hasilnya melebihi ekspektasi. Highly recommended!', 'RP', 'Rudi Pratama'),
+    ),
+    'pricing': section(
+        'Pricing Section', 'pricing', 'py-20 bg-gray-50',
+        'Paket & Harga', 'Pilih paket yang sesuai dengan kebutuhan Anda.',
+        'grid md:grid-cols-3 gap-8 max-w-5xl mx-auto',
+        pricing_card('Paket Basic', 'Rp 500.000', ['Fitur dasar', 'Support email']),
+        pricing_card('Paket Premium', 'Rp 1.000.000', ['Semua fitur Basic', 'Support prioritas', 'Update gratis'], featured=True),
+        pricing_card('Paket Enterprise', 'Rp 2.000.000', ['Semua fitur Premium', 'Custom development', 'Dedicated support']),
+    ),
+}
+
+
+def _literal(text):
+    """Markup the compiler adds, escaped for str.format"""
+    return text.replace('{', '{{').replace('}', '}}')
+
+def _attributes(attrs, dialect, extra=''):
+    parts = [extra] if extra else []
+    for name, value in attrs.items():
+        if dialect == 'jsx':
+            name = JSX_ATTRIBUTES.get(name, name)
+        parts.append(f'{name}="{value}"')
+    return ''.join(' ' + part for part in parts)
+
+def _inline(node, dialect, extra=''):
+    """One-line markup of a node"""
+    if isinstance(node, str):
+        return node
+    if isinstance(node, Comment):
+        return _literal(f'{{/* {node.text} */}}') if dialect == 'jsx' else f'<!-- {node.text} -->'
+    open_tag = f'<{node.tag}{_attributes(node.attrs, dialect, extra)}'
+    if node.tag in VOID_TAGS:
+        return open_tag + (' />' if dialect == 'jsx' else '>')
+    if not node.children and dialect == 'jsx':
+        return open_tag + ' />'
+    return open_tag + '>' + ''.join(_inline(child, dialect) for child in node.children) + f'</{node.tag}>'
+
+def _lines(node, dialect, depth, extra=''):
+    """Indented lines of a node, repeats included"""
+    pad = INDENT * depth
+    if isinstance(node, Node) and node.repeat > 1:
+        once = Node(node.tag, node.attrs, node.children, node.inline)
+        if dialect == 'html':
+            return _lines(once, dialect, depth) * node.repeat
+        return (
+            [pad + _literal(f'{{[...Array({node.repeat})].map((_, i) => (')]
+            + _lines(once, dialect, depth + 1, _literal('key={i}'))
+            + [pad + _literal('))}')]
+        )
+    if isinstance(node, (str, Comment)) or node.inline or node.tag in VOID_TAGS \
+            or all(isinstance(child, str) for child in node.children):
+        return [pad + _inline(node, dialect, extra)]
+    lines = [pad + f'<{node.tag}{_attributes(node.attrs, dialect, extra)}>']
+    for child in node.children:
+        lines.extend(_lines(child, dialect, depth + 1))
+    lines.append(pad + f'</{node.tag}>')
+    return lines
+
+@lru_cache(maxsize=None)
+def compile_section(name, dialect='html'):
+    """Format string of a section in one dialect, compiled once"""
+    if dialect not in DIALECTS:
+        raise ValueError(f'unknown dialect {dialect!r}')
+    depth = BASE_DEPTH[dialect]
+    lines = []
+    for node in SECTIONS[name]:
+        lines.extend(_lines(node, dialect, depth))
+    return '\n'.join(lines)
+
+def _escape(value, dialect):
+    """Page data made safe for text and attribute values; "&" is kept raw like in the templates"""
+    if isinstance(value, (list, tuple)):
+        return tuple(_escape(item, dialect) for item in value)
+    value = str(value).replace('<', '&lt;').replace('>', '&gt;').replace('"', '&quot;')
+    return value.replace('{', '&#123;').replace('}', '&#125;') if dialect == 'jsx' else value
+
+def _freeze(value):
+    return tuple(value) if isinstance(value, list) else value
+
+@lru_cache(maxsize=256)
+def _render(name, dialect, data):
+    values = {key: _escape(value, dialect) for key, value in data}
+    return rewrite_images(compile_section(name, dialect).format_map(values), jsx=dialect == 'jsx')
+
+def render_section(name, dialect='html', data=None):
+    """Markup of a section for one page; data overrides DEFAULT_DATA"""
+    merged = dict(DEFAULT_DATA)
+    if data:
+        merged.update(data)
+    return _render(name, dialect, tuple(sorted((key, _freeze(value)) for key, value in merged.items())))
+
+
+if __name__ == '__main__':
+    import sys
+    dialect = sys.argv[1] if len(sys.argv) > 1 else 'html'
+    for name in sys.argv[2:] or SECTIONS:
+        print(render_section(name, dialect))
@@ -4,12 +4,21 @@ import Footer from './components/Footer';
 import PortfolioGrid from './components/PortfolioGrid';
 import LoadingIndicator from './components/LoadingIndicator';
 import ProgressBar from './components/ProgressBar';
-import { portfolios } from './data/portfolios';
+import { loadFirstPage, loadPortfolios, portfolioCount } from './data/portfolios';
+import { loadSearchIndex, search } from './data/search';
 
 function App() {
   const [activeCategory, setActiveCategory] = useState('all');
   const [isLoading, setIsLoading] = useState(true);
   const [loadingProgress, setLoadingProgress] = useState(0);
+  const [portfolios, setPortfolios] = useState([]);
+  const [isLoadingPortfolios, setIsLoadingPortfolios] = useState(true);
+  const [searchQuery, setSearchQuery] = useState('');
+  const [searchScores, setSearchScores] = useState(null);
+  const [showAll, setShowAll] = useState(false);
+
+  // 'all' opens on its first page; the rest loads on request or once a search needs it
+  const firstPageOnly = activeCategory === 'all' && !showAll && !searchQuery.trim();
 
   // Simulate loading with progress
   useEffect(() => {
@@ -29,16 +38,60 @@ function App() {
     return () => clearInterval(interval);
   }, []);
 
-  // Filter portfolios based on active category
-  const filteredPortfolios = useMemo(() => {
-    if (activeCategory === 'all') {
+  // Fetch only the chunk of the active category
+  useEffect(() => {
+    let cancelled = false;
+    setIsLoadingPortfolios(true);
+    (firstPageOnly ? loadFirstPage() : loadPortfolios(activeCategory))
+      .then((entries) => {
+        if (!cancelled) setPortfolios(entries);
+      })
+      .catch(() => {
+        if (!cancelled) setPortfolios([]);
+      })
+      .finally(() => {
+        if (!cancelled) setIsLoadingPortfolios(false);
+      });
+
+    return () => {
+      cancelled = true;
+    };
+  }, [activeCategory, firstPageOnly]);
+
+  // Rank by the search index; null while there is no query
+  useEffect(() => {
+    if (!searchQuery.trim()) {
+      setSearchScores(null);
+      return undefined;
+    }
+    let cancelled = false;
+    loadSearchIndex()
+      .then((index) => {
+        if (!cancelled) {
+          setSearchScores(new Map(search(index, searchQuery).map((result) => [result.url, result.score])));
+        }
+      })
+      .catch(() => {
+        if (!cancelled) setSearchScores(null);
+      });
+
+    return () => {
+      cancelled = true;
+    };
+  }, [searchQuery]);
+
+  const visiblePortfolios = useMemo(() => {
+    if (!searchScores) {
       return portfolios;
     }
-    return portfolios.filter(p => p.category === activeCategory);
-  }, [activeCategory]);
+    return portfolios
+      .filter((p) => searchScores.has(p.url))
+      .sort((a, b) => searchScores.get(b.url) - searchScores.get(a.url));
+  }, [portfolios, searchScores]);
 
   const handleFilterChange = (category) => {
     setActiveCategory(category);
+    setPortfolios([]);
     // Smooth scroll to top
     window.scrollTo({ top: 0, behavior: 'smooth' });
   };
@@ -67,12 +120,17 @@ function App() {
         <Header
           activeCategory={activeCategory}
           onFilterChange={handleFilterChange}
-          portfolioCount={portfolios.length}
+          portfolioCount={portfolioCount}
+          searchQuery={searchQuery}
+          onSearchChange={setSearchQuery}
+          onSearchFocus={() => loadSearchIndex().catch(() => {})}
         />
         
         <PortfolioGrid
-          portfolios={filteredPortfolios}
-          isLoading={false}
+          portfolios={visiblePortfolios}
+          isLoading={isLoadingPortfolios && portfolios.length === 0}
+          remaining={firstPageOnly ? portfolioCount - portfolios.length : 0}
+          onShowMore={() => setShowAll(true)}
         />
         
         <Footer />
@@ -1,7 +1,8 @@
 import React from 'react';
 import CategoryFilter from './CategoryFilter';
+import SearchBox from './SearchBox';
 
-const Header = ({ activeCategory, onFilterChange, portfolioCount }) => {
+const Header = ({ activeCategory, onFilterChange, portfolioCount, searchQuery, onSearchChange, onSearchFocus }) => {
   return (
     <header className="container mx-auto px-6 py-12 text-center">
       <div className="animate-fade-in-down">
@@ -21,6 +22,7 @@ const Header = ({ activeCategory, onFilterChange, portfolioCount }) => {
         </div>
       </div>
       
+      <SearchBox value={searchQuery} onChange={onSearchChange} onFocus={onSearchFocus} />
       <CategoryFilter activeCategory={activeCategory} onFilterChange={onFilterChange} />
     </header>
   );
@@ -1,7 +1,7 @@
 import React from 'react';
 import PortfolioCard from './PortfolioCard';
 
-const PortfolioGrid = ({ portfolios, isLoading }) => {
+const PortfolioGrid = ({ portfolios, isLoading, remaining = 0, onShowMore }) => {
   if (isLoading) {
     return (
       <div className="container mx-auto px-6 pb-20">
@@ -61,6 +61,17 @@ const PortfolioGrid = ({ portfolios, isLoading }) => {
           <PortfolioCard key={portfolio.id} portfolio={portfolio} index={index} />
         ))}
       </div>
+      {remaining > 0 && (
+        <div className="mt-10 text-center">
+          <button
+            type="button"
+            onClick={onShowMore}
+            className="glass-card px-8 py-3 rounded-full text-purple-300 font-semibold hover:text-white transition-colors"
+          >
+            Tampilkan {remaining} portfolio lainnya
+          </button>
+        </div>
+      )}
     </main>
   );
 };
@@ -0,0 +1,29 @@
+import React from 'react';
+
+const SearchBox = ({ value, onChange, onFocus }) => {
+  return (
+    <div className="max-w-xl mx-auto mb-8 animate-fade-in-down">
+      <div className="relative">
+        <svg
+          className="absolute left-5 top-1/2 -translate-y-1/2 w-5 h-5 text-gray-400 pointer-events-none"
+          fill="none"
+          stroke="currentColor"
+          viewBox="0 0 24 24"
+        >
+          <path strokeLinecap="round" strokeLinejoin="round" strokeWidth={2} d="M21 21l-4.35-4.35M17 11a6 6 0 11-12 0 6 6 0 0112 0z" />
+        </svg>
+        <input
+          type="search"
+          value={value}
+          onChange={(event) => onChange(event.target.value)}
+          onFocus={onFocus}
+          placeholder="Cari portfolio, misalnya booking atau katalog..."
+          aria-label="Cari portfolio"
+          className="w-full pl-12 pr-6 py-3 rounded-full bg-white/10 text-white placeholder-gray-400 backdrop-blur-sm border border-white/10 focus:outline-none focus:ring-2 focus:ring-purple-500 transition-all duration-300"
+        />
+      </div>
+    </div>
+  );
+};
+
+export default SearchBox;
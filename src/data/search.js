@@ -0,0 +1,118 @@
+// Client side of search_index.py: loads ./search-index.json on first use and
+// answers prefix queries straight from its front-coded terms and varint postings.
+
+let indexPromise = null;
+
+// Decoded index, imported as its own chunk the first time it is needed
+export function loadSearchIndex() {
+  if (!indexPromise) {
+    indexPromise = import('./search-index.json')
+      .then((module) => decodeIndex(module.default))
+      .catch((error) => {
+        indexPromise = null;
+        throw error;
+      });
+  }
+  return indexPromise;
+}
+
+export function decodeIndex(data) {
+  const binary = atob(data.postings);
+  const bytes = new Uint8Array(binary.length);
+  for (let i = 0; i < binary.length; i++) {
+    bytes[i] = binary.charCodeAt(i);
+  }
+  const entries = data.terms ? data.terms.split('\n') : [];
+  return {
+    docs: data.docs,
+    block: data.block,
+    termLength: data.term_length,
+    entries,
+    firsts: entries.filter((_, i) => i % data.block === 0),
+    offsets: data.offsets,
+    stopwords: new Set(data.stopwords),
+    bytes,
+  };
+}
+
+// Same normalization as search_index.tokenize(), which cuts terms at termLength characters
+export function tokenize(text, stopwords = new Set(), termLength = 32) {
+  const words = text.normalize('NFKD').replace(/[\u0300-\u036f]/g, '').toLowerCase().match(/[a-z0-9]+/g) || [];
+  return words
+    .filter((word) => word.length > 1 && !stopwords.has(word) && !/^\d{5,}$/.test(word))
+    .map((word) => word.slice(0, termLength));
+}
+
+function readVarint(bytes, state) {
+  let value = 0;
+  let shift = 0;
+  let byte;
+  do {
+    byte = bytes[state.pos++];
+    value += (byte & 0x7f) * 2 ** shift;
+    shift += 7;
+  } while (byte & 0x80);
+  return value;
+}
+
+// Calls visit(term, [[doc, weight], ...]) for every indexed term starting with prefix
+function scanPrefix(index, prefix, visit) {
+  const { entries, firsts, offsets, block, bytes } = index;
+  // Last block whose first term sorts before the prefix
+  let lo = 0;
+  let hi = firsts.length - 1;
+  while (lo < hi) {
+    const mid = (lo + hi + 1) >> 1;
+    if (firsts[mid] < prefix) lo = mid;
+    else hi = mid - 1;
+  }
+
+  const state = { pos: offsets[lo] || 0 };
+  let term = '';
+  for (let i = lo * block; i < entries.length; i++) {
+    const entry = entries[i];
+    term = i % block === 0 ? entry : term.slice(0, parseInt(entry[0], 36)) + entry.slice(1);
+    if (term > prefix && !term.startsWith(prefix)) return;
+
+    const count = readVarint(bytes, state);
+    const matches = term.startsWith(prefix);
+    const postings = matches ? [] : null;
+    let doc = 0;
+    for (let j = 0; j < count; j++) {
+      doc += readVarint(bytes, state);
+      const weight = readVarint(bytes, state);
+      if (matches) postings.push([doc, weight]);
+    }
+    if (matches) visit(term, postings);
+  }
+}
+
+// Pages matching every word of the query as a prefix, best first: [{ url, score }]
+export function search(index, query) {
+  const words = tokenize(query, index.stopwords, index.termLength);
+  if (words.length === 0) return [];
+
+  let scores = null;
+  for (const word of words) {
+    const found = new Map();
+    scanPrefix(index, word, (term, postings) => {
+      // Whole-word hits rank above longer words sharing the prefix
+      const boost = term === word ? 2 : 1;
+      for (const [doc, weight] of postings) {
+        found.set(doc, (found.get(doc) || 0) + weight * boost);
+      }
+    });
+    if (scores !== null) {
+      for (const [doc, score] of found) {
+        if (scores.has(doc)) found.set(doc, score + scores.get(doc));
+        else found.delete(doc);
+      }
+    }
+    scores = found;
+    if (scores.size === 0) return [];
+  }
+
+  return [...scores]
+    .sort((a, b) => b[1] - a[1] || a[0] - b[0])
+    .map(([doc, score]) => ({ url: index.docs[doc], score }));
+}
@@ -0,0 +1,212 @@
+#!/usr/bin/env python3
+"""
+Build stage: move inline SVG icons repeated across pages into one sprite.
+Every <svg> of the markup and of text/babel JSX is fingerprinted by its
+viewBox and normalized shapes; icons used --min-uses times or more become
+<symbol>s of a fingerprinted sprite under assets/, and each page keeps its
+own <svg> (classes, size, fill and stroke) with a <use href> to the symbol
+in place of the shapes. Runs before prerendering, so the prerendered markup
+and the hydrating JSX reference the same symbols.
+"""
+import argparse
+import hashlib
+import html
+import re
+from pathlib import Path
+
+from edit_plan import EditPlan
+from jsx_index import iter_babel_scripts, tokenize_script
+from lp_build import add_dir_argument, write_asset, write_report
+from lp_executor import add_jobs_argument, print_task_output, run_tasks
+from lp_io import write_text
+from lp_scanner import iter_html_files
+from tag_tree import build_tree
+
+MIN_USES = 2
+
+# Elements a symbol may contain; anything else (text, <use>, gradients with ids) stays inline
+SHAPE_TAGS = {'path', 'circle', 'ellipse', 'line', 'polygon', 'polyline', 'rect', 'g'}
+# SVG attributes that are camelCase in SVG itself, not only in JSX
+_CAMEL_CASE_SVG = {'viewBox', 'pathLength', 'preserveAspectRatio'}
+# Page CSS doesn't reach into an external sprite, and ids/keys belong to the page
+_PAGE_ATTRIBUTES = {'class', 'className', 'style', 'id', 'key'}
+
+_CAMEL_RE = re.compile(r'(?<=[a-z])([A-Z])')
+_XML_ESCAPES = str.maketrans({'&': '&amp;', '<': '&lt;', '"': '&quot;'})
+
+SPRITE_TEMPLATE = '<svg xmlns="http://www.w3.org/2000/svg">\n{symbols}</svg>\n'
+
+
+def svg_attribute(name):
+    """SVG spelling of a JSX or HTML attribute name (strokeWidth -> stroke-width)"""
+    if name in _CAMEL_CASE_SVG:
+        return name
+    return _CAMEL_RE.sub(lambda m: '-' + m.group(1).lower(), name)
+
+def _shape_markup(element, content):
+    """Normalized SVG markup of a shape and its children, None if it isn't static"""
+    if element.tag not in SHAPE_TAGS or not element.closed:
+        return None
+    parts = []
+    for name, value in sorted(element.attrs.items(), key=lambda item: svg_attribute(item[0])):
+        if not isinstance(value, str) or value.startswith('{') or name in _PAGE_ATTRIBUTES:
+            return None
+        parts.append(f' {svg_attribute(name)}="{html.unescape(value).translate(_XML_ESCAPES)}"')
+    attributes = ''.join(parts)
+    if not element.children:
+        if element.inner(content).strip():
+            return None
+        return f'<{element.tag}{attributes}/>'
+    children = _children_markup(element, content)
+    return None if children is None else f'<{element.tag}{attributes}>{children}</{element.tag}>'
+
+def _children_markup(element, content):
+    """Normalized markup of an element's children, None if any isn't a static shape"""
+    inner_start = element.open_end
+    markup = []
+    for child in element.children:
+        if content[inner_start:child.start].strip():
+            return None
+        shape = _shape_markup(child, content)
+        if shape is None:
+            return None
+        markup.append(shape)
+        inner_start = child.end
+    inner_end = element.open_end + len(element.inner(content))
+    if content[inner_start:inner_end].strip():
+        return None
+    return ''.join(markup)
+
+def icon_key(element, content):
+    """(viewBox, normalized shapes) identity of an <svg>, None if it can't be shared"""
+    view_box = element.attrs.get('viewBox')
+    if not element.closed or not element.children or not isinstance(view_box, str):
+        return None
+    if '{' in element.inner(content):
+        # JSX expressions or comments between the shapes
+        return None
+    shapes = _children_markup(element, content)
+    return (' '.join(view_box.split()), shapes) if shapes else None
+
+def symbol_id(key):
+    """Stable symbol id of an icon, the same on every page and build"""
+    return 'i' + hashlib.sha256('\0'.join(key).encode('utf-8')).hexdigest()[:8]
+
+def _svg_elements(content):
+    """(element, jsx) of every outermost <svg>, in markup and in text/babel scripts"""
+    for element in build_tree(content).outermost(tags={'svg'}):
+        yield element, False
+    for _, start, end in iter_babel_scripts(content):
+        index = tokenize_script(content, start, end)
+        last_end = -1
+        for jsx_element in index.elements:
+            if jsx_element.tag != 'svg' or jsx_element.start < last_end:
+                continue
+            last_end = jsx_element.end
+            tree = build_tree(content, jsx_element.start, jsx_element.end)
+            if tree.elements:
+                yield tree.elements[0], True
+
+def page_icons(file_path):
+    """Shareable icons of a page as (inner_start, inner_end, jsx, key)"""
+    with open(file_path, 'r', encoding='utf-8') as f:
+        content = f.read()
+    icons = []
+    for element, jsx in _svg_elements(content):
+        key = icon_key(element, content)
+        if key:
+            inner_end = element.open_end + len(element.inner(content))
+            icons.append((element.open_end, inner_end, jsx, key))
+    return icons or None
+
+def plan_sprite(pages, min_uses=MIN_USES):
+    """{key: id} of icons to move into the sprite, in first-seen order"""
+    uses = {}
+    for icons in pages.values():
+        for _, _, _, key in icons:
+            uses[key] = uses.get(key, 0) + 1
+    shared = {}
+    for key, count in uses.items():
+        if count >= min_uses:
+            icon = symbol_id(key)
+            if icon in shared.values():
+                raise ValueError(f"symbol id collision: {icon}")
+            shared[key] = icon
+    return shared
+
+def render_sprite(shared):
+    """Sprite file with one <symbol> per shared icon"""
+    symbols = ''.join(
+        f'<symbol id="{icon}" viewBox="{view_box}">{shapes}</symbol>\n'
+        for (view_box, shapes), icon in shared.items()
+    )
+    return SPRITE_TEMPLATE.format(symbols=symbols)
+
+def use_page(content, icons, shared, href):
+    """Replace the shapes of shared icons with <use> references"""
+    plan = EditPlan()
+    for inner_start, inner_end, jsx, key in icons:
+        if key in shared:
+            use = f'<use href="{href}#{shared[key]}" />' if jsx else f'<use href="{href}#{shared[key]}"></use>'
+            plan.replace(inner_start, inner_end - inner_start, use)
+    return plan.apply(content)
+
+def main(argv=None):
+    """Main function"""
+    parser = add_jobs_argument(add_dir_argument(argparse.ArgumentParser(description='Move repeated inline SVG icons into a shared sprite')))
+    parser.add_argument('--min-uses', type=int, default=MIN_USES, help=f'times an icon must appear to be shared (default: {MIN_USES})')
+    args = parser.parse_args(argv)
+
+    pages_dir = Path(args.dir)
+    if not pages_dir.exists():
+        print(f"❌ Directory not found: {pages_dir} (run lp_build.py first)")
+        return
+
+    pages = {}
+    for task in run_tasks(page_icons, iter_html_files(pages_dir), args.jobs):
+        print_task_output(task)
+        if task.value:
+            pages[task.path] = task.value
+
+    shared = plan_sprite(pages, args.min_uses)
+    if not shared:
+        print("✨ No inline SVG icons shared by enough pages")
+        return
+    sprite = render_sprite(shared).encode('utf-8')
+    href = write_asset(pages_dir, 'sprite.svg', sprite)
+    print(f"✅ {href}: {len(shared)} symbols ({len(sprite):,} bytes)")
+
+    uses = {icon: 0 for icon in shared.values()}
+    report = []
+    for path, icons in pages.items():
+        moved = [icon for icon in icons if icon[3] in shared]
+        if not moved:
+            continue
+        for icon in moved:
+            uses[shared[icon[3]]] += 1
+        with open(path, 'r', encoding='utf-8') as f:
+            content = f.read()
+        new_content = use_page(content, moved, shared, href)
+        write_text(path, new_content)
+        report.append({
+            'file': path.name,
+            'icons': len(moved),
+            'bytes_saved': len(content.encode('utf-8')) - len(new_content.encode('utf-8')),
+        })
+
+    saved = sum(entry['bytes_saved'] for entry in report)
+    report_file = write_report('svg_sprites', {
+        'sprite': href,
+        'sprite_bytes': len(sprite),
+        'symbols': [
+            {'id': icon, 'viewBox': view_box, 'uses': uses[icon]}
+            for (view_box, _), icon in shared.items()
+        ],
+        'pages': report,
+        'bytes_saved': saved,
+    }, pages_dir)
+    print(f"\n✨ {sum(uses.values())} icons on {len(report)} pages now use the sprite, {saved:,} inline bytes saved")
+    print(f"📋 Report: {report_file}")
+
+if __name__ == '__main__':
+    main()
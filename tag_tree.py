@@ -0,0 +1,309 @@
+#!/usr/bin/env python3
+"""
+Streaming, linear-time tag tree builder for HTML and JSX markup.
+Understands both class= and className= elements and gives exact element
+spans for section removal, conversion and insertion, without the
+backtracking of ".*?</tag>" patterns.
+"""
+import re
+from dataclasses import dataclass, field
+from typing import Dict, Iterator, List, Optional, Tuple
+
+_MARKUP_RE = re.compile(r'<!--|\{/\*|</|<(?=[A-Za-z>])')
+_TAG_NAME_RE = re.compile(r'[A-Za-z][\w.:-]*')
+_CLOSING_TAG_RE = re.compile(r'</\s*([A-Za-z][\w.:-]*)?\s*>')
+_ATTR_NAME_RE = re.compile(r'[^\s=/>"\'{}]+')
+
+VOID_TAGS = {'area', 'base', 'br', 'col', 'embed', 'hr', 'img', 'input', 'link', 'meta', 'source', 'track', 'wbr'}
+RAW_TEXT_TAGS = {'script', 'style'}
+
+
+@dataclass
+class Token:
+    """One markup token; end is exclusive"""
+    kind: str  # 'open', 'close' or 'comment'
+    start: int
+    end: int
+    tag: str = ''
+    attrs: Dict[str, object] = field(default_factory=dict)
+    self_closing: bool = False
+
+
+@dataclass
+class Element:
+    """An element span in the source; end is exclusive"""
+    tag: str
+    start: int
+    open_end: int
+    end: int = -1
+    attrs: Dict[str, object] = field(default_factory=dict)
+    children: List['Element'] = field(default_factory=list, repr=False)
+    parent: Optional['Element'] = field(default=None, repr=False)
+    closed: bool = False
+    leading_comment: Optional[Tuple[int, int]] = None
+
+    @property
+    def classes(self):
+        """Class list from class= (HTML) or className= (JSX)"""
+        value = self.attrs.get('class', self.attrs.get('className'))
+        return value.split() if isinstance(value, str) else []
+
+    @property
+    def is_html(self):
+        """Element written with an HTML class= attribute"""
+        return 'class' in self.attrs
+
+    @property
+    def is_jsx(self):
+        return 'className' in self.attrs
+
+    def iter(self) -> Iterator['Element']:
+        """This element and its descendants in document order"""
+        stack = [self]
+        while stack:
+            element = stack.pop()
+            yield element
+            stack.extend(reversed(element.children))
+
+    def text(self, content):
+        return content[self.start:self.end]
+
+    def inner(self, content):
+        """Source between the opening and closing tag"""
+        if self.end == self.open_end:
+            return ''
+        close_start = content.rfind('</', self.open_end, self.end) if self.closed else self.end
+        return content[self.open_end:close_start]
+
+
+@dataclass
+class TagTree:
+    """Document root plus every element in document order"""
+    root: Element
+    elements: List[Element]
+    comments: List[Tuple[int, int]]
+    balanced: bool = True
+
+    def find(self, tags=None, predicate=None):
+        """Elements matching tag names and/or a predicate, in document order"""
+        tags = {tag.lower() for tag in tags} if tags else None
+        return [
+            element for element in self.elements
+            if (tags is None or element.tag.lower() in tags) and (predicate is None or predicate(element))
+        ]
+
+    def outermost(self, tags=None, predicate=None):
+        """Like find(), but skip matches nested inside an earlier match"""
+        result = []
+        last_end = -1
+        for element in self.find(tags, predicate):
+            if element.start >= last_end:
+                result.append(element)
+                last_end = element.end
+        return result
+
+
+def _skip_quoted(content, i, end):
+    quote = content[i]
+    j = content.find(quote, i + 1, end)
+    return end if j == -1 else j + 1
+
+def _skip_braces(content, i, end):
+    """Skip a balanced {...} expression starting at i"""
+    depth = 0
+    while i < end:
+        ch = content[i]
+        if ch in '"\'`':
+            i = _skip_quoted(content, i, end)
+            continue
+        if ch == '{':
+            depth += 1
+        elif ch == '}':
+            depth -= 1
+            if depth == 0:
+                return i + 1
+        i += 1
+    return end
+
+def _parse_attributes(content, i, end):
+    """Parse attributes from i; returns (attrs, offset after tag, self_closing)"""
+    attrs = {}
+    while i < end:
+        ch = content[i]
+        if ch.isspace():
+            i += 1
+        elif content.startswith('/>', i):
+            return attrs, i + 2, True
+        elif ch == '>':
+            return attrs, i + 1, False
+        elif ch == '{':
+            # JSX spread attribute {...props}
+            j = _skip_braces(content, i, end)
+            attrs[content[i:j]] = True
+            i = j
+        elif ch == '<':
+            # Unterminated tag, resync on the next one
+            return attrs, i, False
+        else:
+            m = _ATTR_NAME_RE.match(content, i)
+            if not m:
+                i += 1
+                continue
+            name = m.group(0)
+            i = m.end()
+            while i < end and content[i].isspace():
+                i += 1
+            value = True
+            if i < end and content[i] == '=':
+                i += 1
+                while i < end and content[i].isspace():
+                    i += 1
+                if i < end and content[i] in '"\'':
+                    j = _skip_quoted(content, i, end)
+                    value = content[i + 1:j - 1]
+                elif i < end and content[i] == '{':
+                    j = _skip_braces(content, i, end)
+                    value = content[i:j]
+                else:
+                    j = i
+                    while j < end and not content[j].isspace() and content[j] != '>':
+                        j += 1
+                    value = content[i:j]
+                i = j
+            attrs[name] = value
+    return attrs, end, False
+
+def iter_tokens(content, start=0, end=None) -> Iterator[Token]:
+    """Yield markup tokens in one forward pass"""
+    end = len(content) if end is None else end
+    i = start
+    while i < end:
+        m = _MARKUP_RE.search(content, i, end)
+        if not m:
+            return
+        j = m.start()
+        marker = m.group(0)
+        if marker == '<!--':
+            k = content.find('-->', j + 4, end)
+            k = end if k == -1 else k + 3
+            yield Token('comment', j, k)
+            i = k
+        elif marker == '{/*':
+            k = content.find('*/}', j + 3, end)
+            k = end if k == -1 else k + 3
+            yield Token('comment', j, k)
+            i = k
+        elif marker == '</':
+            closing = _CLOSING_TAG_RE.match(content, j)
+            if closing:
+                yield Token('close', j, closing.end(), tag=closing.group(1) or '')
+                i = closing.end()
+            else:
+                i = j + 2
+        else:
+            # "<>" is a JSX fragment, tracked as an element with an empty tag
+            name_match = _TAG_NAME_RE.match(content, j + 1)
+            name = name_match.group(0) if name_match else ''
+            attrs, k, self_closing = _parse_attributes(content, j + 1 + len(name), end)
+            yield Token('open', j, k, tag=name, attrs=attrs, self_closing=self_closing)
+            i = k
+            if name.lower() in RAW_TEXT_TAGS and not self_closing:
+                # Script/style bodies are not markup
+                close = re.compile(r'</%s\s*>' % name, re.IGNORECASE).search(content, k, end)
+                i = close.start() if close else end
+
+def build_tree(content, start=0, end=None):
+    """Build the element tree of content[start:end] in O(n)
+
+    Unclosed elements are closed when an ancestor closes; stray closing
+    tags are ignored. Open-tag counts per name keep the ancestor lookup
+    constant time, so the build stays linear in the input.
+    """
+    end = len(content) if end is None else end
+    root = Element(tag='', start=start, open_end=start, end=end, closed=True)
+    elements = []
+    comments = []
+    stack = [root]
+    open_counts = {}
+    balanced = True
+    last_comment = None
+
+    for token in iter_tokens(content, start, end):
+        if token.kind == 'comment':
+            comments.append((token.start, token.end))
+            last_comment = (token.start, token.end)
+            continue
+
+        if token.kind == 'open':
+            parent = stack[-1]
+            element = Element(
+                tag=token.tag, start=token.start, open_end=token.end,
+                attrs=token.attrs, parent=parent
+            )
+            if last_comment and not content[last_comment[1]:token.start].strip():
+                element.leading_comment = last_comment
+            parent.children.append(element)
+            elements.append(element)
+            if token.self_closing or token.tag.lower() in VOID_TAGS:
+                element.end = token.end
+                element.closed = True
+            else:
+                stack.append(element)
+                open_counts[token.tag] = open_counts.get(token.tag, 0) + 1
+        else:
+            if open_counts.get(token.tag, 0) == 0:
+                balanced = False
+            else:
+                while True:
+                    element = stack.pop()
+                    open_counts[element.tag] -= 1
+                    if element.tag == token.tag:
+                        element.end = token.end
+                        element.closed = True
+                        break
+                    # Left open: ends where the ancestor closes
+                    element.end = token.start
+                    balanced = False
+        last_comment = None
+
+    while len(stack) > 1:
+        element = stack.pop()
+        element.end = end
+        balanced = False
+
+    return TagTree(root=root, elements=elements, comments=comments, balanced=balanced)
+
+def html_section_spans(content, start=0, end=None, tags=('section', 'div'), tree=None):
+    """Spans of outermost HTML (class=) sections, with their leading comment
+
+    Each span starts at the "<!-- ... -->" comment right before the element,
+    or at the whitespace before it, matching what the old
+    (<!--...-->)?\\s*<(section|div)...</\\2> patterns removed. A JSX
+    {/* ... */} comment in front of the element stays outside the span.
+    """
+    if tree is None:
+        tree = build_tree(content, start, end)
+    spans = []
+    for element in tree.outermost(tags, lambda e: e.is_html):
+        if element.leading_comment and content.startswith('<!--', element.leading_comment[0]):
+            span_start = element.leading_comment[0]
+        else:
+            floor = spans[-1][1] if spans else tree.root.start
+            span_start = element.start
+            while span_start > floor and content[span_start - 1].isspace():
+                span_start -= 1
+        spans.append((span_start, element.end))
+    return spans
+
+
+if __name__ == '__main__':
+    import sys
+    from pathlib import Path
+
+    for name in sys.argv[1:]:
+        text = Path(name).read_text(encoding='utf-8')
+        tree = build_tree(text)
+        status = "✅" if tree.balanced else "⚠️"
+        html = sum(1 for e in tree.elements if e.is_html)
+        jsx = sum(1 for e in tree.elements if e.is_jsx)
+        print(f"{status} {Path(name).name}: {len(tree.elements)} elements ({html} class=, {jsx} className=)")
@@ -0,0 +1,30 @@
+// Generate purged Tailwind CSS for landing pages (used by build_tailwind.py).
+// Reads [{id, classes, config}] as JSON on stdin and writes {id: css} to stdout.
+// config is the source of an inline `tailwind.config = {...}` object or null.
+const path = require('path');
+const postcss = require(path.join(__dirname, 'node_modules', 'postcss'));
+const tailwindcss = require(path.join(__dirname, 'node_modules', 'tailwindcss'));
+
+const INPUT = '@tailwind base;\n@tailwind components;\n@tailwind utilities;\n';
+
+async function build(job) {
+  const config = job.config ? Function(`"use strict"; return (${job.config});`)() : {};
+  config.content = [{ raw: job.classes.join(' '), extension: 'html' }];
+  const result = await postcss([tailwindcss(config)]).process(INPUT, { from: undefined });
+  return result.css;
+}
+
+async function main() {
+  let input = '';
+  for await (const chunk of process.stdin) input += chunk;
+  const output = {};
+  for (const job of JSON.parse(input)) {
+    output[job.id] = await build(job);
+  }
+  process.stdout.write(JSON.stringify(output));
+}
+
+main().catch((error) => {
+  process.stderr.write(`${error.stack || error}\n`);
+  process.exit(1);
+});
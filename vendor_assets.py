@@ -0,0 +1,214 @@
+#!/usr/bin/env python3
+"""
+Build stage: serve CDN scripts and stylesheets from our own origin.
+Rewrites <script src> and <link rel="stylesheet" href> references to CDN
+hosts into content-hashed copies under assets/ with an integrity hash.
+Copies come from a local mirror (vendor/<host>/<path>) or, for npm CDNs,
+from a matching package in node_modules, so the build works offline.
+"""
+import argparse
+import base64
+import hashlib
+import json
+import re
+import urllib.request
+from pathlib import Path, PurePosixPath
+from urllib.parse import quote, urljoin, urlsplit
+
+from edit_plan import EditPlan
+from lp_build import add_dir_argument, write_asset, write_report
+from lp_executor import add_jobs_argument, print_task_output, run_tasks
+from lp_io import atomic_write, write_text
+from lp_scanner import LP_DIR, iter_html_files
+from tag_tree import iter_tokens
+
+MIRROR_DIR = LP_DIR.parent / 'vendor'
+NODE_MODULES = LP_DIR.parent / 'node_modules'
+
+# Google Fonts is left alone: its CSS depends on the browser's User-Agent
+VENDOR_HOSTS = {'unpkg.com', 'cdn.jsdelivr.net', 'cdnjs.cloudflare.com', 'cdn.tailwindcss.com'}
+NPM_HOSTS = {'unpkg.com': '', 'cdn.jsdelivr.net': '/npm'}
+
+_NPM_PATH_RE = re.compile(r'^/((?:@[^/@]+/)?[^/@]+)(?:@([^/]*))?(/.*)?$')
+_CSS_URL_RE = re.compile(r'url\(\s*(["\']?)([^"\')]+)\1\s*\)')
+_DROP_ATTR_RE = re.compile(r'\s+(?:integrity|crossorigin|referrerpolicy)(?:\s*=\s*(?:"[^"]*"|\'[^\']*\'|[^\s>]+))?', re.IGNORECASE)
+_URL_ATTR_RE = r'(\s{name}\s*=\s*)(["\']?)%s\2'
+
+
+def subresource_integrity(data):
+    """SRI value (sha384) for a file's bytes"""
+    return 'sha384-' + base64.b64encode(hashlib.sha384(data).digest()).decode('ascii')
+
+def asset_name(url, default_ext):
+    """Logical file name for a CDN URL, e.g. lucide@latest -> lucide.js"""
+    parts = urlsplit(url)
+    name = PurePosixPath(parts.path).name.split('@')[0] or parts.hostname.split('.')[-2]
+    return name if '.' in name else name + default_ext
+
+def mirror_path(url, mirror_dir=MIRROR_DIR, default_ext='.js'):
+    """Where a URL lives in the local mirror"""
+    parts = urlsplit(url)
+    path = parts.path.strip('/') or 'index' + default_ext
+    if parts.query:
+        path += quote('?' + parts.query, safe='')
+    return Path(mirror_dir) / parts.hostname / path
+
+def _npm_source(url):
+    """File in node_modules matching an unpkg/jsDelivr npm URL, or None
+
+    A version range counts as matching when the installed major version
+    agrees; "latest" and missing versions match any installed version.
+    """
+    parts = urlsplit(url)
+    prefix = NPM_HOSTS.get(parts.hostname)
+    if prefix is None or not parts.path.startswith(prefix + '/'):
+        return None
+    m = _NPM_PATH_RE.match(parts.path[len(prefix):])
+    if not m:
+        return None
+    package_dir = NODE_MODULES / m.group(1)
+    try:
+        with open(package_dir / 'package.json', encoding='utf-8') as f:
+            package = json.load(f)
+    except (OSError, ValueError):
+        return None
+    wanted = (m.group(2) or 'latest').lstrip('^~=v')
+    if wanted != 'latest' and wanted.split('.')[0] != str(package.get('version', '')).split('.')[0]:
+        return None
+    file_path = (m.group(3) or '').strip('/')
+    if not file_path:
+        entry = package.get('unpkg') or package.get('jsdelivr') or package.get('main') or 'index.js'
+        file_path = entry[2:] if entry.startswith('./') else entry
+    source = package_dir / file_path
+    return source if source.is_file() else None
+
+def fetch_to_mirror(url, target):
+    """Download a URL into the mirror"""
+    with urllib.request.urlopen(url, timeout=30) as response:
+        data = response.read()
+    target.parent.mkdir(parents=True, exist_ok=True)
+    atomic_write(target, data)
+    return data
+
+def read_source(url, mirror_dir=MIRROR_DIR, default_ext='.js', fetch=False):
+    """Bytes of a CDN file from the mirror, node_modules or (with fetch) the network"""
+    target = mirror_path(url, mirror_dir, default_ext)
+    if target.is_file():
+        return target.read_bytes()
+    source = _npm_source(url)
+    if source is not None:
+        return source.read_bytes()
+    if fetch:
+        print(f"⬇️  Fetching {url}")
+        return fetch_to_mirror(url, target)
+    raise FileNotFoundError(f"not in mirror: {target}")
+
+def vendor_stylesheet(pages_dir, url, data, mirror_dir=MIRROR_DIR, fetch=False):
+    """Vendor the fonts/images a stylesheet references and point it at them"""
+    text = data.decode('utf-8')
+
+    def replace(m):
+        ref = m.group(2).strip()
+        if ref.startswith(('data:', '#')):
+            return m.group(0)
+        ref_url = urljoin(url, ref)
+        asset = write_asset(pages_dir, asset_name(ref_url, ''), read_source(ref_url, mirror_dir, '', fetch))
+        # The stylesheet sits in assets/ as well
+        return f'url({PurePosixPath(asset).name})'
+
+    return _CSS_URL_RE.sub(replace, text).encode('utf-8')
+
+def vendor_url(pages_dir, url, kind, mirror_dir=MIRROR_DIR, fetch=False):
+    """Copy one CDN file into assets/; returns {href, integrity}"""
+    default_ext = '.css' if kind == 'link' else '.js'
+    data = read_source(url, mirror_dir, default_ext, fetch)
+    if kind == 'link':
+        data = vendor_stylesheet(pages_dir, url, data, mirror_dir, fetch)
+    href = write_asset(pages_dir, asset_name(url, default_ext), data)
+    return {'href': href, 'integrity': subresource_integrity(data), 'bytes': len(data)}
+
+def cdn_references(content):
+    """(kind, url, token) for CDN scripts and stylesheets in a page"""
+    for token in iter_tokens(content):
+        if token.kind != 'open':
+            continue
+        tag = token.tag.lower()
+        if tag == 'script':
+            url = token.attrs.get('src')
+        elif tag == 'link' and 'stylesheet' in str(token.attrs.get('rel', '')).lower().split():
+            url = token.attrs.get('href')
+        else:
+            continue
+        if isinstance(url, str) and urlsplit(url).hostname in VENDOR_HOSTS:
+            yield tag, url, token
+
+def collect_references(file_path):
+    """CDN references of one page as [(kind, url)]"""
+    with open(file_path, 'r', encoding='utf-8') as f:
+        content = f.read()
+    return [(kind, url) for kind, url, _ in cdn_references(content)]
+
+def rewrite_tag(tag_text, url, asset):
+    """Point a script/link tag at a vendored copy and set its integrity"""
+    tag_text = _DROP_ATTR_RE.sub('', tag_text)
+    attr = 'src' if tag_text[1:].lower().startswith('script') else 'href'
+    pattern = re.compile(_URL_ATTR_RE.format(name=attr) % re.escape(url), re.IGNORECASE)
+    tag_text = pattern.sub(lambda m: f'{m.group(1)}"{asset["href"]}"', tag_text, count=1)
+    close = len(tag_text) - 2 if tag_text.endswith('/>') else len(tag_text) - 1
+    return f'{tag_text[:close].rstrip()} integrity="{asset["integrity"]}"{tag_text[close:]}'
+
+def vendor_page(content, assets):
+    """Rewrite every vendored reference of a page"""
+    plan = EditPlan()
+    for _, url, token in cdn_references(content):
+        if url in assets:
+            plan.replace(token.start, token.end - token.start,
+                         rewrite_tag(content[token.start:token.end], url, assets[url]))
+    return plan.apply(content)
+
+def main(argv=None):
+    """Main function"""
+    parser = add_jobs_argument(add_dir_argument(argparse.ArgumentParser(description='Vendor CDN scripts and stylesheets as hashed local assets with SRI')))
+    parser.add_argument('--mirror', default=str(MIRROR_DIR), help=f'local CDN mirror, laid out as <host>/<path> (default: {MIRROR_DIR})')
+    parser.add_argument('--fetch', action='store_true', help='download files missing from the mirror into it')
+    args = parser.parse_args(argv)
+
+    pages_dir = Path(args.dir)
+    if not pages_dir.exists():
+        print(f"❌ Directory not found: {pages_dir} (run lp_build.py first)")
+        return
+
+    html_files = iter_html_files(pages_dir)
+    references = {}
+    for task in run_tasks(collect_references, html_files, args.jobs):
+        print_task_output(task)
+        for kind, url in task.value or []:
+            references.setdefault(url, [kind, 0])[1] += 1
+
+    assets = {}
+    missing = {}
+    for url, (kind, count) in references.items():
+        try:
+            assets[url] = vendor_url(pages_dir, url, kind, args.mirror, args.fetch)
+        except (OSError, ValueError) as e:
+            missing[url] = str(e)
+            print(f"⚠️  Keeping CDN for {url} ({count} pages): {e}")
+            continue
+        print(f"✅ {url} -> {assets[url]['href']} ({count} pages)")
+
+    updated = 0
+    for path in html_files:
+        with open(path, 'r', encoding='utf-8') as f:
+            content = f.read()
+        if write_text(path, vendor_page(content, assets)):
+            updated += 1
+
+    report_file = write_report('vendor_assets', {
+        'vendored': {url: {**asset, 'pages': references[url][1]} for url, asset in assets.items()},
+        'missing': missing,
+    }, pages_dir)
+    print(f"\n✨ Vendored {len(assets)}/{len(references)} CDN files in {updated} pages")
+    print(f"📋 Report: {report_file}")
+
+if __name__ == '__main__':
+    main()
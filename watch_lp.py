@@ -0,0 +1,241 @@
+#!/usr/bin/env python3
+"""
+Watch LP/ and re-audit only the landing pages that change.
+Uses inotify when available and falls back to polling, debounces bursts
+of saves, and keeps the analyze_landing_pages statistics up to date
+incrementally instead of rescanning the whole directory.
+"""
+import argparse
+import ctypes
+import ctypes.util
+import os
+import select
+import struct
+import time
+from collections import defaultdict
+
+from analyze_landing_pages import analysis_from_scan, print_summary, tally
+from check_broken_files import check_from_scan
+from lp_cache import ScanCache
+from lp_scanner import LP_DIR, iter_html_files
+
+# inotify(7) event masks
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_Q_OVERFLOW = 0x00004000
+WATCH_MASK = IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO | IN_CREATE | IN_DELETE
+
+_EVENT_HEADER = struct.Struct('iIII')
+
+# Returned instead of a set of names when changes were lost
+RESCAN_ALL = None
+
+
+def _is_page(name):
+    """Landing page names only, not editor or lp_io temp files"""
+    return name.endswith('.html') and not name.startswith('.')
+
+
+class InotifyWatcher:
+    """Directory watcher on top of Linux inotify via ctypes"""
+
+    def __init__(self, directory):
+        libc = ctypes.CDLL(ctypes.util.find_library('c') or 'libc.so.6', use_errno=True)
+        self.fd = libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if self.fd < 0:
+            raise OSError(ctypes.get_errno(), 'inotify_init1 failed')
+        if libc.inotify_add_watch(self.fd, os.fsencode(str(directory)), WATCH_MASK) < 0:
+            errno = ctypes.get_errno()
+            os.close(self.fd)
+            raise OSError(errno, f'inotify_add_watch failed for {directory}')
+
+    def read_changes(self, timeout):
+        """Names changed within timeout seconds (empty set if none)"""
+        ready, _, _ = select.select([self.fd], [], [], timeout)
+        if not ready:
+            return set()
+        try:
+            data = os.read(self.fd, 64 * 1024)
+        except BlockingIOError:
+            return set()
+        changed = set()
+        offset = 0
+        while offset + _EVENT_HEADER.size <= len(data):
+            _, mask, _, length = _EVENT_HEADER.unpack_from(data, offset)
+            offset += _EVENT_HEADER.size
+            name = data[offset:offset + length].rstrip(b'\0').decode('utf-8', 'replace')
+            offset += length
+            if mask & IN_Q_OVERFLOW:
+                return RESCAN_ALL
+            if _is_page(name):
+                changed.add(name)
+        return changed
+
+    def close(self):
+        os.close(self.fd)
+
+
+class PollingWatcher:
+    """Fallback watcher comparing size and mtime snapshots"""
+
+    def __init__(self, directory, interval=1.0):
+        self.directory = directory
+        self.interval = interval
+        self.snapshot = self._take_snapshot()
+
+    def _take_snapshot(self):
+        snapshot = {}
+        with os.scandir(self.directory) as entries:
+            for entry in entries:
+                if _is_page(entry.name):
+                    stat = entry.stat()
+                    snapshot[entry.name] = (stat.st_size, stat.st_mtime_ns)
+        return snapshot
+
+    def read_changes(self, timeout):
+        """Names changed since the last call, waiting at most timeout seconds"""
+        time.sleep(min(timeout, self.interval))
+        current = self._take_snapshot()
+        changed = {name for name in current.keys() | self.snapshot.keys()
+                   if current.get(name) != self.snapshot.get(name)}
+        self.snapshot = current
+        return changed
+
+    def close(self):
+        pass
+
+
+def create_watcher(directory, poll=False, interval=1.0):
+    """inotify watcher, or a polling one if inotify is unavailable"""
+    if not poll:
+        try:
+            return InotifyWatcher(directory)
+        except (OSError, AttributeError) as e:
+            print(f"⚠️  inotify unavailable ({e}), falling back to polling")
+    return PollingWatcher(directory, interval)
+
+
+class LiveStats:
+    """Section statistics kept current one page at a time"""
+
+    def __init__(self):
+        self.results = {}
+        self.broken = {}
+        self.section_stats = defaultdict(int)
+        self.missing_stats = defaultdict(int)
+
+    def update(self, scan_result):
+        """Replace the analysis of one page"""
+        self.remove(scan_result.file)
+        analysis = analysis_from_scan(scan_result)
+        self.results[scan_result.file] = analysis
+        tally(analysis, self.section_stats, self.missing_stats)
+        check = check_from_scan(scan_result)
+        if check['broken']:
+            self.broken[scan_result.file] = check
+        return analysis, check
+
+    def remove(self, filename):
+        old = self.results.pop(filename, None)
+        if old is not None:
+            tally(old, self.section_stats, self.missing_stats, delta=-1)
+        self.broken.pop(filename, None)
+
+    def print_summary(self):
+        results = [self.results[name] for name in sorted(self.results)]
+        print_summary(results, self.section_stats, self.missing_stats, len(results))
+
+    def status_line(self):
+        total = len(self.results)
+        complete = sum(1 for r in self.results.values() if r.get('complete', False))
+        return f"📊 {total} files: {complete} complete, {total - complete} incomplete, {len(self.broken)} broken"
+
+
+def collect_changes(watcher, debounce):
+    """Block until something changes, then gather the burst of saves"""
+    changed = set()
+    while not changed:
+        changed = watcher.read_changes(1.0)
+        if changed is RESCAN_ALL:
+            return RESCAN_ALL
+    deadline = time.monotonic() + debounce
+    while True:
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return changed
+        more = watcher.read_changes(remaining)
+        if more is RESCAN_ALL:
+            return RESCAN_ALL
+        if more:
+            changed |= more
+            deadline = time.monotonic() + debounce
+
+def audit_changes(lp_dir, names, cache, stats):
+    """Re-run the detectors for changed pages and print what they found"""
+    for name in sorted(names):
+        path = lp_dir / name
+        if not path.exists():
+            stats.remove(name)
+            print(f"🗑️  {name} removed")
+            continue
+        analysis, check = stats.update(cache.scan(path))
+        if check['broken']:
+            print(f"❌ {name}")
+            if 'error' in check:
+                print(f"   Error: {check['error']}")
+            for issue in check.get('issues', []):
+                print(f"   - {issue}")
+        elif analysis['complete']:
+            print(f"✅ {name}: complete")
+        else:
+            print(f"⚠️  {name}: missing {', '.join(analysis['missing'])}")
+    cache.save()
+
+def main(argv=None):
+    """Main function"""
+    parser = argparse.ArgumentParser(description='Watch landing pages and re-audit the ones that change')
+    parser.add_argument('--poll', action='store_true', help='use polling instead of inotify')
+    parser.add_argument('--interval', type=float, default=1.0, help='polling interval in seconds (default: 1.0)')
+    parser.add_argument('--debounce', type=float, default=0.3, help='seconds of quiet before re-auditing (default: 0.3)')
+    parser.add_argument('--full', action='store_true', help='print the full summary after every change')
+    args = parser.parse_args(argv)
+
+    lp_dir = LP_DIR
+
+    if not lp_dir.exists():
+        print(f"❌ Directory not found: {lp_dir}")
+        return
+
+    cache = ScanCache()
+    stats = LiveStats()
+    for html_file in iter_html_files(lp_dir):
+        stats.update(cache.scan(html_file))
+    cache.prune()
+    cache.save()
+
+    stats.print_summary()
+    print(f"\n{stats.status_line()}")
+
+    watcher = create_watcher(lp_dir, args.poll, args.interval)
+    print(f"👀 Watching {lp_dir} ({type(watcher).__name__}), Ctrl+C to stop\n")
+
+    try:
+        while True:
+            changed = collect_changes(watcher, args.debounce)
+            if changed is RESCAN_ALL:
+                print("⚠️  Event queue overflowed, re-auditing every file")
+                changed = {path.name for path in iter_html_files(lp_dir)} | set(stats.results)
+            audit_changes(lp_dir, changed, cache, stats)
+            if args.full:
+                stats.print_summary()
+            print(f"{stats.status_line()}\n")
+    except KeyboardInterrupt:
+        print("\n👋 Stopped watching")
+    finally:
+        watcher.close()
+
+if __name__ == '__main__':
+    main()